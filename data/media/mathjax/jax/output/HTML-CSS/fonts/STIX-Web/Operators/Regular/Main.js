@@ -0,0 +1,19 @@
+/*
+ *  /MathJax-v2/jax/output/HTML-CSS/fonts/STIX-Web/Operators/Regular/Main.js
+ *
+ *  Copyright (c) 2009-2018 The MathJax Consortium
+ *
+ *  Licensed under the Apache License, Version 2.0 (the "License");
+ *  you may not use this file except in compliance with the License.
+ *  You may obtain a copy of the License at
+ *
+ *      http://www.apache.org/licenses/LICENSE-2.0
+ *
+ *  Unless required by applicable law or agreed to in writing, software
+ *  distributed under the License is distributed on an "AS IS" BASIS,
+ *  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ *  See the License for the specific language governing permissions and
+ *  limitations under the License.
+ */
+
+MathJax.OutputJax["HTML-CSS"].FONTDATA.FONTS.STIXMathJax_Operators={directory:"Operators/Regular",family:"STIXMathJax_Operators",testString:"\u00A0\u2206\u220A\u220C\u220E\u220F\u2210\u2211\u221B\u221C\u221F\u222C\u222D\u222E\u222F",32:[0,0,250,0,0],160:[0,0,250,0,0],8710:[674,0,731,63,665],8714:[459,-45,486,64,422],8716:[662,157,685,60,625],8718:[640,0,545,60,485],8719:[763,259,1000,52,948],8720:[763,259,1000,52,948],8721:[763,259,914,58,856],8731:[973,259,928,112,963],8732:[973,259,928,112,963],8735:[584,0,685,50,634],8748:[824,320,701,32,881],8749:[824,320,943,32,1123],8750:[824,320,499,32,639],8751:[824,320,741,32,881],8752:[824,320,982,32,1122],8753:[824,320,499,32,639],8754:[824,320,499,32,639],8755:[824,320,499,32,639],8758:[521,13,511,192,319],8759:[521,13,685,82,602],8760:[511,-220,685,48,637],8761:[511,5,685,48,637],8762:[511,5,685,48,637],8763:[521,13,685,48,637],8766:[413,-90,685,48,637],8767:[467,-39,685,49,637],8772:[519,35,685,48,637],8775:[647,202,685,48,637],8777:[549,49,685,48,637],8779:[532,26,685,48,638],8780:[532,27,685,48,637],8788:[417,-89,824,48,776],8789:[417,-89,824,48,776],8792:[729,-120,685,48,637],8793:[853,-120,685,48,637],8794:[853,-120,685,48,637],8795:[756,-120,685,48,637],8797:[823,-120,685,7,678],8798:[703,-120,685,48,637],8799:[863,-120,685,48,637],8802:[662,156,685,48,637],8803:[544,38,685,48,637],8813:[572,66,685,48,637],8820:[731,228,685,48,637],8821:[730,229,685,48,637],8824:[750,250,685,48,637],8825:[750,250,685,48,637],8836:[662,156,685,65,623],8837:[662,156,685,65,623],8844:[536,31,620,48,572],8845:[536,31,620,48,572],8860:[623,119,842,50,792],8870:[662,0,497,64,433],8871:[662,0,498,64,434],8875:[662,0,860,57,814],8880:[551,45,685,64,621],8881:[551,45,685,64,621],8886:[403,-103,1145,50,1095],8887:[403,-103,1145,50,1095],8889:[547,41,685,48,636],8893:[646,29,620,32,590],8894:[584,0,685,50,634],8895:[662,158,911,45,865],8896:[763,259,924,54,870],8897:[763,259,924,54,870],8898:[778,254,924,94,830],8899:[768,264,924,94,830],8903:[545,38,685,51,634],8917:[690,189,685,48,637],8924:[607,103,685,64,621],8925:[607,103,685,64,621],8930:[730,229,685,65,622],8931:[730,229,685,65,622],8932:[627,216,685,64,621],8933:[627,216,685,64,621],8944:[520,18,926,194,732],8946:[531,27,823,55,763],8947:[531,27,685,60,625],8948:[459,-45,486,62,420],8949:[716,27,685,60,625],8950:[685,27,685,60,625],8951:[613,-45,486,62,420],8952:[532,180,685,60,625],8953:[531,27,685,61,625],8954:[531,27,823,55,763],8955:[531,27,685,59,624],8956:[459,-45,486,62,420],8957:[685,27,685,61,626],8958:[613,-45,486,67,425],8959:[662,158,910,45,865],10752:[763,259,1126,53,1073],10753:[763,259,1126,53,1073],10754:[763,259,1126,53,1073],10755:[768,264,924,94,830],10756:[768,264,924,94,830],10757:[763,259,924,94,830],10758:[763,259,924,94,830],10759:[763,259,1180,83,1097],10760:[763,259,1180,83,1097],10761:[763,259,1021,50,971],10762:[763,259,914,58,856],10763:[824,320,690,33,659],10764:[824,320,1184,32,1364],10765:[824,320,499,32,639],10766:[824,320,499,32,639],10767:[824,320,499,32,639],10768:[824,320,499,32,639],10769:[824,320,499,32,639],10770:[824,320,519,32,639],10771:[824,320,499,32,639],10772:[824,320,628,32,688],10773:[824,320,499,32,639],10774:[824,320,529,32,639],10775:[824,320,738,32,818],10776:[824,320,539,32,639],10777:[824,320,559,32,639],10778:[824,320,559,32,639],10779:[947,320,459,32,639],10780:[824,443,459,32,639],10781:[770,252,1270,93,1177],10782:[764,258,1018,45,924],10783:[566,291,503,110,410],10784:[633,127,1177,98,1079],10785:[805,300,547,215,472],10786:[819,41,685,48,636],10787:[707,41,685,48,636],10788:[704,41,685,48,636],10789:[547,235,685,48,636],10790:[547,198,685,48,636],10791:[547,210,685,41,673],10792:[547,41,685,48,636],10793:[556,-220,685,48,637],10794:[286,5,685,48,637],10795:[511,5,685,48,637],10796:[511,5,685,48,637],10797:[623,119,724,50,674],10798:[623,119,724,50,674],10799:[447,-59,490,50,439],10800:[686,25,640,43,597],10801:[529,130,640,43,597],10802:[529,45,640,43,597],10803:[538,32,685,57,627],10804:[623,119,674,50,624],10805:[623,119,674,50,624],10806:[810,119,842,50,792],10807:[752,248,1100,50,1050],10808:[623,119,842,50,792],10809:[811,127,1145,35,1110],10810:[811,127,1145,35,1110],10811:[811,127,1145,35,1110],10812:[393,-115,600,48,552],10813:[393,-115,600,48,552],10814:[488,170,300,60,230],10816:[536,31,620,48,572],10817:[536,31,620,48,572],10818:[668,31,620,48,572],10819:[668,31,620,48,572],10820:[536,31,620,48,572],10821:[536,31,620,48,572],10822:[914,406,620,48,572],10823:[914,406,620,48,572],10824:[914,406,620,48,572],10825:[914,406,620,48,572],10826:[528,39,1078,48,1030],10827:[527,40,1078,48,1030],10828:[602,31,620,10,610],10829:[536,97,620,10,610],10830:[536,31,620,48,572],10831:[536,31,620,48,572],10832:[602,31,620,10,610],10833:[710,29,620,31,589],10834:[710,29,620,31,589],10835:[536,29,620,31,589],10836:[536,29,620,31,589],10837:[536,29,780,32,748],10838:[536,29,780,32,748],10839:[536,29,706,106,683],10840:[536,29,706,23,600],10841:[585,77,620,31,589],10842:[536,29,620,31,589],10843:[536,29,620,31,589],10844:[536,29,620,31,589],10845:[536,29,620,31,589],10847:[536,139,620,30,590],10848:[536,289,620,30,590],10849:[479,0,620,45,575],10850:[806,29,620,30,590],10851:[536,289,620,30,590],10852:[791,284,1043,70,1008],10853:[791,284,1043,70,1008],10854:[386,105,685,48,637],10855:[703,-28,685,48,637],10856:[695,189,685,48,637],10857:[662,156,685,48,637],10858:[521,-148,685,48,637],10859:[521,13,685,48,637],10860:[543,38,685,48,637],10861:[703,27,685,48,637],10862:[847,-120,685,48,637],10863:[707,-25,685,48,637],10864:[650,146,685,48,637],10865:[648,141,685,48,637],10866:[648,141,685,48,637],10867:[532,27,685,48,637],10868:[417,-89,1015,48,967],10869:[386,-120,997,48,949],10870:[386,-120,1436,48,1388],10871:[611,106,685,48,637],10872:[703,-28,685,38,647],10873:[532,26,685,44,609],10874:[532,26,685,76,641],10875:[806,26,685,44,609],10876:[806,26,685,76,641],10879:[625,137,685,60,625],10880:[625,137,685,60,625],10881:[625,137,685,60,625],10882:[625,137,685,60,625],10883:[777,137,685,60,625],10884:[777,137,685,60,625],10893:[746,176,685,48,637],10894:[746,176,685,48,637],10895:[867,361,685,60,649],10896:[867,361,685,60,649],10897:[844,338,685,55,630],10898:[844,338,685,55,630],10899:[866,361,685,60,625],10900:[866,361,685,60,625],10903:[640,122,685,56,621],10904:[640,122,685,56,621],10905:[718,211,685,60,625],10906:[718,211,685,60,625],10907:[726,220,685,60,625],10908:[726,220,685,60,625],10909:[664,164,685,53,642],10910:[664,164,685,43,632],10911:[774,267,685,48,637],10912:[774,267,685,48,637],10913:[532,26,685,44,609],10914:[532,26,685,76,641],10915:[609,103,933,25,908],10916:[532,26,782,60,722],10917:[532,26,855,60,795],10918:[532,26,685,35,625],10919:[532,26,685,60,650],10920:[625,137,685,50,640],10921:[626,137,685,45,635],10922:[537,31,685,45,609],10923:[537,31,685,76,640],10924:[613,103,685,60,625],10925:[613,103,685,60,625],10926:[563,-28,685,48,637],10929:[628,216,685,60,625],10930:[628,216,685,60,625],10931:[717,211,685,60,625],10932:[717,211,685,60,625],10939:[532,26,933,25,908],10940:[532,26,933,25,908],10941:[532,26,685,60,625],10942:[532,26,685,60,625],10943:[607,103,685,60,625],10944:[607,103,685,60,625],10945:[607,103,685,60,625],10946:[607,103,685,60,625],10947:[709,103,685,60,625],10948:[709,103,685,60,625],10951:[665,164,685,60,625],10952:[665,164,685,60,625],10953:[746,274,685,60,625],10954:[746,274,685,60,625],10957:[558,53,1352,64,1288],10958:[558,53,1352,64,1288],10959:[532,26,685,50,615],10960:[532,26,685,70,635],10961:[609,103,685,60,626],10962:[609,103,685,60,625],10963:[715,209,685,60,625],10964:[715,209,685,60,625],10965:[715,209,685,60,625],10966:[715,209,685,60,625],10967:[532,26,1250,60,1190],10968:[532,26,1250,60,1190],10969:[536,31,620,48,572],10970:[697,128,620,48,572],10971:[695,97,620,48,572],10972:[557,10,620,11,572],10973:[557,10,620,48,572],10974:[662,0,497,64,433],10975:[371,0,685,48,637],10976:[371,0,685,48,637],10977:[662,0,685,48,637],10978:[662,0,685,60,625],10979:[662,0,860,46,803],10980:[662,0,685,60,625],10981:[662,0,860,46,803],10982:[662,0,685,57,626],10983:[571,0,685,48,637],10984:[571,0,685,48,637],10985:[691,185,685,48,637],10986:[662,0,685,48,637],10987:[662,0,685,48,637],10988:[489,-18,600,48,552],10989:[489,-18,600,48,552],10990:[690,189,404,23,381],10991:[660,154,502,101,401],10992:[660,154,502,101,401],10993:[693,187,502,101,401],10994:[695,189,523,10,513],10995:[695,189,685,48,637],10996:[695,189,685,131,555],10997:[695,189,685,12,674],10998:[608,102,685,279,406],10999:[661,155,1170,58,1080],11000:[661,155,1170,90,1112],11001:[726,220,685,60,625],11002:[726,220,685,60,625],11003:[710,222,894,46,848],11004:[763,259,654,94,560],11005:[710,222,709,46,663],11006:[690,189,410,100,310],11007:[763,259,478,94,384],57348:[450,-59,926,55,871],57349:[530,-57,926,55,871],57354:[538,-55,685,48,637],57355:[543,37,685,48,637],57358:[846,340,685,60,626],57359:[730,229,685,56,621],57360:[730,229,685,56,621],57361:[846,340,685,61,626],57366:[818,311,685,53,618],57368:[818,311,685,67,632],57374:[607,110,685,48,638],57379:[695,189,685,48,637],57381:[724,236,685,48,637],57382:[662,156,685,47,612],57383:[662,156,685,73,638],57384:[663,155,933,25,908],57385:[662,156,933,25,908],57386:[662,156,1240,43,1184],57387:[662,156,1240,56,1197],57397:[602,98,486,64,422],57399:[662,156,685,48,637],57400:[690,189,732,50,682],57401:[662,156,685,47,636],57402:[811,156,471,40,525],57403:[736,156,685,60,625],57404:[662,156,685,60,625],57405:[602,98,486,64,422],57408:[415,-92,685,48,637],57411:[818,311,685,60,625],57412:[818,311,685,60,625],57413:[818,311,685,60,625],57414:[818,311,685,60,625],57419:[745,242,685,60,625],57420:[845,341,685,60,625],57421:[534,19,685,48,637],57422:[845,341,685,60,625],57423:[745,242,685,60,625],57424:[662,156,685,65,620],57425:[662,156,685,65,620],57426:[561,55,685,48,637],57433:[730,224,685,48,637],57434:[730,224,685,48,637],57435:[561,-30,685,48,637],57436:[534,19,685,48,637],57451:[602,98,486,64,422],57452:[602,98,486,64,422],57453:[785,157,685,60,625],57454:[785,157,685,60,625],57455:[785,129,685,60,625],57456:[785,129,685,60,625],57461:[626,119,685,48,637],57462:[626,119,685,48,637],57463:[725,236,685,48,637],57468:[758,252,685,48,637],57469:[758,252,685,48,637],57470:[732,227,685,56,621],57471:[732,227,685,56,621],57472:[818,311,685,57,622],57473:[818,311,685,57,622],57474:[730,229,685,56,621],57475:[730,229,685,56,621],57476:[709,201,685,56,621],57477:[709,201,685,56,621],57478:[818,311,685,56,621],57479:[818,311,685,55,621],57480:[818,311,685,56,621],57481:[818,311,685,55,620],57490:[719,296,685,62,627],57491:[719,296,685,61,626],57492:[719,240,685,62,627],57493:[719,240,685,61,626],57494:[818,311,685,55,620],57495:[818,311,685,65,630],57496:[690,189,685,23,662],57531:[622,101,685,48,637],57580:[862,-120,685,48,637],57609:[781,279,327,10,286],57610:[781,279,250,41,178],57676:[660,158,857,48,777],57677:[660,158,857,80,809],57678:[661,157,685,44,609],57679:[661,157,685,76,641],57998:[622,101,685,48,637],58002:[662,0,1388,38,1350],58003:[763,260,1797,58,1739],58306:[662,156,685,48,637],58307:[627,135,685,48,637],58308:[627,135,685,48,637]};MathJax.Callback.Queue(["initFont",MathJax.OutputJax["HTML-CSS"],"STIXMathJax_Operators"],["loadComplete",MathJax.Ajax,MathJax.OutputJax["HTML-CSS"].fontDir+"/Operators/Regular/Main.js"]);
@@ -0,0 +1,19 @@
+/*
+ *  /MathJax-v2/jax/output/HTML-CSS/fonts/STIX-Web/SansSerif/Bold/Main.js
+ *
+ *  Copyright (c) 2009-2018 The MathJax Consortium
+ *
+ *  Licensed under the Apache License, Version 2.0 (the "License");
+ *  you may not use this file except in compliance with the License.
+ *  You may obtain a copy of the License at
+ *
+ *      http://www.apache.org/licenses/LICENSE-2.0
+ *
+ *  Unless required by applicable law or agreed to in writing, software
+ *  distributed under the License is distributed on an "AS IS" BASIS,
+ *  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ *  See the License for the specific language governing permissions and
+ *  limitations under the License.
+ */
+
+MathJax.OutputJax["HTML-CSS"].FONTDATA.FONTS["STIXMathJax_SansSerif-bold"]={directory:"SansSerif/Bold",family:"STIXMathJax_SansSerif",weight:"bold",testString:"\u00A0\uD835\uDDD4\uD835\uDDD5\uD835\uDDD6\uD835\uDDD7\uD835\uDDD8\uD835\uDDD9\uD835\uDDDA\uD835\uDDDB\uD835\uDDDC\uD835\uDDDD\uD835\uDDDE\uD835\uDDDF\uD835\uDDE0\uD835\uDDE1",32:[0,0,250,0,0],160:[0,0,250,0,0],120276:[690,0,690,25,665],120277:[676,0,636,80,594],120278:[691,19,723,49,688],120279:[676,0,709,80,674],120280:[676,0,635,80,597],120281:[676,0,582,80,570],120282:[691,19,746,37,671],120283:[676,0,715,80,635],120284:[676,0,440,65,375],120285:[676,96,481,15,406],120286:[676,0,712,80,707],120287:[676,0,603,80,587],120288:[676,0,913,80,833],120289:[676,18,724,80,644],120290:[692,18,778,35,743],120291:[676,0,581,80,569],120292:[691,176,779,35,754],120293:[676,0,670,80,657],120294:[691,19,554,35,511],120295:[676,0,641,14,627],120296:[676,19,699,75,624],120297:[676,18,690,25,665],120298:[676,15,997,30,967],120299:[676,0,740,40,700],120300:[676,0,694,20,674],120301:[676,0,653,25,623],120302:[473,14,489,23,428],120303:[676,13,512,55,487],120304:[473,14,462,25,442],120305:[676,14,518,25,463],120306:[473,13,452,25,433],120307:[691,0,340,14,374],120308:[473,206,504,28,490],120309:[676,0,510,55,455],120310:[688,0,245,50,195],120311:[688,203,324,-57,269],120312:[676,0,519,55,506],120313:[676,0,235,55,180],120314:[473,0,776,55,721],120315:[473,0,510,55,455],120316:[473,14,501,25,476],120317:[473,205,512,55,487],120318:[473,205,512,25,457],120319:[473,0,411,55,406],120320:[473,13,385,25,357],120321:[630,12,386,7,371],120322:[461,15,518,55,463],120323:[461,14,462,15,447],120324:[461,14,701,17,684],120325:[461,0,506,20,486],120326:[461,205,472,18,455],120327:[461,0,441,21,417],120662:[690,0,690,25,665],120663:[676,0,636,80,594],120664:[676,0,591,80,569],120665:[690,0,720,40,680],120666:[676,0,635,80,597],120667:[676,0,653,25,623],120668:[676,0,715,80,635],120669:[691,19,778,35,743],120670:[676,0,440,65,375],120671:[676,0,712,80,707],120672:[690,0,706,40,666],120673:[676,0,913,80,833],120674:[676,18,724,80,644],120675:[676,0,640,35,605],120676:[692,18,778,35,743],120677:[676,0,715,80,635],120678:[676,0,581,80,569],120679:[691,19,778,35,743],120680:[676,0,674,28,632],120681:[676,0,641,14,627],120682:[691,0,748,20,728],120683:[676,0,800,25,775],120684:[676,0,740,40,700],120685:[691,0,806,15,791],120686:[691,0,752,32,720],120687:[664,30,735,45,685],120688:[473,14,662,40,629],120689:[692,205,512,39,487],120690:[473,205,502,10,477],120691:[692,14,502,25,477],120692:[473,14,451,25,434],120693:[692,205,500,28,488],120694:[473,205,510,35,474],120695:[692,14,500,23,477],120696:[461,14,319,53,296],120697:[473,0,527,55,512],120698:[692,14,554,18,520],120699:[461,205,550,39,517],120700:[473,14,492,55,472],120701:[692,205,501,28,489],120702:[473,14,501,25,476],120703:[461,14,594,10,572],120704:[473,205,511,38,486],120705:[473,205,498,26,486],120706:[461,14,520,25,552],120707:[461,14,479,6,472],120708:[473,14,514,35,489],120709:[473,205,634,25,609],120710:[473,205,573,9,553],120711:[473,205,680,25,699],120712:[461,14,740,42,689],120713:[691,14,501,25,476],120714:[473,14,462,25,440],120715:[692,14,536,35,522],120716:[473,14,570,14,554],120717:[692,205,634,25,609],120718:[473,205,494,25,469],120719:[461,14,848,6,839],120812:[688,13,500,24,476],120813:[688,0,500,82,334],120814:[688,0,500,20,474],120815:[688,13,500,18,479],120816:[688,0,500,19,484],120817:[676,13,500,13,483],120818:[688,13,500,26,475],120819:[676,0,500,35,471],120820:[688,13,500,28,472],120821:[688,13,500,26,475]};MathJax.Callback.Queue(["initFont",MathJax.OutputJax["HTML-CSS"],"STIXMathJax_SansSerif-bold"],["loadComplete",MathJax.Ajax,MathJax.OutputJax["HTML-CSS"].fontDir+"/SansSerif/Bold/Main.js"]);
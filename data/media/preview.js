@@ -0,0 +1,197 @@
+/*
+ * reRemarkable live preview
+ *
+ * The preview page is loaded once as a shell. The editor then sends block
+ * patches through reremarkable.patch(), which replace a range of rendered
+ * blocks and only re-highlight and re-typeset the nodes that changed.
+ * MathJax is loaded on demand the first time a patch contains math.
+ *
+ * For scroll synchronization every block carries the source line it starts
+ * at. The page offsets of the blocks and the scroll position are posted to
+ * the editor through the "reremarkable" script message handler.
+ */
+var reremarkable = (function () {
+    'use strict';
+
+    var mathjax = null;
+    var mathjaxLoading = false;
+    var measurePending = false;
+    var scrollPending = false;
+    var expectedScroll = null;
+
+    function post(message) {
+        if (window.webkit && window.webkit.messageHandlers && window.webkit.messageHandlers.reremarkable) {
+            window.webkit.messageHandlers.reremarkable.postMessage(message);
+        }
+    }
+
+    function configure(options) {
+        mathjax = options.mathjax || null;
+    }
+
+    function loadMathJax() {
+        if (mathjaxLoading || !mathjax) {
+            return;
+        }
+        mathjaxLoading = true;
+        // The startup typeset of MathJax covers the whole page
+        window.MathJax = mathjax.config;
+        var script = document.createElement('script');
+        script.type = 'text/javascript';
+        script.src = mathjax.source;
+        document.body.appendChild(script);
+    }
+
+    function content() {
+        return document.getElementById('reremarkable-content');
+    }
+
+    function highlight(node) {
+        if (typeof hljs === 'undefined') {
+            return;
+        }
+        var blocks = node.querySelectorAll('pre code');
+        for (var i = 0; i < blocks.length; i++) {
+            hljs.highlightBlock(blocks[i]);
+        }
+    }
+
+    function typeset(nodes, math) {
+        if (!math) {
+            return;
+        }
+        if (typeof MathJax === 'undefined') {
+            loadMathJax();
+            return;
+        }
+        if (!MathJax.Hub) {
+            // Still loading, its startup typeset will pick up the new nodes
+            return;
+        }
+        MathJax.Hub.Queue(['Typeset', MathJax.Hub, nodes], scheduleMeasure);
+    }
+
+    /*
+     * Post [source line, page offset] for every block, once per frame.
+     * Blocks are display: contents, so their first element is measured.
+     */
+    function measure() {
+        measurePending = false;
+        var root = content();
+        if (!root) {
+            return;
+        }
+        var blocks = [];
+        for (var i = 0; i < root.children.length; i++) {
+            var block = root.children[i];
+            var element = block.firstElementChild;
+            if (!element) {
+                continue;
+            }
+            blocks.push([
+                parseInt(block.getAttribute('data-source-line'), 10),
+                element.getBoundingClientRect().top + window.pageYOffset
+            ]);
+        }
+        post({type: 'blocks', blocks: blocks, height: document.documentElement.scrollHeight});
+    }
+
+    function scheduleMeasure() {
+        if (!measurePending) {
+            measurePending = true;
+            window.requestAnimationFrame(measure);
+        }
+    }
+
+    function postScroll() {
+        scrollPending = false;
+        var bottom = window.pageYOffset + window.innerHeight >= document.documentElement.scrollHeight - 1;
+        post({type: 'scroll', top: window.pageYOffset, bottom: bottom});
+    }
+
+    function onScroll() {
+        if (expectedScroll !== null && Math.abs(window.pageYOffset - expectedScroll) < 1) {
+            // Caused by scrollTo() from the editor
+            expectedScroll = null;
+            return;
+        }
+        if (!scrollPending) {
+            scrollPending = true;
+            window.requestAnimationFrame(postScroll);
+        }
+    }
+
+    /*
+     * Scroll to a page offset sent by the editor, or to the bottom of
+     * the page for null, without posting the position back. Only a scroll
+     * event at the expected offset is ignored, and the expectation is
+     * dropped on the next frame, after the scroll events of this one, in
+     * case scrolling did not move the page.
+     */
+    function scrollTo(offset) {
+        var limit = Math.max(0, document.documentElement.scrollHeight - window.innerHeight);
+        var target = offset === null ? limit : Math.min(Math.max(offset, 0), limit);
+        if (Math.abs(target - window.pageYOffset) < 1) {
+            return;
+        }
+        expectedScroll = target;
+        window.scrollTo(0, target);
+        window.requestAnimationFrame(function () {
+            expectedScroll = null;
+        });
+    }
+
+    function createBlock(block) {
+        var node = document.createElement('div');
+        node.className = 'rr-block';
+        node.setAttribute('data-key', block.key);
+        node.setAttribute('data-source-line', block.line);
+        node.innerHTML = block.html;
+        return node;
+    }
+
+    /*
+     * Replace `remove` blocks starting at index `start` with `blocks`,
+     * a list of {key, line, html} objects. `math` is set when any of the
+     * new blocks contains math. `lines` holds the source line of every
+     * block when lines moved.
+     */
+    function patch(change) {
+        var root = content();
+        if (!root) {
+            return;
+        }
+        for (var i = 0; i < change.remove && root.children[change.start]; i++) {
+            root.removeChild(root.children[change.start]);
+        }
+        var reference = root.children[change.start] || null;
+        var added = [];
+        for (var j = 0; j < change.blocks.length; j++) {
+            var node = createBlock(change.blocks[j]);
+            root.insertBefore(node, reference);
+            highlight(node);
+            added.push(node);
+        }
+        if (added.length) {
+            typeset(added, change.math);
+        }
+        if (change.lines) {
+            for (var k = 0; k < change.lines.length && k < root.children.length; k++) {
+                root.children[k].setAttribute('data-source-line', change.lines[k]);
+            }
+        }
+        scheduleMeasure();
+    }
+
+    window.addEventListener('scroll', onScroll);
+    window.addEventListener('resize', scheduleMeasure);
+    window.addEventListener('load', scheduleMeasure);
+    // Images and other resources change the block offsets once loaded
+    document.addEventListener('load', scheduleMeasure, true);
+
+    return {
+        configure: configure,
+        patch: patch,
+        scrollTo: scrollTo
+    };
+})();
@@ -7,4 +7,5 @@ __version__ = '0.4.1'
 __license__ = 'MIT'
 
 from .api import configuration, from_file, from_string, from_url
+from .configuration import get_configuration, invalidate_configuration
 from .pdfkit import PDFKit
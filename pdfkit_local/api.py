@@ -1,5 +1,6 @@
 
-from .pdfkit import Configuration, PDFKit
+from .configuration import Configuration
+from .pdfkit import PDFKit
 
 
 def from_url(url, output_path, options=None, toc=None, cover=None, configuration=None):
@@ -49,7 +50,8 @@ def from_string(input, output_path, options=None, toc=None, cover=None, css=None
     """
     Convert given string or strings to PDF document
 
-    :param input: string with a desired text. Could be a raw text or a html file
+    :param input: string with a desired text. Could be a raw text or a html file.
+                  An iterable of strings is streamed to wkhtmltopdf piece by piece
     :param output_path: path to output PDF file. False means file will be returned as string.
     :param options: (optional) dict with wkhtmltopdf options, with or w/o '--'
     :param toc: (optional) dict with toc-specific wkhtmltopdf options, with or w/o '--'
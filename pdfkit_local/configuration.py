@@ -1,5 +1,15 @@
+import re
 import subprocess
 import sys
+import threading
+from collections import namedtuple
+
+# Version and command line switches of a wkhtmltopdf binary
+Capabilities = namedtuple('Capabilities', ['version', 'patched_qt', 'flags'])
+
+VERSION_RE = re.compile(r'wkhtmltopdf\s+([\d.]+)')
+# Option lines of --extended-help, e.g. "  -B, --margin-bottom <unitreal>  Set the page bottom margin *"
+HELP_OPTION_RE = re.compile(r'^\s+(?:-\w, )?(--[\w-]+)(.*)$')
 
 
 class Configuration:
@@ -16,6 +26,9 @@ class Configuration:
                 self.wkhtmltopdf = subprocess.Popen(
                     ['which', 'wkhtmltopdf'], stdout=subprocess.PIPE).communicate()[0].strip()
 
+        if isinstance(self.wkhtmltopdf, bytes):
+            self.wkhtmltopdf = self.wkhtmltopdf.decode('utf-8')
+
         try:
             with open(self.wkhtmltopdf):
                 pass
@@ -24,3 +37,91 @@ class Configuration:
                           'If this file exists please check that this process can '
                           'read it. Otherwise please install wkhtmltopdf - '
                           'https://github.com/JazzCore/python-pdfkit/wiki/Installing-wkhtmltopdf')
+
+        self._capabilities = None
+
+    def get_capabilities(self):
+        """Probes the binary once for its version and supported switches
+
+        returns:
+          Capabilities: version string (or None), whether Qt is patched and
+                        a frozenset of supported long options such as '--no-outline'
+        """
+        if self._capabilities is None:
+            self._capabilities = probe_capabilities(self.wkhtmltopdf)
+        return self._capabilities
+
+    def supports(self, option):
+        """Checks if the binary accepts an option, given with or w/o '--'"""
+        if not option.startswith('--'):
+            option = f'--{option}'
+        flags = self.get_capabilities().flags
+        # An empty set means the probe failed, assume the option works
+        return not flags or option.lower() in flags
+
+
+def probe_capabilities(wkhtmltopdf):
+    """Runs wkhtmltopdf --version and --extended-help
+
+    :param wkhtmltopdf: str - path to the binary
+
+    returns:
+      Capabilities
+    """
+    try:
+        version_output = subprocess.run([wkhtmltopdf, '--version'], capture_output=True,
+                                        text=True, timeout=10).stdout
+        help_output = subprocess.run([wkhtmltopdf, '--extended-help'], capture_output=True,
+                                     text=True, timeout=10).stdout
+    except (OSError, subprocess.SubprocessError):
+        return Capabilities(None, False, frozenset())
+
+    match = VERSION_RE.search(version_output)
+    version = match.group(1) if match else None
+    patched_qt = 'patched qt' in version_output and 'unpatched' not in version_output
+
+    flags = set()
+    for line in help_output.splitlines():
+        match = HELP_OPTION_RE.match(line)
+        if not match:
+            continue
+        # Options marked with '*' are ignored by builds with unpatched Qt
+        if not patched_qt and match.group(2).rstrip().endswith('*'):
+            continue
+        flags.add(match.group(1).lower())
+
+    return Capabilities(version, patched_qt, frozenset(flags))
+
+
+_configurations = {}
+_configurations_lock = threading.Lock()
+
+
+def get_configuration(wkhtmltopdf='', meta_tag_prefix='pdfkit-'):
+    """Returns a process-wide Configuration, resolved and validated once per binary path
+
+    :param wkhtmltopdf: str (optional) - path to the binary, found on PATH if empty
+    :param meta_tag_prefix: str (optional) - the prefix for ``pdfkit`` specific meta tags
+
+    Raises OSError if no binary is found; failed lookups are not cached.
+    """
+    key = (wkhtmltopdf or '', meta_tag_prefix)
+    with _configurations_lock:
+        configuration = _configurations.get(key)
+        if configuration is None:
+            configuration = Configuration(wkhtmltopdf, meta_tag_prefix)
+            _configurations[key] = configuration
+        return configuration
+
+
+def invalidate_configuration(wkhtmltopdf=None):
+    """Forgets memoized configurations
+
+    :param wkhtmltopdf: str (optional) - path whose configuration to forget, all if None
+    """
+    with _configurations_lock:
+        if wkhtmltopdf is None:
+            _configurations.clear()
+        else:
+            for key in [key for key in _configurations if key[0] == wkhtmltopdf]:
+                del _configurations[key]
@@ -1,13 +1,16 @@
-import codecs
 import io
 import re
 import subprocess
 import sys
+import threading
 from itertools import chain
 
-from .configuration import Configuration
+from .configuration import get_configuration
 from .source import Source
 
+# Size of the pieces written to and read from wkhtmltopdf
+CHUNK_SIZE = 64 * 1024
+
 
 class PDFKit:
     """
@@ -36,12 +39,12 @@ class PDFKit:
                  css=None, configuration=None):
 
         self.source = Source(url_or_file, type_)
-        self.configuration = (Configuration() if configuration is None
+        self.configuration = (get_configuration() if configuration is None
                               else configuration)
-        self.wkhtmltopdf = self.configuration.wkhtmltopdf.decode('utf-8')
+        self.wkhtmltopdf = self.configuration.wkhtmltopdf
 
         self.options = dict()
-        if self.source.isString():
+        if self.source.isString() and isinstance(url_or_file, str):
             self.options.update(self._find_options_in_meta(url_or_file))
         if options is not None: self.options.update(options)
         self.options = self._normalize_options(self.options)
@@ -87,47 +90,100 @@ class PDFKit:
 
         return args
 
-    def to_pdf(self, path=None):
+    def to_pdf(self, path=None, stderr_callback=None):
+        """Runs wkhtmltopdf, streaming the input into its stdin
+
+        :param path: str (optional) - output file, the PDF is returned if not given
+        :param stderr_callback: callable (optional) - called with each chunk of
+                                wkhtmltopdf output (bytes) as it arrives
+
+        returns:
+          True if the PDF was written to path, otherwise the PDF as bytes
+        """
         args = self.command(path)
 
-        result = subprocess.Popen(args, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+        result = subprocess.Popen(args, stdin=subprocess.PIPE,
+                                  stdout=subprocess.DEVNULL if path else subprocess.PIPE,
                                   stderr=subprocess.PIPE)
 
-        # If the source is a string then we will pipe it into wkhtmltopdf.
-        # If we want to add custom CSS to file then we read input file to
-        # string and prepend css to it and then pass it to stdin.
-        # This is a workaround for a bug in wkhtmltopdf (look closely in README)
-        if self.source.isString() or (self.source.isFile() and self.css):
-            input = self.source.to_s().encode('utf-8')
-        elif self.source.isFileObj():
-            input = self.source.source.read().encode('utf-8')
-        else:
-            input = None
-        stdout, stderr = result.communicate(input=input)
+        # Read stderr (and stdout when the PDF is returned) on threads while
+        # the input is written, so no pipe can fill up and block the child
+        stderr_chunks = []
+        stdout_chunks = []
+        readers = [threading.Thread(target=self._read_stream,
+                                    args=(result.stderr, stderr_chunks, stderr_callback), daemon=True)]
+        if not path:
+            readers.append(threading.Thread(target=self._read_stream,
+                                            args=(result.stdout, stdout_chunks, None), daemon=True))
+        for reader in readers:
+            reader.start()
+
+        try:
+            for chunk in self._input_chunks():
+                result.stdin.write(chunk)
+        except BrokenPipeError:
+            pass  # wkhtmltopdf exited early, its output tells why
+        finally:
+            try:
+                result.stdin.close()
+            except BrokenPipeError:
+                pass
 
-        if 'Error' in stderr.decode('utf-8'):
-            raise OSError('wkhtmltopdf reported an error:\n' + stderr.decode('utf-8'))
+        for reader in readers:
+            reader.join()
+        result.wait()
+
+        stderr = b''.join(stderr_chunks).decode('utf-8', 'replace')
+        if 'Error' in stderr:
+            raise OSError('wkhtmltopdf reported an error:\n' + stderr)
 
         # Since wkhtmltopdf sends its output to stderr we will capture it
         # and properly send to stdout
         if '--quiet' not in args:
-            sys.stdout.write(stderr.decode('utf-8'))
+            sys.stdout.write(stderr)
 
         if not path:
-            return stdout
-        else:
-            try:
-                with codecs.open(path, encoding='utf-8') as f:
-                    # read 4 bytes to get PDF signature '%PDF'
-                    text = f.read(4)
-                    if text == '':
-                        raise OSError('Command failed: {}\n'
-                                      'Check whhtmltopdf output without \'quiet\' '
-                                      'option'.format(' '.join(args)))
+            return b''.join(stdout_chunks)
+
+        # A PDF starts with the '%PDF' signature
+        try:
+            with open(path, 'rb') as f:
+                if f.read(4) == b'%PDF':
                     return True
-            except OSError:
-                raise OSError('Command failed: {}\n'
-                              'Check whhtmltopdf output without \'quiet\' option'.format(' '.join(args)))
+        except OSError:
+            pass
+        raise OSError('Command failed: {}\n'
+                      'Check whhtmltopdf output without \'quiet\' option'.format(' '.join(args)))
+
+    def _input_chunks(self):
+        """Yields the input for wkhtmltopdf's stdin as UTF-8 encoded chunks
+
+        If the source is a string then we will pipe it into wkhtmltopdf.
+        If we want to add custom CSS to file then we read input file to
+        string and prepend css to it and then pass it to stdin.
+        This is a workaround for a bug in wkhtmltopdf (look closely in README)
+        A string source may also be an iterable of strings, written as they
+        are produced.
+        """
+        if self.source.isString() or (self.source.isFile() and self.css):
+            source = self.source.to_s()
+            if isinstance(source, str):
+                chunks = (source[start:start + CHUNK_SIZE] for start in range(0, len(source), CHUNK_SIZE))
+            else:
+                chunks = source
+            for chunk in chunks:
+                yield chunk.encode('utf-8')
+        elif self.source.isFileObj():
+            for chunk in iter(lambda: self.source.source.read(CHUNK_SIZE), ''):
+                yield chunk.encode('utf-8') if isinstance(chunk, str) else chunk
+
+    def _read_stream(self, stream, chunks, callback):
+        """Collects a child output stream chunk by chunk"""
+        for chunk in iter(lambda: stream.read1(CHUNK_SIZE), b''):
+            chunks.append(chunk)
+            if callback is not None:
+                callback(chunk)
+        stream.close()
 
     def _normalize_options(self, options):
         """Updates a dict of config options to make then usable on command line
@@ -156,7 +212,8 @@ class PDFKit:
         return f"<style>{stylesheet}</style>"
 
     def _prepend_css(self, path):
-        if self.source.isUrl() or isinstance(self.source.source, list):
+        if (self.source.isUrl() or isinstance(self.source.source, list)
+                or (self.source.isString() and not isinstance(self.source.source, str))):
             raise self.ImproperSourceError('CSS file can be added only to a single '
                                            'file or string')
 
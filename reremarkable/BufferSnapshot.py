@@ -0,0 +1,109 @@
+import bisect
+
+
+class Snapshot:
+    """
+    Immutable copy of a text buffer at one generation:
+    - text is the buffer content as a str, safe to hand to other threads
+    - The line offset index is built on first use
+    """
+
+    __slots__ = ('generation', 'text', '_line_offsets')
+
+    def __init__(self, generation, text):
+        self.generation = generation
+        self.text = text
+        self._line_offsets = None
+
+    def get_line_offsets(self):
+        """
+        Get the character offset at which each line starts
+
+        Returns:
+            list: Start offsets, one per line
+        """
+        if self._line_offsets is None:
+            offsets = [0]
+            find = self.text.find
+            position = find('\n')
+            while position != -1:
+                offsets.append(position + 1)
+                position = find('\n', position + 1)
+            self._line_offsets = offsets
+        return self._line_offsets
+
+    def get_line_count(self):
+        """Get the number of lines in the snapshot"""
+        return len(self.get_line_offsets())
+
+    def get_line_at_offset(self, offset):
+        """
+        Get the line containing a character offset
+
+        Args:
+            offset (int): Character offset
+
+        Returns:
+            int: Zero-based line number
+        """
+        return bisect.bisect_right(self.get_line_offsets(), offset) - 1
+
+    def get_line_offset(self, line):
+        """
+        Get the character offset at which a line starts
+
+        Args:
+            line (int): Zero-based line number, clamped to the snapshot
+
+        Returns:
+            int: Character offset
+        """
+        offsets = self.get_line_offsets()
+        return offsets[max(0, min(line, len(offsets) - 1))]
+
+class BufferSnapshot:
+    """
+    Shares one text copy of a buffer between its consumers:
+    - A change counter is bumped on every "changed" signal
+    - get() copies the buffer only once per change; the live preview,
+      exports, clipboard and saving all reuse that copy
+    """
+
+    def __init__(self, text_buffer):
+        """
+        Initialize the BufferSnapshot
+
+        Connect this before any other "changed" handler that reads the
+        snapshot, so the counter is bumped before they run.
+
+        Args:
+            text_buffer: GTK text buffer to snapshot
+        """
+        self.text_buffer = text_buffer
+        self.generation = 0
+        self._snapshot = None
+
+        self.text_buffer.connect("changed", self._on_changed)
+
+    def _on_changed(self, text_buffer):
+        self.generation += 1
+
+    def get(self):
+        """
+        Get the snapshot of the current buffer content
+
+        Returns:
+            Snapshot: Shared snapshot for the current generation
+        """
+        if self._snapshot is None or self._snapshot.generation != self.generation:
+            text = self.text_buffer.get_text(
+                self.text_buffer.get_start_iter(),
+                self.text_buffer.get_end_iter(),
+                False
+            )
+            self._snapshot = Snapshot(self.generation, text)
+        return self._snapshot
+
+    def get_text(self):
+        """Get the current buffer content as a str"""
+        return self.get().text
@@ -0,0 +1,140 @@
+import hashlib
+import html
+import logging
+import re
+import threading
+from collections import OrderedDict
+
+logger = logging.getLogger('reremarkable')
+
+# Code blocks as produced by python-markdown (fenced and indented code)
+CODE_BLOCK_RE = re.compile(r'<pre><code(?: class="language-([\w+#.-]+)")?>(.*?)</code></pre>', re.DOTALL)
+
+class CodeHighlighter:
+    """
+    Python-side syntax highlighting for code blocks, as an alternative to
+    running highlight.js in the page:
+    - Uses Pygments, which is an optional dependency
+    - Caches highlighted blocks by (language, source hash), so unchanged
+      code blocks cost nothing to highlight again
+    - Blocks without a language or with an unknown one are left as they are
+    """
+
+    CSS_CLASS = 'codehilite'
+
+    def __init__(self, style='default', max_cached_blocks=1024):
+        """
+        Initialize the CodeHighlighter
+
+        Args:
+            style (str): Pygments style name
+            max_cached_blocks (int): Maximum number of cached highlighted blocks
+        """
+        self.style = style
+        self.max_cached_blocks = max_cached_blocks
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+        self._css = None
+
+    @staticmethod
+    def is_available():
+        """Check if Pygments is installed"""
+        try:
+            import pygments  # noqa: F401
+            return True
+        except ImportError:
+            return False
+
+    @classmethod
+    def from_setting(cls, code_highlighting):
+        """
+        Create a highlighter for the code-highlighting setting
+
+        Args:
+            code_highlighting (str): "pygments" or "highlightjs"
+
+        Returns:
+            CodeHighlighter, or None when highlight.js is used
+        """
+        if code_highlighting != "pygments":
+            return None
+        if not cls.is_available():
+            logger.warning("Pygments is not installed, using highlight.js for code blocks")
+            return None
+        return cls()
+
+    def get_css(self):
+        """
+        Get the stylesheet for highlighted blocks
+
+        Returns:
+            str: CSS rules scoped to the highlighted blocks
+        """
+        if self._css is None:
+            from pygments.formatters import HtmlFormatter
+            self._css = HtmlFormatter(style=self.style).get_style_defs(f'.{self.CSS_CLASS}')
+        return self._css
+
+    def highlight_html(self, html_content):
+        """
+        Highlight all code blocks in rendered HTML
+
+        Args:
+            html_content (str): Rendered HTML
+
+        Returns:
+            str: HTML with highlighted code blocks
+        """
+        if '<pre><code' not in html_content:
+            return html_content
+        return CODE_BLOCK_RE.sub(self._highlight_match, html_content)
+
+    def _highlight_match(self, match):
+        """Highlight a single code block match, using the cache"""
+        language = match.group(1)
+        if not language:
+            return match.group(0)
+
+        source = html.unescape(match.group(2))
+        key = (language, hashlib.sha1(source.encode('utf-8')).hexdigest())
+
+        with self._lock:
+            highlighted = self._cache.get(key)
+            if highlighted is not None:
+                self._cache.move_to_end(key)
+                return highlighted
+
+        highlighted = self._highlight(language, source)
+        if highlighted is None:
+            highlighted = match.group(0)
+
+        with self._lock:
+            self._cache[key] = highlighted
+            if len(self._cache) > self.max_cached_blocks:
+                self._cache.popitem(last=False)
+        return highlighted
+
+    def _highlight(self, language, source):
+        """
+        Run Pygments on a code block
+
+        Returns:
+            str: Highlighted block, or None if the language is unknown
+        """
+        from pygments import highlight
+        from pygments.formatters import HtmlFormatter
+        from pygments.lexers import get_lexer_by_name
+        from pygments.util import ClassNotFound
+
+        try:
+            lexer = get_lexer_by_name(language)
+        except ClassNotFound:
+            return None
+
+        try:
+            code = highlight(source, lexer, HtmlFormatter(nowrap=True))
+        except Exception as e:
+            logger.warning(f"Could not highlight {language} code block: {e}")
+            return None
+        return (f'<pre class="{self.CSS_CLASS}">'
+                f'<code class="language-{html.escape(language)}">{code}</code></pre>')
@@ -0,0 +1,156 @@
+import re
+
+# Tokens excluded from the word count
+WORD_EXCEPTIONS = frozenset([
+    "#", "##", "###", "####", "#####", "######", "*", "**", "-", "+", "_", "/", "\\", ":",
+    ";", "@", "'", "~", "(", ")", "[", "]", "{", "}", "((", "))", "+-", "-+", "/=", ".", "|",
+    "!", "!!", "!!!", "$", "", "%", "^", "&"
+])
+
+# Short numbers such as list markers are not counted as words either
+NUMBER_RE = re.compile(r'[0-9]{1,3}')
+
+# Average silent reading speed used for reading time estimates
+WORDS_PER_MINUTE = 200
+
+def count_words(text):
+    """
+    Count the words in a piece of text
+
+    Args:
+        text (str): Text to count
+
+    Returns:
+        int: Number of words, ignoring markup tokens and short numbers
+    """
+    return sum(1 for word in text.split()
+               if word not in WORD_EXCEPTIONS and not NUMBER_RE.fullmatch(word))
+
+def reading_time(words):
+    """
+    Estimate the reading time for a number of words
+
+    Args:
+        words (int): Number of words
+
+    Returns:
+        int: Reading time in whole minutes, at least 1 for non-empty text
+    """
+    if words <= 0:
+        return 0
+    return max(1, round(words / WORDS_PER_MINUTE))
+
+class DocumentStatistics:
+    """
+    Incremental word statistics for a text buffer:
+    - Keeps a word count per line
+    - Recounts only the lines touched by insert-text and delete-range
+    - Counts selections from the cached line counts plus the two partial lines
+    """
+
+    def __init__(self, text_buffer):
+        """
+        Initialize the DocumentStatistics
+
+        Args:
+            text_buffer: GTK text buffer to track
+        """
+        self.text_buffer = text_buffer
+        self.line_words = []
+        self.word_count = 0
+        self._pending_lines = None
+
+        self.recount()
+
+        self.text_buffer.connect("insert-text", self._on_insert_text_before)
+        self.text_buffer.connect_after("insert-text", self._on_insert_text_after)
+        self.text_buffer.connect("delete-range", self._on_delete_range_before)
+        self.text_buffer.connect_after("delete-range", self._on_delete_range_after)
+
+    def recount(self):
+        """Count all lines of the buffer from scratch"""
+        self.line_words = [self._count_line(line) for line in range(self.text_buffer.get_line_count())]
+        self.word_count = sum(self.line_words)
+
+    def get_word_count(self):
+        """Get the number of words in the buffer"""
+        return self.word_count
+
+    def get_reading_time(self):
+        """Get the estimated reading time of the buffer in minutes"""
+        return reading_time(self.word_count)
+
+    def get_selection_statistics(self):
+        """
+        Get statistics for the current selection
+
+        Returns:
+            tuple: (words, characters), or None if nothing is selected
+        """
+        if not self.text_buffer.get_has_selection():
+            return None
+
+        start, end = self.text_buffer.get_selection_bounds()
+        characters = end.get_offset() - start.get_offset()
+        first, last = start.get_line(), end.get_line()
+
+        if first == last:
+            return count_words(self.text_buffer.get_text(start, end, False)), characters
+
+        # Partial first and last lines, whole lines in between from the cache
+        first_end = start.copy()
+        if not first_end.ends_line():
+            first_end.forward_to_line_end()
+        last_start = self.text_buffer.get_iter_at_line(last)
+
+        words = (count_words(self.text_buffer.get_text(start, first_end, False))
+                 + sum(self.line_words[first + 1:last])
+                 + count_words(self.text_buffer.get_text(last_start, end, False)))
+        return words, characters
+
+    def _count_line(self, line):
+        """Count the words of a single buffer line"""
+        start = self.text_buffer.get_iter_at_line(line)
+        end = start.copy()
+        if not end.ends_line():
+            end.forward_to_line_end()
+        return count_words(self.text_buffer.get_text(start, end, False))
+
+    def _replace_lines(self, first, last, new_last):
+        """
+        Replace the counts of lines first..last with fresh counts of lines first..new_last
+
+        Args:
+            first (int): First changed line
+            last (int): Last changed line before the edit
+            new_last (int): Last changed line after the edit
+        """
+        counts = [self._count_line(line) for line in range(first, new_last + 1)]
+        self.word_count += sum(counts) - sum(self.line_words[first:last + 1])
+        self.line_words[first:last + 1] = counts
+
+    def _on_insert_text_before(self, text_buffer, location, text, length):
+        """Remember the line the text is inserted into"""
+        self._pending_lines = (location.get_line(), location.get_line())
+
+    def _on_insert_text_after(self, text_buffer, location, text, length):
+        """Recount the lines covered by the inserted text"""
+        if self._pending_lines is None:
+            self.recount()
+            return
+        first, last = self._pending_lines
+        self._pending_lines = None
+        self._replace_lines(first, last, location.get_line())
+
+    def _on_delete_range_before(self, text_buffer, start, end):
+        """Remember the lines spanned by the deleted range"""
+        self._pending_lines = (start.get_line(), end.get_line())
+
+    def _on_delete_range_after(self, text_buffer, start, end):
+        """Recount the line the deleted range collapsed into"""
+        if self._pending_lines is None:
+            self.recount()
+            return
+        first, last = self._pending_lines
+        self._pending_lines = None
+        self._replace_lines(first, last, start.get_line())
@@ -0,0 +1,151 @@
+import logging
+import os
+
+import gi
+
+gi.require_version('Gtk', '3.0')
+gi.require_version('GtkSource', '3.0')
+gi.require_version('WebKit2', '4.1')
+from BufferSnapshot import BufferSnapshot
+from DocumentStatistics import DocumentStatistics
+from FileManager import FileManager
+from gi.repository import Gtk, GtkSource, Pango, WebKit2
+from MarkdownFormatter import MarkdownFormatter
+from PreviewPage import PreviewPage
+from ScrollSync import ScrollSync
+
+logger = logging.getLogger('reremarkable')
+
+class DocumentTab:
+    """
+    One open document in a notebook page of the main window:
+    - Owns the buffer, editor, live preview and the per-document helpers
+      (snapshot, statistics, formatter, file manager, preview page, scroll sync)
+    - The rendering engine, settings, recent files, styles and exports are
+      shared by all tabs and stay with the window
+    - Live previews are created in the shared WebKit WebContext
+    - The tab label shows the file name, marked with '*' while modified,
+      and a close button
+    """
+
+    def __init__(self, window, web_context, media_path, font=None):
+        """
+        Initialize the DocumentTab
+
+        Args:
+            window: Main Gtk.Window, parent of the file dialogs
+            web_context: WebKit2.WebContext shared by the live previews
+            media_path: Path to media files for the preview page
+            font (str): Editor font description, or None for the default font
+        """
+        self.title = "reRemarkable: Untitled"
+        self.title_changed_callback = None
+
+        self.text_buffer = GtkSource.Buffer()
+        self.text_buffer.set_language(GtkSource.LanguageManager.get_default().get_language('markdown'))
+        self.text_buffer.set_highlight_matching_brackets(True)
+
+        self.text_view = GtkSource.View.new_with_buffer(self.text_buffer)
+        self.text_view.set_show_line_numbers(True)
+        self.text_view.set_auto_indent(True)
+        self.text_view.set_wrap_mode(Gtk.WrapMode.WORD)
+        if font:
+            self.text_view.override_font(Pango.FontDescription(font))
+
+        # One shared text copy per buffer change, connected before the handlers that read it
+        self.buffer_snapshot = BufferSnapshot(self.text_buffer)
+
+        # Word statistics for the status bar, kept up to date per edited line
+        self.document_statistics = DocumentStatistics(self.text_buffer)
+
+        self.markdown_formatter = MarkdownFormatter(self.text_buffer)
+        self.file_manager = FileManager(window, self.text_buffer, self.buffer_snapshot)
+        self.file_manager.set_title_callback(self.set_title)
+
+        self.live_preview = WebKit2.WebView(web_context=web_context)
+
+        self.scrolledwindow_text_view = Gtk.ScrolledWindow()
+        self.scrolledwindow_text_view.add(self.text_view)
+        self.scrolledwindow_live_preview = Gtk.ScrolledWindow()
+        self.scrolledwindow_live_preview.add(self.live_preview)
+
+        self.paned = Gtk.Paned()
+        self.paned.pack1(self.scrolledwindow_text_view)
+        self.paned.pack2(self.scrolledwindow_live_preview)
+
+        # Page shell of the live preview, patched in place on every render
+        self.preview_page = PreviewPage(self.live_preview, media_path)
+
+        # Keep the editor and the live preview at the same source line
+        self.scroll_sync = ScrollSync(self.text_view, self.scrolledwindow_text_view.get_vadjustment(),
+                                      self.live_preview)
+
+        self.label = Gtk.Label(label=self.get_filename())
+        close_button = Gtk.Button.new_from_icon_name("window-close-symbolic", Gtk.IconSize.MENU)
+        close_button.set_relief(Gtk.ReliefStyle.NONE)
+        close_button.set_focus_on_click(False)
+        close_button.set_tooltip_text("Close")
+        self.close_button = close_button
+        self.tab_label = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=4)
+        self.tab_label.pack_start(self.label, True, True, 0)
+        self.tab_label.pack_start(close_button, False, False, 0)
+        self.tab_label.show_all()
+
+        self.text_buffer.connect("modified-changed", self._on_modified_changed)
+
+    def set_title_changed_callback(self, callback):
+        """Set callback function called with this tab when its title changes"""
+        self.title_changed_callback = callback
+
+    def set_title(self, title):
+        """
+        Set the window title of the document, the title callback of its FileManager
+
+        Args:
+            title (str): Title such as "reRemarkable: notes.md"
+        """
+        self.title = title
+        self._update_label()
+
+    def get_title(self):
+        """Get the window title, marked with '*' while the document is modified"""
+        return ("*" if self.text_buffer.get_modified() else "") + self.title
+
+    def get_filename(self):
+        """Get the file name shown on the tab"""
+        return self.file_manager.get_current_filename()
+
+    def is_pristine(self):
+        """Check if the tab is an empty, unmodified, unsaved document that can be reused"""
+        return (self.file_manager.get_current_file_path() == "Untitled"
+                and self.file_manager.is_buffer_empty()
+                and not self.file_manager.is_buffer_modified())
+
+    def shows_file(self, file_path):
+        """Check if the tab has a file open"""
+        current_path = self.file_manager.get_current_file_path()
+        if current_path == "Untitled":
+            return False
+        return os.path.abspath(current_path) == os.path.abspath(file_path)
+
+    def get_base_uri(self):
+        """Get the base URI for relative paths in the live preview, or None if unsaved"""
+        current_path = self.file_manager.get_current_file_path()
+        if current_path == "Untitled":
+            return None
+        return f"file://{os.path.abspath(current_path)}"
+
+    def _on_modified_changed(self, text_buffer):
+        self._update_label()
+
+    def _update_label(self):
+        filename = self.get_filename()
+        self.label.set_text(("*" if self.text_buffer.get_modified() else "") + filename)
+        self.tab_label.set_tooltip_text(self.file_manager.get_current_file_path())
+        if self.title_changed_callback:
+            self.title_changed_callback(self)
+
+    def destroy(self):
+        """Release the widgets of the tab once it is removed from the notebook"""
+        self.live_preview.stop_loading()
+        self.paned.destroy()
@@ -0,0 +1,211 @@
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import time
+
+logger = logging.getLogger('reremarkable')
+
+def get_cache_dir(name):
+    """Get a cache directory below $XDG_CACHE_HOME/reremarkable"""
+    cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache')
+    return os.path.join(cache_home, 'reremarkable', name)
+
+class ExportCache:
+    """
+    Content-addressed on-disk cache of exported files:
+    - Entries are keyed by a SHA-256 over everything that determines the
+      output (source, CSS, extensions, wkhtmltopdf options, format)
+    - A hit copies the cached file to the output path, skipping Markdown,
+      prettifying and wkhtmltopdf
+    - The cache is bounded in size; the least recently used entries are
+      evicted first (use is tracked through the file modification time)
+    - Entries are written under a temporary name that eviction leaves
+      alone, so a concurrent put is never cut short
+    - Hit and miss counts are kept per instance
+    """
+
+    DEFAULT_MAX_SIZE = 256 * 1024 * 1024
+
+    # Prefix of entries still being written
+    TEMP_PREFIX = '.tmp-'
+
+    # Seconds after which a temporary file is taken as left behind by a crashed writer
+    STALE_TEMP_AGE = 24 * 60 * 60
+
+    def __init__(self, cache_dir=None, max_size=DEFAULT_MAX_SIZE):
+        """
+        Initialize the ExportCache
+
+        Args:
+            cache_dir (str): Cache directory, defaults to $XDG_CACHE_HOME/reremarkable/exports
+            max_size (int): Maximum total size of the cached files in bytes
+        """
+        self.cache_dir = cache_dir or get_cache_dir('exports')
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(**parts):
+        """
+        Build a cache key from the inputs of an export
+
+        Args:
+            **parts: JSON serializable values, e.g. source, css, extensions,
+                options and format
+
+        Returns:
+            str: Hex SHA-256 digest
+        """
+        payload = json.dumps(parts, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def _entry_path(self, key):
+        return os.path.join(self.cache_dir, key[:2], key)
+
+    def get(self, key, output_path):
+        """
+        Copy a cached export to the output path
+
+        Args:
+            key (str): Cache key from make_key
+            output_path (str): Where to write the export
+
+        Returns:
+            bool: True on a hit, False if the export has to be generated
+        """
+        entry = self._entry_path(key)
+        try:
+            shutil.copyfile(entry, output_path)
+            os.utime(entry)  # Mark as recently used
+        except OSError:
+            with self._lock:
+                self.misses += 1
+            return False
+
+        with self._lock:
+            self.hits += 1
+        return True
+
+    def get_data(self, key):
+        """
+        Read a cached entry
+
+        Args:
+            key (str): Cache key from make_key
+
+        Returns:
+            bytes: The cached content, or None on a miss
+        """
+        entry = self._entry_path(key)
+        try:
+            with open(entry, 'rb') as f:
+                data = f.read()
+            os.utime(entry)  # Mark as recently used
+        except OSError:
+            with self._lock:
+                self.misses += 1
+            return None
+
+        with self._lock:
+            self.hits += 1
+        return data
+
+    def put(self, key, file_path):
+        """
+        Store an exported file
+
+        Args:
+            key (str): Cache key from make_key
+            file_path (str): Exported file to copy into the cache
+        """
+        self._store(key, lambda temp_path: shutil.copyfile(file_path, temp_path))
+
+    def put_data(self, key, data):
+        """
+        Store content that is not in a file
+
+        Args:
+            key (str): Cache key from make_key
+            data (bytes): Content to store
+        """
+        def write(temp_path):
+            with open(temp_path, 'wb') as f:
+                f.write(data)
+        self._store(key, write)
+
+    def _store(self, key, write):
+        entry = self._entry_path(key)
+        temp_path = None
+        try:
+            os.makedirs(os.path.dirname(entry), exist_ok=True)
+            # Write under a temporary name, so readers never see a partial entry
+            fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(entry), prefix=self.TEMP_PREFIX)
+            os.close(fd)
+            write(temp_path)
+            os.replace(temp_path, entry)
+        except OSError as e:
+            logger.warning(f"Could not store export in cache: {e}")
+            if temp_path is not None and os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    def evict(self):
+        """
+        Remove least recently used entries until the cache fits its size limit
+
+        Returns:
+            int: Number of removed entries
+        """
+        entries = []
+        total = 0
+        now = time.time()
+        for root, _dirs, files in os.walk(self.cache_dir):
+            for name in files:
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                if name.startswith(self.TEMP_PREFIX):
+                    # Another put is writing it, unless it is old enough to be left over from a crash
+                    if now - stat.st_mtime > self.STALE_TEMP_AGE:
+                        try:
+                            os.remove(path)
+                        except OSError:
+                            pass
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+                total += stat.st_size
+
+        removed = 0
+        entries.sort()
+        for _mtime, size, path in entries:
+            if total <= self.max_size:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+        return removed
+
+    def get_stats(self):
+        """
+        Get the hit and miss counts of this instance
+
+        Returns:
+            dict: hits, misses and hit_rate
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0
+            }
@@ -5,13 +5,12 @@ import gi
 gi.require_version('Gtk', '3.0')
 import logging
 import os
-import re
+import threading
 
-import markdown
-from bs4 import BeautifulSoup
-from gi.repository import Gtk
-
-import pdfkit_local as pdfkit
+import export_pipeline
+from ExportCache import ExportCache
+from gi.repository import GLib, Gtk
+from MarkdownRenderer import MarkdownRenderer
 
 logger = logging.getLogger('reremarkable')
 
@@ -25,49 +24,55 @@ class ExportManager:
     - Error handling and user feedback
     """
 
-    def __init__(self, style_manager, file_manager, media_path):
+    def __init__(self, style_manager, file_manager, media_path, markdown_renderer=None, settings_manager=None):
         """
         Initialize the ExportManager
 
         Args:
             style_manager: StyleManager instance for getting HTML styles
-            file_manager: FileManager instance for file path operations
+            file_manager: FileManager of the exported document, see set_file_manager
             media_path: Path to media files for HTML footer
+            markdown_renderer: MarkdownRenderer instance to share (optional)
+            settings_manager: SettingsManager instance for the wkhtmltopdf path (optional)
         """
         self.style_manager = style_manager
         self.file_manager = file_manager
         self.media_path = media_path
+        self.settings_manager = settings_manager
 
-        # Markdown extensions configuration
-        self.default_extensions = [
-            'markdown.extensions.extra',
-            'markdown.extensions.toc',
-            'markdown.extensions.smarty',
-            'markdown_extensions.extensions.urlize',
-            'markdown_extensions.extensions.Highlighting',
-            'markdown_extensions.extensions.Strikethrough',
-            'markdown_extensions.extensions.markdown_checklist',
-            'markdown_extensions.extensions.superscript',
-            'markdown_extensions.extensions.subscript',
-            'markdown_extensions.extensions.mathjax'
-        ]
-        self.safe_extensions = ['markdown.extensions.extra']
-
-        # HTML footer with scripts for syntax highlighting and MathJax
-        self.default_html_end = (
-            '<script src="' + self.media_path + 'highlight.min.js"></script>'
-            '<script>hljs.initHighlightingOnLoad();</script>'
-            '<script type="text/javascript" src="https://cdnjs.cloudflare.com/ajax/libs/mathjax/2.7.2/MathJax.js?config=TeX-AMS-MML_HTMLorMML"></script>'
-            '<script type="text/javascript">MathJax.Hub.Config({"showProcessingMessages" : false,"messageStyle" : "none","tex2jax": { inlineMath: [ [ "$", "$" ] ] }});</script>'
-            '</body></html>'
-        )
+        # Markdown rendering engine, shared with the live preview when provided
+        self.markdown_renderer = markdown_renderer or MarkdownRenderer()
 
         # Track PDF export errors to avoid multiple warnings
         self.pdf_error_warning = False
 
+        # PDF exports running in the background
+        self.pdf_jobs = set()
+
+        # wkhtmltopdf-path of the last PDF export, its lookup is dropped when the setting changes
+        self.wkhtmltopdf_path = None
+
+        # On-disk cache of exported files, keyed by their content
+        self.export_cache = None
+        if settings_manager is not None and settings_manager.is_export_cache_enabled():
+            self.export_cache = ExportCache(max_size=settings_manager.get_export_cache_size())
+
+        # Resizes and inlines images for PDF export, created on the first PDF export
+        self.image_downscaler = None
+        self._image_downscaler_loaded = False
+
         # Callback for setting window sensitivity during exports
         self.window_sensitivity_callback = None
 
+    def set_file_manager(self, file_manager):
+        """
+        Set the FileManager of the document to export, e.g. when the current tab changes
+
+        Args:
+            file_manager: FileManager instance for file path operations
+        """
+        self.file_manager = file_manager
+
     def set_window_sensitivity_callback(self, callback):
         """
         Set callback to control window sensitivity during export operations
@@ -82,6 +87,21 @@ class ExportManager:
         if self.window_sensitivity_callback:
             self.window_sensitivity_callback(sensitive)
 
+    def _get_buffer_text(self, text_buffer):
+        """
+        Get the text of a buffer, reusing the shared snapshot of the current document
+
+        Args:
+            text_buffer: GTK text buffer containing markdown content
+
+        Returns:
+            str: Buffer content
+        """
+        if text_buffer is self.file_manager.text_buffer:
+            return self.file_manager.get_text_content()
+        start, end = text_buffer.get_bounds()
+        return text_buffer.get_text(start, end, False)
+
     def _convert_markdown_to_html(self, text):
         """
         Convert markdown text to HTML with fallback extension handling
@@ -92,13 +112,19 @@ class ExportManager:
         Returns:
             str: Converted HTML
         """
-        try:
-            return markdown.markdown(text, self.default_extensions)
-        except:
-            try:
-                return markdown.markdown(text, extensions=self.safe_extensions)
-            except:
-                return markdown.markdown(text)
+        return self.markdown_renderer.convert(text)
+
+    def _build_styled_html(self, html_middle):
+        """
+        Wrap converted HTML in the styled document, loading MathJax only when needed
+
+        Args:
+            html_middle (str): Converted HTML body
+
+        Returns:
+            str: Complete HTML document
+        """
+        return export_pipeline.build_styled_html(self.style_manager, html_middle)
 
     def _process_image_paths_for_pdf(self, text, current_file_path):
         """
@@ -111,15 +137,7 @@ class ExportManager:
         Returns:
             str: Text with processed image paths
         """
-        if current_file_path == "Untitled":
-            return text
-
-        dirname = os.path.dirname(current_file_path)
-        return re.sub(
-            r'(\!\[.*?\]\()([^/][^:]*?\))',
-            lambda m, dirname=dirname: m.group(1) + os.path.join(dirname, m.group(2)),
-            text
-        )
+        return export_pipeline.process_image_paths(text, current_file_path)
 
     def export_html_styled(self, text_buffer, parent_window=None):
         """
@@ -133,12 +151,11 @@ class ExportManager:
 
         try:
             # Get text from buffer
-            start, end = text_buffer.get_bounds()
-            text = text_buffer.get_text(start, end, False)
+            text = self._get_buffer_text(text_buffer)
 
             # Convert to HTML
             html_middle = self._convert_markdown_to_html(text)
-            html = self.style_manager.get_html_head_style() + html_middle + self.default_html_end
+            html = self._build_styled_html(html_middle)
 
             # Save HTML
             self._save_html_file(html, parent_window)
@@ -157,8 +174,7 @@ class ExportManager:
 
         try:
             # Get text from buffer
-            start, end = text_buffer.get_bounds()
-            text = text_buffer.get_text(start, end, False)
+            text = self._get_buffer_text(text_buffer)
 
             # Convert to HTML (plain, no styling)
             html = self._convert_markdown_to_html(text)
@@ -176,25 +192,19 @@ class ExportManager:
             text_buffer: GTK text buffer containing markdown content
             parent_window: Parent window for dialog (optional)
         """
-        self._set_window_sensitive(False)
+        # Get text from buffer
+        text = self._get_buffer_text(text_buffer)
 
-        try:
-            # Get text from buffer
-            start, end = text_buffer.get_bounds()
-            text = text_buffer.get_text(start, end, False)
+        # Process image paths for PDF
+        current_file_path = self.file_manager.get_current_file_path()
+        text = self._process_image_paths_for_pdf(text, current_file_path)
 
-            # Process image paths for PDF
-            current_file_path = self.file_manager.get_current_file_path()
-            text = self._process_image_paths_for_pdf(text, current_file_path)
+        # Convert to HTML, images are resized to the page by the background export
+        html_middle = self._convert_markdown_to_html(text)
+        image_stats = export_pipeline.get_image_stats(html_middle)
 
-            # Convert to HTML
-            html_middle = self._convert_markdown_to_html(text)
-            html = self.style_manager.get_html_head_style() + html_middle + self.default_html_end
-
-            # Save PDF
-            self._save_pdf_file(html, parent_window)
-        finally:
-            self._set_window_sensitive(True)
+        # Save PDF, generated in the background
+        self._save_pdf_file(html_middle, True, parent_window, image_stats)
 
     def export_pdf_plain(self, text_buffer, parent_window=None):
         """
@@ -204,20 +214,19 @@ class ExportManager:
             text_buffer: GTK text buffer containing markdown content
             parent_window: Parent window for dialog (optional)
         """
-        self._set_window_sensitive(False)
+        # Get text from buffer
+        text = self._get_buffer_text(text_buffer)
 
-        try:
-            # Get text from buffer
-            start, end = text_buffer.get_bounds()
-            text = text_buffer.get_text(start, end, False)
+        # Process image paths for PDF
+        current_file_path = self.file_manager.get_current_file_path()
+        text = self._process_image_paths_for_pdf(text, current_file_path)
 
-            # Convert to HTML (plain, no styling)
-            html = self._convert_markdown_to_html(text)
+        # Convert to HTML (plain, no styling), images are resized to the page by the background export
+        html = self._convert_markdown_to_html(text)
+        image_stats = export_pipeline.get_image_stats(html)
 
-            # Save PDF
-            self._save_pdf_file(html, parent_window)
-        finally:
-            self._set_window_sensitive(True)
+        # Save PDF, generated in the background
+        self._save_pdf_file(html, False, parent_window, image_stats)
 
     def _save_html_file(self, html_content, parent_window=None):
         """
@@ -251,21 +260,28 @@ class ExportManager:
                 if not file_name.endswith(".html"):
                     file_name += ".html"
 
-                # Use BeautifulSoup to prettify HTML
-                soup = BeautifulSoup(html_content, "lxml")
-
-                with open(file_name, 'w', encoding='utf-8') as f:
-                    f.write(soup.prettify())
+                prettify = self.settings_manager.is_prettify_html_enabled() if self.settings_manager else True
+                key = None
+                if self.export_cache is not None:
+                    key = ExportCache.make_key(html=html_content, format='html', prettify=prettify)
+                    if self.export_cache.get(key, file_name):
+                        return
+                export_pipeline.write_html(html_content, file_name, prettify)
+                if key is not None:
+                    self.export_cache.put(key, file_name)
+                    self.export_cache.evict()
         finally:
             chooser.destroy()
 
-    def _save_pdf_file(self, html_content, parent_window=None):
+    def _save_pdf_file(self, html_body, styled, parent_window=None, image_stats=None):
         """
         Show file chooser dialog and save HTML content as PDF
 
         Args:
-            html_content (str): HTML content to convert to PDF
+            html_body (str): Converted HTML body, with absolute image paths
+            styled (bool): Wrap the body in the styled document
             parent_window: Parent window for dialog (optional)
+            image_stats (list): Image files of the document from export_pipeline.get_image_stats (optional)
         """
         chooser = Gtk.FileChooserDialog(
             "Export PDF", parent_window, Gtk.FileChooserAction.SAVE,
@@ -290,39 +306,191 @@ class ExportManager:
                 if not file_name.endswith(".pdf"):
                     file_name += ".pdf"
 
-                self._generate_pdf(html_content, file_name, parent_window)
+                self._generate_pdf(html_body, styled, file_name, parent_window, image_stats)
         finally:
             chooser.destroy()
 
-    def _generate_pdf(self, html_content, file_path, parent_window=None):
+    def _generate_pdf(self, html_body, styled, file_path, parent_window=None, image_stats=None):
         """
-        Generate PDF from HTML content with error handling
+        Start generating a PDF from HTML content in the background
+
+        The editor stays usable while wkhtmltopdf is looked up and probed,
+        the images are resized and wkhtmltopdf runs; a progress dialog
+        offers to cancel the export. Images are only resized once the
+        export cache missed.
 
         Args:
-            html_content (str): HTML content to convert
+            html_body (str): Converted HTML body, with absolute image paths
+            styled (bool): Wrap the body in the styled document
             file_path (str): Output PDF file path
-            parent_window: Parent window for error dialog (optional)
+            parent_window: Parent window for the progress and error dialogs (optional)
+            image_stats (list): Image files of the document, part of the cache key (optional)
         """
-        try:
-            # Try with full options first
-            pdfkit.from_string(html_content, file_path, options={
-                'quiet': '',
-                'page-size': 'Letter',
-                'margin-top': '0.75in',
-                'margin-right': '0.75in',
-                'margin-bottom': '0.75in',
-                'margin-left': '0.75in',
-                'encoding': "UTF-8",
-                'javascript-delay': '550',
-                'no-outline': None
-            })
-        except:
-            try:
-                # Failed, try with no options
-                pdfkit.from_string(html_content, file_path)
-            except:
-                # PDF Export failed completely
+        dialog, progress_bar = self._create_pdf_progress_dialog(file_path, parent_window)
+        job = None
+        cancelled = False
+
+        def on_progress(fraction, stage):
+            progress_bar.set_fraction(fraction)
+            progress_bar.set_text(stage)
+
+        def on_response(dialog, response):
+            nonlocal cancelled
+            if job is not None:
+                job.cancel()  # Its finished callback closes the dialog
+            else:
+                cancelled = True
+                dialog.destroy()
+
+        def get_html_chunks(body):
+            if styled:
+                return export_pipeline.build_styled_html_chunks(self.style_manager, body)
+            return [body]
+
+        def on_configuration(configuration, error):
+            if cancelled:
+                return
+            if configuration is None:
+                logger.error(f"wkhtmltopdf not found: {error}")
+                dialog.destroy()
                 self._show_pdf_error_dialog(parent_window)
+                return
+
+            options = export_pipeline.get_pdf_options(self.style_manager, html_body, configuration)
+
+            downscaler = self._get_image_downscaler()
+
+            # Unchanged documents are copied from the export cache without resizing images or running wkhtmltopdf
+            key = None
+            if self.export_cache is not None:
+                # Images are inlined after the lookup, so their files and the resize width are part of the key
+                key = ExportCache.make_key(html=export_pipeline.get_html_digest(get_html_chunks(html_body)),
+                                           format='pdf', options=options,
+                                           wkhtmltopdf=[configuration.wkhtmltopdf,
+                                                        configuration.get_capabilities().version],
+                                           images=image_stats or [],
+                                           image_width=downscaler.max_width if downscaler else None)
+                if self.export_cache.get(key, file_path):
+                    logger.info(f"PDF export served from cache: {self.export_cache.get_stats()}")
+                    dialog.destroy()
+                    return
+
+            if not image_stats or downscaler is None:
+                start_job(html_body, configuration, options, key)
+                return
+
+            # Resizing and base64 encoding large images takes long, so it runs on a worker thread
+            def inline():
+                try:
+                    body = export_pipeline.inline_images(html_body, downscaler)
+                except Exception as e:
+                    logger.warning(f"Could not resize the images, exporting them unchanged: {e}")
+                    body = html_body
+                GLib.idle_add(on_inlined, body)
+
+            def on_inlined(body):
+                if not cancelled:
+                    start_job(body, configuration, options, key)
+                return False
+
+            on_progress(0.0, "Resizing images")
+            threading.Thread(target=inline, daemon=True).start()
+
+        def start_job(body, configuration, options, key):
+            nonlocal job
+
+            def on_finished(success, error_output):
+                self.pdf_jobs.discard(job)
+                dialog.destroy()
+                if success and key is not None:
+                    self.export_cache.put(key, file_path)
+                    self.export_cache.evict()
+                if not success and not job.cancelled:
+                    self._show_pdf_error_dialog(parent_window)
+
+            from PdfExportJob import PdfExportJob
+            job = PdfExportJob(get_html_chunks(body), file_path, options, on_progress, on_finished, configuration)
+            self.pdf_jobs.add(job)
+            job.start()
+
+        dialog.connect("response", on_response)
+        progress_bar.set_text("Looking for wkhtmltopdf")
+        dialog.show_all()
+        self._resolve_pdf_configuration(on_configuration)
+
+    def _resolve_pdf_configuration(self, callback):
+        """
+        Look up and probe wkhtmltopdf on a worker thread
+
+        The lookup runs `which` and the first probe runs wkhtmltopdf twice,
+        so neither is done on the main loop. The memoized lookup is dropped
+        when the wkhtmltopdf-path setting changed since the last export.
+
+        Args:
+            callback: Called on the main loop with (configuration, None), or
+                (None, error) if wkhtmltopdf cannot be found
+        """
+        import pdfkit_local as pdfkit
+        path = self.settings_manager.get_wkhtmltopdf_path() if self.settings_manager else ""
+        if path != self.wkhtmltopdf_path:
+            if self.wkhtmltopdf_path is not None:
+                pdfkit.invalidate_configuration(self.wkhtmltopdf_path)
+                pdfkit.invalidate_configuration(path)
+            self.wkhtmltopdf_path = path
+
+        def resolve():
+            try:
+                configuration = pdfkit.get_configuration(path)
+                configuration.get_capabilities()
+            except OSError as e:
+                GLib.idle_add(callback, None, e)
+                return
+            GLib.idle_add(callback, configuration, None)
+
+        threading.Thread(target=resolve, daemon=True).start()
+
+    def _get_image_downscaler(self):
+        """
+        Get the image downscaler, created on first use so GdkPixbuf is not loaded at start-up
+
+        Returns:
+            ImageDownscaler, or None when downscaling is off or unavailable
+        """
+        if not self._image_downscaler_loaded and self.settings_manager is not None:
+            from ImageDownscaler import ImageDownscaler
+            self.image_downscaler = ImageDownscaler.from_settings(
+                self.settings_manager, export_pipeline.get_printable_width(export_pipeline.PDF_OPTIONS))
+            self._image_downscaler_loaded = True
+        return self.image_downscaler
+
+    def _create_pdf_progress_dialog(self, file_path, parent_window=None):
+        """
+        Create the non-modal progress dialog of a PDF export
+
+        Args:
+            file_path (str): Output PDF file path
+            parent_window: Parent window for the dialog (optional)
+
+        Returns:
+            tuple: (dialog, progress_bar)
+        """
+        dialog = Gtk.Dialog(title="Exporting PDF", transient_for=parent_window, modal=False)
+        dialog.add_button(Gtk.STOCK_CANCEL, Gtk.ResponseType.CANCEL)
+        dialog.set_default_size(360, -1)
+
+        box = dialog.get_content_area()
+        box.set_spacing(6)
+        box.set_border_width(12)
+        box.add(Gtk.Label(label=os.path.basename(file_path), xalign=0))
+        progress_bar = Gtk.ProgressBar(show_text=True)
+        progress_bar.set_text("Starting")
+        box.add(progress_bar)
+        return dialog, progress_bar
+
+    def cancel_pdf_exports(self):
+        """Cancel all running PDF exports"""
+        for job in list(self.pdf_jobs):
+            job.cancel()
 
     def _show_pdf_error_dialog(self, parent_window=None):
         """
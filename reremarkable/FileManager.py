@@ -1,8 +1,6 @@
 
 import logging
 import os
-import subprocess
-import sys
 
 from gi.repository import Gtk
 
@@ -11,16 +9,27 @@ logger = logging.getLogger('reremarkable')
 class FileManager:
     """Handles file operations for the markdown editor"""
 
-    def __init__(self, window, text_buffer):
+    def __init__(self, window, text_buffer, buffer_snapshot=None):
         self.window = window
         self.text_buffer = text_buffer
+        self.buffer_snapshot = buffer_snapshot
         self.current_file_path = "Untitled"
         self.recent_files_callback = None
+        self.new_tab_callback = None
+        self.title_callback = None
 
     def set_recent_files_callback(self, callback):
-        """Set callback function for managing recent files"""
+        """Set callback function for managing recent files, called with the path and opened=False on saves"""
         self.recent_files_callback = callback
 
+    def set_title_callback(self, callback):
+        """Set callback function updating the window title after a file is loaded or saved"""
+        self.title_callback = callback
+
+    def set_new_tab_callback(self, callback):
+        """Set callback function opening a file path (or None for a new file) in a new tab"""
+        self.new_tab_callback = callback
+
     def get_current_file_path(self):
         """Get the current file path"""
         return self.current_file_path
@@ -37,6 +46,8 @@ class FileManager:
 
     def get_text_content(self):
         """Get all text content from the buffer"""
+        if self.buffer_snapshot is not None:
+            return self.buffer_snapshot.get_text()
         return self.text_buffer.get_text(
             self.text_buffer.get_start_iter(),
             self.text_buffer.get_end_iter(),
@@ -49,9 +60,7 @@ class FileManager:
 
     def is_buffer_empty(self):
         """Check if the text buffer is empty"""
-        start, end = self.text_buffer.get_bounds()
-        text = self.text_buffer.get_text(start, end, False)
-        return len(text) == 0
+        return self.text_buffer.get_char_count() == 0
 
     def set_file_chooser_path(self, chooser):
         """Set the default path for file chooser dialogs"""
@@ -97,13 +106,12 @@ class FileManager:
         else:  # CANCEL or dialog closed
             return 'cancel'
 
-    def load_file(self, file_path, title_callback=None):
+    def load_file(self, file_path):
         """
         Load a file into the text buffer.
 
         Args:
             file_path: Path to the file to load
-            title_callback: Optional callback to update window title
         """
         try:
             self.text_buffer.begin_not_undoable_action()
@@ -117,9 +125,9 @@ class FileManager:
             self.text_buffer.end_not_undoable_action()
 
             # Update window title if callback provided
-            if title_callback:
+            if self.title_callback:
                 filename = os.path.basename(file_path)
-                title_callback(f"reRemarkable: {filename}")
+                self.title_callback(f"reRemarkable: {filename}")
 
             # Add to recent files
             if self.recent_files_callback:
@@ -132,18 +140,15 @@ class FileManager:
             self._show_error_dialog("File Load Error", f"Could not load file: {e}")
             return False
 
-    def save_file(self, title_callback=None):
+    def save_file(self):
         """
         Save the current file.
 
-        Args:
-            title_callback: Optional callback to update window title
-
         Returns:
             True if saved successfully, False otherwise
         """
         if self.current_file_path == "Untitled":
-            return self.save_file_as(title_callback)
+            return self.save_file_as()
 
         try:
             text = self.get_text_content()
@@ -154,13 +159,13 @@ class FileManager:
             self.text_buffer.set_modified(False)
 
             # Update window title if callback provided
-            if title_callback:
+            if self.title_callback:
                 filename = os.path.basename(self.current_file_path)
-                title_callback(f"reRemarkable: {filename}")
+                self.title_callback(f"reRemarkable: {filename}")
 
             # Add to recent files
             if self.recent_files_callback:
-                self.recent_files_callback(self.current_file_path)
+                self.recent_files_callback(self.current_file_path, opened=False)
 
             return True
 
@@ -169,13 +174,10 @@ class FileManager:
             self._show_error_dialog("File Save Error", f"Could not save file: {e}")
             return False
 
-    def save_file_as(self, title_callback=None):
+    def save_file_as(self):
         """
         Save the current file with a new name using a file chooser dialog.
 
-        Args:
-            title_callback: Optional callback to update window title
-
         Returns:
             True if saved successfully, False if cancelled or failed
         """
@@ -212,13 +214,13 @@ class FileManager:
                 self.text_buffer.set_modified(False)
 
                 # Update window title if callback provided
-                if title_callback:
+                if self.title_callback:
                     filename = os.path.basename(new_path)
-                    title_callback(f"reRemarkable: {filename}")
+                    self.title_callback(f"reRemarkable: {filename}")
 
                 # Add to recent files
                 if self.recent_files_callback:
-                    self.recent_files_callback(new_path)
+                    self.recent_files_callback(new_path, opened=False)
 
                 saved = True
 
@@ -230,26 +232,23 @@ class FileManager:
         self.window.set_sensitive(True)
         return saved
 
-    def open_file_dialog(self, title_callback=None):
+    def open_file_dialog(self):
         """
         Show file open dialog and handle the selected file.
 
-        Args:
-            title_callback: Optional callback to update window title
-
         Returns:
             True if file was opened, False otherwise
         """
         # Check if current buffer has content
         if not self.is_buffer_empty() or self.is_buffer_modified():
-            # Open in new window if current buffer has content
-            return self._open_file_dialog_new_window()
+            # Open in new tab if current buffer has content
+            return self._open_file_dialog_new_tab()
         else:
-            # Load in current window if empty
-            return self._open_file_dialog_current_window(title_callback)
+            # Load in current tab if empty
+            return self._open_file_dialog_current_tab()
 
-    def _open_file_dialog_current_window(self, title_callback=None):
-        """Open file dialog and load file in current window"""
+    def _open_file_dialog_current_tab(self):
+        """Open file dialog and load file in current tab"""
         self.window.set_sensitive(False)
 
         chooser = Gtk.FileChooserDialog(
@@ -267,14 +266,14 @@ class FileManager:
         file_opened = False
         if response == Gtk.ResponseType.OK:
             selected_file = chooser.get_filename()
-            file_opened = self.load_file(selected_file, title_callback)
+            file_opened = self.load_file(selected_file)
 
         chooser.destroy()
         self.window.set_sensitive(True)
         return file_opened
 
-    def _open_file_dialog_new_window(self):
-        """Open file dialog and load file in new window"""
+    def _open_file_dialog_new_tab(self):
+        """Open file dialog and load file in new tab"""
         self.window.set_sensitive(False)
 
         chooser = Gtk.FileChooserDialog(
@@ -292,25 +291,23 @@ class FileManager:
         file_opened = False
         if response == Gtk.ResponseType.OK:
             selected_file = chooser.get_filename()
-            # Launch new instance with the selected file
-            subprocess.Popen([sys.argv[0], selected_file])
-            file_opened = True
+            # Open in a tab of this window, in the same process
+            if self.new_tab_callback:
+                file_opened = self.new_tab_callback(selected_file)
 
         chooser.destroy()
         self.window.set_sensitive(True)
         return file_opened
 
     def new_file(self):
-        """Create a new file by launching a new instance of the application"""
-        subprocess.Popen(sys.argv[0])
+        """Create a new file in a new tab"""
+        if self.new_tab_callback:
+            self.new_tab_callback(None)
 
-    def can_close_safely(self, title_callback=None):
+    def can_close_safely(self):
         """
         Check if the window can be closed safely, prompting for save if needed.
 
-        Args:
-            title_callback: Optional callback to update window title
-
         Returns:
             True if safe to close, False if user cancelled
         """
@@ -319,7 +316,7 @@ class FileManager:
 
             if response == 'save':
                 # User wants to save - attempt to save the file
-                return self.save_file(title_callback)
+                return self.save_file()
             elif response == 'dont_save':
                 # User doesn't want to save - proceed with closing
                 return True
@@ -0,0 +1,189 @@
+import re
+from html import escape
+from html.parser import HTMLParser
+
+# Tags placed on their own, indented line
+BLOCK_TAGS = frozenset([
+    'address', 'article', 'aside', 'base', 'blockquote', 'body', 'dd', 'details', 'dialog', 'div',
+    'dl', 'dt', 'fieldset', 'figcaption', 'figure', 'footer', 'form', 'h1', 'h2', 'h3', 'h4', 'h5',
+    'h6', 'head', 'header', 'hr', 'html', 'li', 'link', 'main', 'meta', 'nav', 'ol', 'p', 'section',
+    'summary', 'table', 'tbody', 'td', 'tfoot', 'th', 'thead', 'title', 'tr', 'ul'
+])
+
+# Tags without an end tag
+VOID_TAGS = frozenset([
+    'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link', 'meta', 'source', 'track', 'wbr'
+])
+
+# Tags whose content is whitespace sensitive and written unchanged
+RAW_TAGS = frozenset(['pre', 'script', 'style', 'textarea'])
+
+# Raw tags whose content the parser does not unescape
+CDATA_TAGS = frozenset(['script', 'style'])
+
+# Inline tags whose whitespace is kept, stylesheets may preserve it (e.g. white-space: break-spaces)
+PRESERVE_TAGS = frozenset(['code', 'kbd', 'samp', 'tt'])
+
+# HTML whitespace, a non-breaking space is content
+WHITESPACE_RE = re.compile(r'[ \t\n\r\f]+')
+
+class HtmlPrettyPrinter(HTMLParser):
+    """
+    Streaming HTML pretty-printer:
+    - Block-level tags go on their own lines, indented by nesting depth
+    - Inline content is kept on one line with collapsed whitespace, so the
+      rendered document does not change; whitespace inside code, kbd, samp
+      and tt is kept
+    - pre, script, style and textarea content is written unchanged
+    - Text is unescaped by the parser and escaped again on output, so bare
+      ampersands come out as &amp; instead of being turned into entities
+    - Output is written to a file object in chunks while parsing, instead
+      of building a document tree first
+    """
+
+    CHUNK_SIZE = 64 * 1024
+
+    def __init__(self, output, indent='  '):
+        """
+        Initialize the HtmlPrettyPrinter
+
+        Args:
+            output: Writable text file object
+            indent (str): Indentation per nesting level
+        """
+        super().__init__(convert_charrefs=True)
+        self.output = output
+        self.indent = indent
+        self.depth = 0
+        self.raw_tag = None  # Tag whose content is copied unchanged
+        self.raw_nesting = 0
+        self.preserve_depth = 0  # Open PRESERVE_TAGS around the current text
+        self._line = []  # Inline content of the current line
+        self._pending = []  # Formatted output not yet written
+        self._pending_size = 0
+
+    def format(self, html_content):
+        """
+        Pretty-print a complete HTML document to the output
+
+        Args:
+            html_content (str): HTML to format
+        """
+        for start in range(0, len(html_content), self.CHUNK_SIZE):
+            self.feed(html_content[start:start + self.CHUNK_SIZE])
+        self.close()
+
+    def close(self):
+        super().close()
+        self._flush_line()
+        self._flush_output()
+
+    def _write(self, text):
+        self._pending.append(text)
+        self._pending_size += len(text)
+        if self._pending_size >= self.CHUNK_SIZE:
+            self._flush_output()
+
+    def _flush_output(self):
+        if self._pending:
+            self.output.write(''.join(self._pending))
+            self._pending = []
+            self._pending_size = 0
+
+    def _flush_line(self):
+        """Write the collected inline content as one indented line"""
+        line = ''.join(self._line).strip()
+        self._line = []
+        if line:
+            self._write(self.indent * self.depth + line + '\n')
+
+    def _inline(self, text):
+        if self.raw_tag is not None:
+            self._write(text)
+        else:
+            self._line.append(text)
+
+    def handle_starttag(self, tag, attrs):
+        text = self.get_starttag_text()
+        if self.raw_tag is not None:
+            if tag == self.raw_tag:
+                self.raw_nesting += 1
+            self._write(text)
+        elif tag in RAW_TAGS:
+            self._flush_line()
+            self._write(self.indent * self.depth + text)
+            self.raw_tag = tag
+            self.raw_nesting = 1
+        elif tag in BLOCK_TAGS:
+            self._flush_line()
+            self._write(self.indent * self.depth + text + '\n')
+            if tag not in VOID_TAGS:
+                self.depth += 1
+        else:
+            if tag in PRESERVE_TAGS:
+                self.preserve_depth += 1
+            self._line.append(text)
+
+    def handle_startendtag(self, tag, attrs):
+        text = self.get_starttag_text()
+        if self.raw_tag is None and tag in BLOCK_TAGS:
+            self._flush_line()
+            self._write(self.indent * self.depth + text + '\n')
+        else:
+            self._inline(text)
+
+    def handle_endtag(self, tag):
+        text = f'</{tag}>'
+        if self.raw_tag is not None:
+            self._write(text)
+            if tag == self.raw_tag:
+                self.raw_nesting -= 1
+                if self.raw_nesting == 0:
+                    self.raw_tag = None
+                    self._write('\n')
+        elif tag in BLOCK_TAGS:
+            self._flush_line()
+            self.depth = max(0, self.depth - 1)
+            self._write(self.indent * self.depth + text + '\n')
+        elif tag not in VOID_TAGS:
+            if tag in PRESERVE_TAGS and self.preserve_depth:
+                self.preserve_depth -= 1
+            self._line.append(text)
+
+    def handle_data(self, data):
+        if self.raw_tag in CDATA_TAGS:
+            self._write(data)
+        elif self.raw_tag is not None:
+            self._write(escape(data, quote=False))
+        elif self.preserve_depth:
+            self._line.append(escape(data, quote=False))
+        else:
+            self._line.append(WHITESPACE_RE.sub(' ', escape(data, quote=False)))
+
+    def handle_comment(self, data):
+        self._inline(f'<!--{data}-->')
+
+    def handle_decl(self, decl):
+        self._flush_line()
+        self._write(f'<!{decl}>\n')
+
+    def handle_pi(self, data):
+        self._inline(f'<?{data}>')
+
+    def unknown_decl(self, data):
+        self._inline(f'<![{data}]>')
+
+def write_html(html_content, output, prettify=True):
+    """
+    Write an HTML document to a file object in chunks
+
+    Args:
+        html_content (str): HTML to write
+        output: Writable text file object
+        prettify (bool): Indent block-level tags, or write the HTML unchanged
+    """
+    if prettify:
+        HtmlPrettyPrinter(output).format(html_content)
+        return
+    for start in range(0, len(html_content), HtmlPrettyPrinter.CHUNK_SIZE):
+        output.write(html_content[start:start + HtmlPrettyPrinter.CHUNK_SIZE])
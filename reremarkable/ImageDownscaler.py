@@ -0,0 +1,183 @@
+import base64
+import logging
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import unquote
+
+from ExportCache import ExportCache, get_cache_dir
+
+logger = logging.getLogger('reremarkable')
+
+# Image tags as produced by python-markdown and raw HTML with double quoted src
+IMG_SRC_RE = re.compile(r'(<img\b[^>]*?\bsrc=")([^"]+)(")')
+
+def get_local_images(html_content):
+    """
+    Find the local files referenced by image tags
+
+    Args:
+        html_content (str): HTML with absolute image paths
+
+    Returns:
+        dict: Image src -> file path, for file:// URLs and absolute paths
+    """
+    paths = {}
+    for match in IMG_SRC_RE.finditer(html_content):
+        src = match.group(2)
+        if src.startswith('file://'):
+            paths[src] = unquote(src[len('file://'):])
+        elif os.path.isabs(src):
+            paths[src] = src
+    return paths
+
+class ImageDownscaler:
+    """
+    Shrinks the images of a document for PDF export:
+    - Images wider than the printable width at the target DPI are scaled
+      down with GdkPixbuf; smaller images are used as they are
+    - Resized images are cached on disk by (path, mtime, size, width), so
+      an unchanged image is only resized once
+    - The images of a document are loaded in parallel on a thread pool and
+      inlined into the HTML as data URIs, so wkhtmltopdf does not load the
+      full resolution files
+    - GdkPixbuf is optional; without it image references are left unchanged
+    """
+
+    # Formats written back after resizing, with their save options
+    SAVE_FORMATS = {
+        'png': ('image/png', [], []),
+        'jpeg': ('image/jpeg', ['quality'], ['90']),
+    }
+
+    def __init__(self, max_width, cache=None, max_workers=4):
+        """
+        Initialize the ImageDownscaler
+
+        Args:
+            max_width (int): Widest image in pixels, the printable width times the DPI
+            cache (ExportCache): Cache of resized images, None to resize every time
+            max_workers (int): Maximum number of images processed at once
+        """
+        self.max_width = max_width
+        self.cache = cache
+        self.max_workers = max_workers
+        self.stored = 0  # Resized images added to the cache
+
+    @staticmethod
+    def is_available():
+        """Check if GdkPixbuf can be loaded"""
+        try:
+            import gi
+            gi.require_version('GdkPixbuf', '2.0')
+            from gi.repository import GdkPixbuf  # noqa: F401
+            return True
+        except (ImportError, ValueError):
+            return False
+
+    @classmethod
+    def from_settings(cls, settings_manager, max_width_in):
+        """
+        Create a downscaler for the configured image DPI
+
+        Args:
+            settings_manager: SettingsManager with the pdf-image-dpi and export cache settings
+            max_width_in (float): Printable page width in inches
+
+        Returns:
+            ImageDownscaler, or None when downscaling is off or GdkPixbuf is missing
+        """
+        dpi = settings_manager.get_pdf_image_dpi()
+        if dpi <= 0:
+            return None
+        if not cls.is_available():
+            logger.warning("GdkPixbuf is not available, images are exported at full size")
+            return None
+        cache = None
+        if settings_manager.is_export_cache_enabled():
+            cache = ExportCache(get_cache_dir('images'), settings_manager.get_export_cache_size())
+        return cls(int(max_width_in * dpi), cache)
+
+    def get_image(self, path):
+        """
+        Get an image sized for the page
+
+        Args:
+            path (str): Image file
+
+        Returns:
+            tuple: (mime type, image data), or None if the image cannot be used
+        """
+        from gi.repository import GdkPixbuf, GLib
+
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        info, width, _height = GdkPixbuf.Pixbuf.get_file_info(path)
+        if info is None:
+            return None
+        format_name = info.get_name()
+
+        if width <= self.max_width or format_name not in self.SAVE_FORMATS:
+            # Small enough, or a format that is not resized (e.g. SVG or GIF)
+            mime_types = info.get_mime_types()
+            if not mime_types:
+                return None
+            try:
+                with open(path, 'rb') as f:
+                    return mime_types[0], f.read()
+            except OSError:
+                return None
+
+        mime_type, option_keys, option_values = self.SAVE_FORMATS[format_name]
+        key = None
+        if self.cache is not None:
+            key = ExportCache.make_key(path=path, mtime=stat.st_mtime_ns, size=stat.st_size, width=self.max_width)
+            data = self.cache.get_data(key)
+            if data is not None:
+                return mime_type, data
+
+        try:
+            # Decoded straight to the smaller size, the full image is never held in memory
+            pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_scale(path, self.max_width, -1, True)
+            pixbuf = pixbuf.apply_embedded_orientation() or pixbuf
+            _success, data = pixbuf.save_to_bufferv(format_name, option_keys, option_values)
+        except GLib.Error as e:
+            logger.warning(f"Could not resize image {path}: {e}")
+            return None
+
+        if key is not None:
+            self.cache.put_data(key, data)
+            self.stored += 1
+        return mime_type, data
+
+    def inline_images(self, html_content):
+        """
+        Replace local image references with resized, inlined images
+
+        Args:
+            html_content (str): HTML with absolute image paths
+
+        Returns:
+            str: HTML with data URIs for the images that could be loaded
+        """
+        paths = get_local_images(html_content)
+        if not paths:
+            return html_content
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(paths))) as executor:
+            images = dict(zip(paths, executor.map(self.get_image, paths.values())))
+
+        data_uris = {}
+        for src, image in images.items():
+            if image is not None:
+                mime_type, data = image
+                data_uris[src] = f"data:{mime_type};base64,{base64.b64encode(data).decode('ascii')}"
+
+        if self.cache is not None and self.stored:
+            self.cache.evict()
+            self.stored = 0
+
+        return IMG_SRC_RE.sub(lambda m: m.group(1) + data_uris.get(m.group(2), m.group(2)) + m.group(3),
+                              html_content)
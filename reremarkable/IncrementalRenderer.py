@@ -0,0 +1,287 @@
+import hashlib
+import logging
+import re
+from collections import OrderedDict, namedtuple
+
+from HtmlPrettyPrinter import VOID_TAGS
+
+logger = logging.getLogger('reremarkable')
+
+# A rendered top-level block: content hash, first source line (0-based) and HTML
+Block = namedtuple('Block', ['key', 'line', 'html'])
+
+FENCE_RE = re.compile(r'^ {0,3}(`{3,}|~{3,})')
+LIST_ITEM_RE = re.compile(r'^ {0,3}([*+-]|\d+[.)])\s')
+ATX_HEADING_RE = re.compile(r'^ {0,3}#{1,6}\s+(.*?)[\s#]*$')
+SETEXT_UNDERLINE_RE = re.compile(r'^ {0,3}(=+|-+)\s*$')
+
+# Constructs whose meaning depends on other blocks of the document
+CROSS_BLOCK_RE = re.compile(
+    r'^ {0,3}\[[^\]]+\]:'       # reference link definitions and footnotes
+    r'|\[\^[^\]]+\]'            # footnote references
+    r'|^\*\[[^\]]+\]:'          # abbreviations
+    r'|^\s*\[TOC\]\s*$'         # table of contents marker
+    r'|^ {0,3}<',               # raw HTML blocks, which may span blank lines
+    re.MULTILINE
+)
+
+# Raw HTML block starts, the only source of tags that may stay open across blocks
+RAW_HTML_RE = re.compile(r'^ {0,3}<', re.MULTILINE)
+
+# Source line marker put in front of every block of a full render, passed through as a raw HTML comment
+LINE_MARKER = '<!--reremarkable-line:{}-->'
+LINE_MARKER_RE = re.compile(r'<!--reremarkable-line:(\d+)-->(?:\n\n)?')
+
+TAG_RE = re.compile(r'<(/?)([a-zA-Z][\w:-]*)[^>]*?(/?)>')
+
+def split_blocks(text):
+    """
+    Split markdown text into top-level blocks separated by blank lines
+
+    Fenced code is never split, and blank lines followed by indented lines,
+    further list items, quotes or definitions keep the surrounding block
+    together, so every split point is a real block boundary.
+
+    Args:
+        text (str): Markdown text
+
+    Returns:
+        list: (first_line, block_text) tuples
+    """
+    lines = text.split('\n')
+    blocks = []
+    current = []
+    start = 0
+    fence = None
+    is_list = False
+    is_quote = False
+
+    i = 0
+    while i < len(lines):
+        line = lines[i]
+
+        if fence is not None:
+            current.append(line)
+            match = FENCE_RE.match(line)
+            if match and match.group(1)[0] == fence[0] and len(match.group(1)) >= len(fence) \
+                    and not line.strip()[len(match.group(1)):]:
+                fence = None
+            i += 1
+            continue
+
+        if not line.strip():
+            # Look past the blank lines to decide if the block continues
+            j = i
+            while j < len(lines) and not lines[j].strip():
+                j += 1
+            following = lines[j] if j < len(lines) else None
+
+            continues = following is not None and current and (
+                following[0] in ' \t'
+                or (is_list and LIST_ITEM_RE.match(following))
+                or (is_quote and following.lstrip().startswith('>'))
+                or following.startswith(':')
+            )
+            if continues:
+                current.extend(lines[i:j])
+            else:
+                if current:
+                    blocks.append((start, '\n'.join(current)))
+                current = []
+                is_list = is_quote = False
+            i = j
+            continue
+
+        if not current:
+            start = i
+            is_list = bool(LIST_ITEM_RE.match(line))
+            is_quote = line.lstrip().startswith('>')
+
+        match = FENCE_RE.match(line)
+        if match:
+            fence = match.group(1)
+
+        current.append(line)
+        i += 1
+
+    if current:
+        blocks.append((start, '\n'.join(current)))
+
+    return blocks
+
+def _get_depth_change(html, depth):
+    """
+    Follow the element nesting through a piece of rendered HTML
+
+    Args:
+        html (str): Rendered HTML
+        depth (int): Number of elements open before the piece
+
+    Returns:
+        int: Number of elements open after the piece
+    """
+    for match in TAG_RE.finditer(html):
+        closing, name, self_closing = match.groups()
+        if name.lower() in VOID_TAGS or self_closing:
+            continue
+        depth = max(depth - 1, 0) if closing else depth + 1
+    return depth
+
+def _has_duplicate_headings(text):
+    """Check if two headings would get the same toc anchor"""
+    seen = set()
+    previous = ''
+    for line in text.split('\n'):
+        heading = None
+        match = ATX_HEADING_RE.match(line)
+        if match:
+            heading = match.group(1)
+        elif previous.strip() and SETEXT_UNDERLINE_RE.match(line):
+            heading = previous
+        previous = line
+
+        if heading is not None:
+            slug = re.sub(r'[\W_]+', '', heading.lower())
+            if slug in seen:
+                return True
+            seen.add(slug)
+    return False
+
+class IncrementalRenderer:
+    """
+    Block-level incremental Markdown renderer for the live preview:
+    - Splits the document into top-level blocks
+    - Caches the HTML of each block by content hash, so an edit only
+      re-runs Markdown on the blocks it touched
+    - Falls back to a full render for cross-block features such as
+      reference links, footnotes, abbreviations and the toc extension
+    - When disabled, always renders the whole document at once
+    - Full renders mark the start of every block with its source line and
+      are split back into blocks at the marks outside raw HTML elements,
+      so scroll sync keeps its source lines
+    """
+
+    def __init__(self, markdown_renderer, enabled=True, max_cached_blocks=4096):
+        """
+        Initialize the IncrementalRenderer
+
+        Args:
+            markdown_renderer: MarkdownRenderer used to convert blocks
+            enabled (bool): Render block by block instead of as a whole
+            max_cached_blocks (int): Maximum number of cached block renders
+        """
+        self.markdown_renderer = markdown_renderer
+        self.enabled = enabled
+        self.max_cached_blocks = max_cached_blocks
+        self._cache = OrderedDict()
+
+    def clear_cache(self):
+        """Forget all cached block renders"""
+        self._cache.clear()
+
+    def needs_full_render(self, text):
+        """
+        Check if the text uses features that span blocks
+
+        Args:
+            text (str): Markdown text
+
+        Returns:
+            bool: True if the document has to be rendered as a whole
+        """
+        if CROSS_BLOCK_RE.search(text):
+            return True
+        if 'markdown.extensions.toc' in self.markdown_renderer.extensions:
+            return _has_duplicate_headings(text)
+        return False
+
+    def render(self, text):
+        """
+        Render markdown text block by block
+
+        Args:
+            text (str): Markdown text
+
+        Returns:
+            list: Block tuples in document order
+        """
+        if not self.enabled or self.needs_full_render(text):
+            return self._render_full(text)
+
+        blocks = []
+        for line, block_text in split_blocks(text):
+            key = self._hash(block_text)
+            html = self._cache.get(key)
+            if html is None:
+                html = self.markdown_renderer.convert(block_text)
+                self._cache[key] = html
+                if len(self._cache) > self.max_cached_blocks:
+                    self._cache.popitem(last=False)
+            else:
+                self._cache.move_to_end(key)
+            blocks.append(Block(key, line, html))
+        return blocks
+
+    def _render_full(self, text):
+        """
+        Render the whole document, split into blocks at their source lines
+
+        Args:
+            text (str): Markdown text
+
+        Returns:
+            list: Block tuples in document order, one block if no mark can be split at
+        """
+        source_blocks = split_blocks(text)
+        raw_lines = {line for line, block_text in source_blocks if RAW_HTML_RE.search(block_text)}
+        # Every block starts after a blank line, so the marks are blocks of their own
+        lines = text.split('\n')
+        for line, _block_text in reversed(source_blocks):
+            lines[line:line] = [LINE_MARKER.format(line), '']
+        html = self.markdown_renderer.convert('\n'.join(lines))
+
+        blocks = []
+        pieces = []
+        line = 0
+        depth = 0
+        position = 0
+
+        def add_block():
+            block_html = ''.join(pieces).strip()
+            if block_html:
+                blocks.append(Block(self._hash(block_html), line, block_html))
+
+        for match in LINE_MARKER_RE.finditer(html):
+            piece = html[position:match.start()]
+            # Only raw HTML can leave an element open, markdown output is balanced
+            if depth or line in raw_lines:
+                depth = _get_depth_change(piece, depth)
+            pieces.append(piece)
+            # Inside raw HTML the mark and its blank line are dropped, leaving the source as it was
+            position = match.end()
+            if depth == 0:
+                add_block()
+                pieces = []
+                line = int(match.group(1))
+        pieces.append(html[position:])
+        add_block()
+
+        if not blocks:
+            return [Block(self._hash(html), 0, html)]
+        return blocks
+
+    def render_html(self, text):
+        """
+        Render markdown text to a single HTML string
+
+        Args:
+            text (str): Markdown text
+
+        Returns:
+            str: Converted HTML
+        """
+        return '\n'.join(block.html for block in self.render(text))
+
+    def _hash(self, text):
+        """Content hash used as cache key"""
+        return hashlib.blake2b(text.encode('utf-8'), digest_size=12).hexdigest()
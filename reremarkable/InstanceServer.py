@@ -0,0 +1,179 @@
+import fcntl
+import json
+import logging
+import os
+import socket
+import tempfile
+
+from gi.repository import GLib
+
+logger = logging.getLogger('reremarkable')
+
+# Seconds a second instance waits for the running one to answer
+FORWARD_TIMEOUT = 2.0
+
+def get_socket_path():
+    """Get the per-user socket path of the running instance"""
+    runtime_dir = os.environ.get('XDG_RUNTIME_DIR')
+    if runtime_dir and os.path.isdir(runtime_dir):
+        return os.path.join(runtime_dir, 'reremarkable.sock')
+    return os.path.join(tempfile.gettempdir(), f'reremarkable-{os.getuid()}.sock')
+
+def forward_to_running_instance(file_paths, socket_path=None):
+    """
+    Ask an already running instance to open files
+
+    Args:
+        file_paths (list): Files to open, relative to the current directory
+        socket_path (str): Socket of the running instance, defaults to get_socket_path()
+
+    Returns:
+        bool: True if a running instance took the files, False if none is running
+    """
+    request = json.dumps({'files': [os.path.abspath(path) for path in file_paths]}) + '\n'
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.settimeout(FORWARD_TIMEOUT)
+            client.connect(socket_path or get_socket_path())
+            client.sendall(request.encode('utf-8'))
+            return client.makefile('rb').readline().strip() == b'ok'
+    except OSError:
+        # No socket, a stale one or an instance that does not answer
+        return False
+
+class InstanceServer:
+    """
+    Makes the running instance reachable for later launches:
+    - Listens on a per-user Unix socket, served from the GLib main loop
+    - Each connection sends one JSON line {"files": [absolute paths]}; an
+      empty list asks for a new, empty document
+    - The files are handed to a callback and the client gets "ok" back, so
+      it can exit instead of starting another process
+    - The socket is owned by the instance holding an exclusive lock on
+      <socket>.lock for its lifetime, so two launches at the same time
+      cannot both take it over; a socket left behind by a crashed
+      instance, whose lock the kernel released, is replaced
+    """
+
+    def __init__(self, open_files_callback, socket_path=None):
+        """
+        Initialize the InstanceServer
+
+        Args:
+            open_files_callback: Called on the main loop with the list of file paths
+            socket_path (str): Socket to listen on, defaults to get_socket_path()
+        """
+        self.open_files_callback = open_files_callback
+        self.socket_path = socket_path or get_socket_path()
+        self.lock_path = self.socket_path + '.lock'
+        self._lock_fd = None
+        self._socket = None
+        self._watch_id = None
+
+    def start(self):
+        """
+        Start listening
+
+        Returns:
+            bool: True if listening, False if another instance owns the socket
+        """
+        if not self._acquire_lock():
+            return False
+        try:
+            if os.path.exists(self.socket_path):
+                os.unlink(self.socket_path)  # Nobody holds the lock, left behind by an instance that is gone
+            server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            server.bind(self.socket_path)
+            os.chmod(self.socket_path, 0o600)
+            server.listen(8)
+            server.setblocking(False)
+        except OSError as e:
+            logger.warning(f"Could not listen on {self.socket_path}, single-instance mode is off: {e}")
+            self._release_lock()
+            return False
+
+        self._socket = server
+        self._watch_id = GLib.io_add_watch(server, GLib.PRIORITY_DEFAULT, GLib.IO_IN, self._on_connection)
+        return True
+
+    def stop(self):
+        """Stop listening and remove the socket"""
+        if self._watch_id is not None:
+            GLib.source_remove(self._watch_id)
+            self._watch_id = None
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
+            try:
+                os.unlink(self.socket_path)
+            except OSError:
+                pass
+        self._release_lock()
+
+    def _acquire_lock(self):
+        """
+        Take the lock guarding the socket, without waiting
+
+        Returns:
+            bool: True if this process owns the socket now, False if another instance does
+        """
+        try:
+            fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT | os.O_CLOEXEC, 0o600)
+        except OSError as e:
+            logger.warning(f"Could not open {self.lock_path}, single-instance mode is off: {e}")
+            return False
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            os.close(fd)  # Held by a running instance
+            return False
+        self._lock_fd = fd
+        return True
+
+    def _release_lock(self):
+        # The lock file stays, removing it would let two launches lock different files
+        if self._lock_fd is not None:
+            os.close(self._lock_fd)
+            self._lock_fd = None
+
+    def _on_connection(self, server, condition):
+        try:
+            connection, _address = self._socket.accept()
+        except OSError:
+            return True  # e.g. a probe that already went away
+        connection.setblocking(False)
+        received = []
+        GLib.io_add_watch(connection, GLib.PRIORITY_DEFAULT, GLib.IO_IN | GLib.IO_HUP | GLib.IO_ERR,
+                          self._on_request_data, received)
+        return True
+
+    def _on_request_data(self, connection, condition, received):
+        try:
+            data = connection.recv(65536)
+        except BlockingIOError:
+            return True
+        except OSError:
+            data = b''
+        if data:
+            received.append(data)
+            if not data.endswith(b'\n'):
+                return True  # Request not complete yet
+        elif not received:
+            connection.close()  # Closed without a request, e.g. a probe
+            return False
+
+        try:
+            request = json.loads(b''.join(received).decode('utf-8'))
+            file_paths = [str(path) for path in request.get('files', [])]
+        except (ValueError, AttributeError) as e:
+            logger.warning(f"Ignoring malformed request from another instance: {e}")
+            connection.close()
+            return False
+
+        try:
+            connection.sendall(b'ok\n')
+        except OSError:
+            pass
+        connection.close()
+        self.open_files_callback(file_paths)
+        return False
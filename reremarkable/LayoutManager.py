@@ -1,7 +1,5 @@
 
-import json
 import logging
-import os
 
 from gi.repository import GLib, Gtk
 
@@ -27,10 +25,6 @@ class LayoutManager:
         self.editor_position = 0  # 0 = editor left/top, 1 = editor right/bottom
         self.zoom_steps = 0.1
 
-        # Config file path
-        self.config_dir = os.path.expanduser('~/.config/reremarkable')
-        self.layout_file = os.path.join(self.config_dir, 'layout.json')
-
     def set_ui_components(self, paned, live_preview, scrolledwindow_text_view,
                          scrolledwindow_live_preview, text_view, toolbar, statusbar, builder):
         """Set references to UI components"""
@@ -111,6 +105,36 @@ class LayoutManager:
             if update_callback:
                 update_callback()
 
+    def apply_document_layout(self, live_preview_visible):
+        """
+        Bring the panes of a document shown in a new tab in line with the
+        window layout: orientation, pane order, live preview visibility,
+        word wrap, line numbers and zoom
+
+        Args:
+            live_preview_visible (bool): Show the live preview pane
+        """
+        if self.settings_manager.is_vertical_layout():
+            self.paned.set_orientation(Gtk.Orientation.VERTICAL)
+        else:
+            self.paned.set_orientation(Gtk.Orientation.HORIZONTAL)
+
+        for child in self.paned.get_children():
+            self.paned.remove(child)
+        if not live_preview_visible:
+            self.paned.add(self.scrolledwindow_text_view)
+        elif self.editor_position == 0:
+            self.paned.add(self.scrolledwindow_text_view)
+            self.paned.add(self.scrolledwindow_live_preview)
+        else:
+            self.paned.add(self.scrolledwindow_live_preview)
+            self.paned.add(self.scrolledwindow_text_view)
+        self.live_preview.set_visible(live_preview_visible)
+
+        self.toggle_word_wrap()
+        self.toggle_line_numbers()
+        self.apply_zoom_setting()
+
     def swap_panes(self):
         """Swap the position of editor and preview panes"""
         if self.live_preview.get_visible():
@@ -222,7 +246,7 @@ class LayoutManager:
             self.toggle_live_preview(update_callback)
 
     def save_window_layout(self):
-        """Save window layout to config file"""
+        """Save window layout with the settings"""
         try:
             # Get window position and size
             x, y = self.window.get_position()
@@ -246,25 +270,18 @@ class LayoutManager:
                 'live_preview_visible': live_preview_visible
             }
 
-            # Create config directory if it doesn't exist
-            os.makedirs(self.config_dir, exist_ok=True)
-
-            # Save layout to file
-            with open(self.layout_file, 'w') as f:
-                json.dump(layout_data, f, indent=2)
+            self.settings_manager.set_setting('layout', layout_data)
 
         except Exception as e:
             logger.error(f"Could not save window layout: {e}")
 
     def load_window_layout(self):
-        """Load window layout from config file"""
+        """Load window layout from the settings"""
         try:
-            if not os.path.exists(self.layout_file):
+            layout_data = self.settings_manager.get_window_layout()
+            if not layout_data:
                 return
 
-            with open(self.layout_file) as f:
-                layout_data = json.load(f)
-
             # Restore window size and position
             if 'window_width' in layout_data and 'window_height' in layout_data:
                 width = layout_data['window_width']
@@ -0,0 +1,112 @@
+import logging
+import threading
+
+logger = logging.getLogger('reremarkable')
+
+# Markdown extensions used by the live preview and exports
+DEFAULT_EXTENSIONS = [
+    'markdown.extensions.extra',
+    'markdown.extensions.toc',
+    'markdown.extensions.smarty',
+    'markdown_extensions.extensions.urlize',
+    'markdown_extensions.extensions.Highlighting',
+    'markdown_extensions.extensions.Strikethrough',
+    'markdown_extensions.extensions.markdown_checklist',
+    'markdown_extensions.extensions.superscript',
+    'markdown_extensions.extensions.subscript',
+    'markdown_extensions.extensions.mathjax'
+]
+
+# Fallback extensions used when the default set fails
+SAFE_EXTENSIONS = ['markdown.extensions.extra']
+
+class MarkdownRenderer:
+    """
+    Persistent Markdown rendering engine shared by the live preview,
+    clipboard and export features:
+    - One markdown.Markdown instance per extension set, built on first use
+    - Instances are reused with reset() instead of being rebuilt per conversion
+    - Each thread gets its own instances, so the preview can render in the
+      background while exports convert on the main loop
+    - Falls back to the safe extensions, then to plain Markdown, on failure
+    - Optionally highlights code blocks with a CodeHighlighter
+    """
+
+    def __init__(self, extensions=None, safe_extensions=None, code_highlighter=None):
+        """
+        Initialize the MarkdownRenderer
+
+        Args:
+            extensions (list): Extension names for the default engine
+            safe_extensions (list): Extension names for the fallback engine
+            code_highlighter: CodeHighlighter applied to converted HTML (optional)
+        """
+        self.extensions = list(DEFAULT_EXTENSIONS if extensions is None else extensions)
+        self.safe_extensions = list(SAFE_EXTENSIONS if safe_extensions is None else safe_extensions)
+        self.code_highlighter = code_highlighter
+
+        # Per-thread engines keyed by extension tuple, None marks a set that failed to load
+        self._local = threading.local()
+
+    def _get_engine(self, extensions):
+        """
+        Get the engine for an extension set, building it on first use
+
+        Args:
+            extensions (list): Extension names
+
+        Returns:
+            markdown.Markdown: Engine, or None if the extensions failed to load
+        """
+        engines = getattr(self._local, 'engines', None)
+        if engines is None:
+            engines = self._local.engines = {}
+
+        key = tuple(extensions)
+        if key not in engines:
+            # Imported on first use, on the render worker thread instead of at start-up
+            import markdown
+            try:
+                engines[key] = markdown.Markdown(extensions=list(key))
+            except Exception as e:
+                logger.warning(f"Could not load markdown extensions {list(key)}: {e}")
+                engines[key] = None
+        return engines[key]
+
+    def get_extension_sets(self):
+        """
+        Get the extension sets in fallback order
+
+        Returns:
+            list: Lists of extension names, ending with plain Markdown
+        """
+        return [self.extensions, self.safe_extensions, []]
+
+    def convert(self, text):
+        """
+        Convert markdown text to HTML with fallback extension handling
+
+        Args:
+            text (str): Markdown text to convert
+
+        Returns:
+            str: Converted HTML
+        """
+        extension_sets = self.get_extension_sets()
+        for i, extensions in enumerate(extension_sets):
+            engine = self._get_engine(extensions)
+            if engine is None:
+                continue
+            try:
+                html = engine.reset().convert(text)
+            except Exception as e:
+                engine.reset()
+                if i == len(extension_sets) - 1:
+                    raise
+                logger.debug(f"Markdown conversion failed with {extensions}: {e}")
+                continue
+
+            if self.code_highlighter is not None:
+                html = self.code_highlighter.highlight_html(html)
+            return html
+        return ''
@@ -0,0 +1,248 @@
+import logging
+import os
+import re
+import subprocess
+import tempfile
+
+from gi.repository import GLib
+
+import pdfkit_local as pdfkit
+
+logger = logging.getLogger('reremarkable')
+
+# wkhtmltopdf reports its stages as "Loading pages (1/6)" and progress bars as "[====>   ] 40%"
+STAGE_RE = re.compile(r'\((\d+)/(\d+)\)')
+PERCENT_RE = re.compile(r'(\d{1,3})%')
+
+# Options rejected by the installed wkhtmltopdf build
+UNKNOWN_OPTION_RE = re.compile(r'Unknown (long )?argument', re.IGNORECASE)
+
+class PdfExportJob:
+    """
+    Runs wkhtmltopdf in the background without blocking the GTK main loop:
+    - The HTML is encoded and written to the child's stdin piece by piece
+      from a GLib IO watch, so the document is never held as one bytes copy
+    - stderr is read through a non-blocking pipe and parsed for progress
+    - The PDF is written to a temporary file next to the output file and
+      only replaces it once it is complete, so a failed or cancelled export
+      leaves an existing file untouched
+    - cancel() kills the child and removes the partial temporary file
+    - If wkhtmltopdf rejects one of the options, the job is retried once
+      without options
+    """
+
+    CHUNK_SIZE = 64 * 1024
+
+    def __init__(self, html_content, file_path, options=None, progress_callback=None, finished_callback=None,
+                 configuration=None):
+        """
+        Initialize the PdfExportJob
+
+        Args:
+            html_content (str or list): HTML content to convert, or its pieces in order
+            file_path (str): Output PDF file path
+            options (dict): wkhtmltopdf options (optional)
+            progress_callback: Function called with (fraction, stage_text) (optional)
+            finished_callback: Function called with (success, error_output) once the job ends (optional)
+            configuration: pdfkit Configuration of the binary to run (optional)
+        """
+        self.html_chunks = [html_content] if isinstance(html_content, str) else list(html_content)
+        self.file_path = file_path
+        self.options = options
+        self.progress_callback = progress_callback
+        self.finished_callback = finished_callback
+        self.configuration = configuration
+
+        self.temp_path = None
+        self.process = None
+        self.cancelled = False
+        self.finished = False
+        self._input = iter(())
+        self._pending = b''
+        self._stderr = b''
+        self._stage = (1, 1, "Starting")
+        self._stdin_watch_id = None
+
+    def start(self):
+        """Start wkhtmltopdf; returns immediately"""
+        try:
+            if self.temp_path is None:
+                self.temp_path = self._create_temp_file()
+            else:
+                self._truncate_temp_file()  # Retry, the failed output must not pass for this one
+            args = pdfkit.PDFKit(self.html_chunks, 'string', options=self.options,
+                                 configuration=self.configuration).command(self.temp_path)
+            self._input = self._iter_input()
+            self._pending = b''
+            self._stderr = b''
+            self._stage = (1, 1, "Starting")
+            self.process = subprocess.Popen(args, stdin=subprocess.PIPE, stdout=subprocess.DEVNULL,
+                                            stderr=subprocess.PIPE)
+        except Exception as e:
+            logger.error(f"Could not start wkhtmltopdf: {e}")
+            self._remove_temp_file()
+            self._finish(False, str(e))
+            return
+
+        for pipe in (self.process.stdin, self.process.stderr):
+            os.set_blocking(pipe.fileno(), False)
+
+        self._stdin_watch_id = GLib.io_add_watch(self.process.stdin.fileno(), GLib.PRIORITY_DEFAULT,
+                                                 GLib.IOCondition.OUT | GLib.IOCondition.ERR | GLib.IOCondition.HUP,
+                                                 self._on_stdin_ready)
+        GLib.io_add_watch(self.process.stderr.fileno(), GLib.PRIORITY_DEFAULT,
+                          GLib.IOCondition.IN | GLib.IOCondition.ERR | GLib.IOCondition.HUP,
+                          self._on_stderr_ready)
+
+    def cancel(self):
+        """Kill wkhtmltopdf and discard the partial output"""
+        if self.finished:
+            return
+        self.cancelled = True
+        if self.process is not None and self.process.poll() is None:
+            self.process.kill()
+        self._remove_temp_file()
+        # The stderr watch sees the pipe close and finishes the job
+
+    def _iter_input(self):
+        """Encode the HTML one CHUNK_SIZE piece at a time, as the pipe takes it"""
+        for chunk in self.html_chunks:
+            for start in range(0, len(chunk), self.CHUNK_SIZE):
+                yield chunk[start:start + self.CHUNK_SIZE].encode('utf-8')
+
+    def _on_stdin_ready(self, fd, condition):
+        """Feed the next chunk of HTML to wkhtmltopdf"""
+        if condition & GLib.IOCondition.OUT and not self.cancelled:
+            try:
+                if not self._pending:
+                    self._pending = next(self._input, b'')
+                if self._pending:
+                    self._pending = self._pending[os.write(fd, self._pending):]
+                    return True
+            except BlockingIOError:
+                return True
+            except OSError:
+                pass  # The child exited early, its stderr tells why
+
+        self._stdin_watch_id = None
+        self._close_stdin()
+        return False
+
+    def _close_stdin(self):
+        if self._stdin_watch_id is not None:
+            GLib.source_remove(self._stdin_watch_id)
+            self._stdin_watch_id = None
+        try:
+            self.process.stdin.close()
+        except OSError:
+            pass
+
+    def _on_stderr_ready(self, fd, condition):
+        """Collect wkhtmltopdf output and report progress"""
+        try:
+            data = os.read(fd, self.CHUNK_SIZE)
+        except BlockingIOError:
+            return True
+        except OSError:
+            data = b''
+
+        if data:
+            self._stderr += data
+            self._report_progress(data.decode('utf-8', 'replace'))
+            return True
+
+        # End of output, wkhtmltopdf is exiting
+        self._close_stdin()
+        self.process.stderr.close()
+        self.process.wait()
+        self._on_process_exited()
+        return False
+
+    def _report_progress(self, text):
+        """Turn the latest stage and percentage in the output into a fraction"""
+        if self.progress_callback is None:
+            return
+        # Progress bars are redrawn with carriage returns
+        lines = [line.strip() for line in re.split(r'[\r\n]+', text) if line.strip()]
+        for line in lines:
+            stage = STAGE_RE.search(line)
+            if stage:
+                self._stage = (int(stage.group(1)), int(stage.group(2)), line)
+            percent = PERCENT_RE.search(line)
+            current, total, label = self._stage
+            fraction = (current - 1 + (int(percent.group(1)) / 100 if percent else 0)) / max(total, 1)
+            self.progress_callback(min(max(fraction, 0.0), 1.0), label)
+
+    def _on_process_exited(self):
+        """Decide between success, retry and failure"""
+        error_output = self._stderr.decode('utf-8', 'replace')
+
+        if self.cancelled:
+            self._remove_temp_file()
+            self._finish(False, None)
+            return
+
+        if self._has_pdf_output():
+            try:
+                os.chmod(self.temp_path, self._get_output_mode())
+                os.replace(self.temp_path, self.file_path)
+            except OSError as e:
+                logger.error(f"Could not write {self.file_path}: {e}")
+                self._remove_temp_file()
+                self._finish(False, str(e))
+                return
+            self.temp_path = None
+            self._finish(True, error_output)
+            return
+
+        if self.options and UNKNOWN_OPTION_RE.search(error_output):
+            logger.warning("wkhtmltopdf rejected an option, retrying without options")
+            self.options = None
+            self.start()
+            return
+
+        logger.error(f"wkhtmltopdf failed:\n{error_output}")
+        self._remove_temp_file()
+        self._finish(False, error_output)
+
+    def _create_temp_file(self):
+        """Create the temporary output file in the directory of the output file"""
+        directory, name = os.path.split(os.path.abspath(self.file_path))
+        fd, temp_path = tempfile.mkstemp(prefix=f".{name}.", suffix=".part", dir=directory)
+        os.close(fd)
+        return temp_path
+
+    def _truncate_temp_file(self):
+        with open(self.temp_path, 'wb'):
+            pass
+
+    def _get_output_mode(self):
+        """Get the permissions of the output file: those of the file it replaces, or the umask default"""
+        try:
+            return os.stat(self.file_path).st_mode & 0o777
+        except OSError:
+            umask = os.umask(0)
+            os.umask(umask)
+            return 0o666 & ~umask
+
+    def _has_pdf_output(self):
+        """Check that the temporary output file starts with the PDF signature"""
+        try:
+            with open(self.temp_path, 'rb') as f:
+                return f.read(4) == b'%PDF'
+        except OSError:
+            return False
+
+    def _remove_temp_file(self):
+        if self.temp_path is None:
+            return
+        try:
+            os.remove(self.temp_path)
+        except OSError:
+            pass
+        self.temp_path = None
+
+    def _finish(self, success, error_output):
+        self.finished = True
+        if self.finished_callback:
+            self.finished_callback(success, error_output)
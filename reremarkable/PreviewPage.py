@@ -0,0 +1,171 @@
+import json
+import logging
+
+import gi
+
+gi.require_version('WebKit2', '4.1')
+import mathjax_config
+from gi.repository import WebKit2
+
+logger = logging.getLogger('reremarkable')
+
+class PreviewPage:
+    """
+    Keeps the live preview WebView loaded with a single page shell:
+    - The shell (styles, scripts and the rendered blocks) is loaded once
+    - Later renders are diffed against the blocks already on the page and
+      sent through run_javascript as one block patch
+    - The shell is only reloaded when its head, footer or base URI change,
+      or after the user navigated away from it
+    - Stylesheets are installed as WebKit user style sheets, so a style
+      change swaps them on the loaded page instead of reloading it
+    - MathJax is only loaded once a block actually contains math
+    - Every block carries its first source line for scroll synchronization
+    """
+
+    CONTENT_START = (
+        '<style type="text/css">.rr-block { display: contents; }</style>'
+        '<div id="reremarkable-content">'
+    )
+    CONTENT_END = '</div>'
+
+    def __init__(self, web_view, media_path):
+        """
+        Initialize the PreviewPage
+
+        Args:
+            web_view: WebKit2.WebView showing the live preview
+            media_path: Path to media files for the preview script
+        """
+        self.web_view = web_view
+        self.media_path = media_path
+
+        self.shell = None  # (head, end, base_uri) of the loaded shell
+        self.keys = []  # Keys of the blocks on the page, in order
+        self.lines = []  # Source lines of the blocks on the page
+        self.ready = False
+        self.pending_blocks = None
+        self.expecting_load = False
+        self.style_sheets = None  # CSS sources of the installed user style sheets
+
+        self.web_view.connect("load-changed", self._on_load_changed)
+
+    def update(self, blocks, html_head, html_end, base_uri=None):
+        """
+        Show rendered blocks, patching the loaded page when possible
+
+        Args:
+            blocks (list): Block tuples from IncrementalRenderer
+            html_head (str): HTML up to and including the opening body tag
+            html_end (str): HTML footer with scripts and closing tags
+            base_uri (str): Base URI for relative paths, or None
+        """
+        shell = (html_head, html_end, base_uri)
+        if shell != self.shell:
+            self._load_shell(blocks, shell)
+        elif not self.ready:
+            self.pending_blocks = blocks
+        else:
+            self._patch(blocks)
+
+    def set_style_sheets(self, css_sources):
+        """
+        Replace the stylesheets of the preview, applied to the loaded page without a reload
+
+        Args:
+            css_sources (list): CSS sources, in cascade order
+        """
+        if css_sources == self.style_sheets:
+            return
+        manager = self.web_view.get_user_content_manager()
+        manager.remove_all_style_sheets()
+        for css in css_sources:
+            manager.add_style_sheet(WebKit2.UserStyleSheet(css, WebKit2.UserContentInjectedFrames.TOP_FRAME,
+                                                           WebKit2.UserStyleLevel.AUTHOR, None, None))
+        self.style_sheets = list(css_sources)
+
+    def invalidate(self):
+        """Force the shell to be reloaded on the next update"""
+        self.shell = None
+
+    def _block_html(self, block):
+        """Wrap a rendered block in its keyed container"""
+        return (f'<div class="rr-block" data-key="{block.key}" data-source-line="{block.line}">'
+                f'{block.html}</div>')
+
+    def _load_shell(self, blocks, shell):
+        """Load the page shell with the given blocks already in place"""
+        html_head, html_end, base_uri = shell
+        mathjax = {
+            'source': mathjax_config.get_source(self.media_path),
+            'config': mathjax_config.get_config(self.media_path)
+        }
+        html = (
+            html_head
+            + self.CONTENT_START
+            + ''.join(self._block_html(block) for block in blocks)
+            + self.CONTENT_END
+            + f'<script src="{self.media_path}preview.js"></script>'
+            + f'<script>reremarkable.configure({json.dumps({"mathjax": mathjax})});</script>'
+        )
+        if self._contains_math(blocks):
+            html += mathjax_config.get_script_tags(self.media_path)
+        html += html_end
+
+        self.shell = shell
+        self.keys = [block.key for block in blocks]
+        self.lines = [block.line for block in blocks]
+        self.ready = False
+        self.pending_blocks = None
+        self.expecting_load = True
+        self.web_view.load_html(html, base_uri)
+
+    def _contains_math(self, blocks):
+        """Check if any of the blocks needs MathJax"""
+        return any(mathjax_config.contains_math(block.html) for block in blocks)
+
+    def _on_load_changed(self, web_view, load_event):
+        """Track when the shell is ready to receive patches"""
+        if load_event == WebKit2.LoadEvent.STARTED:
+            if self.expecting_load:
+                self.expecting_load = False
+            else:
+                # Navigation away from the shell, e.g. a clicked link
+                self.shell = None
+                self.ready = False
+        elif load_event == WebKit2.LoadEvent.FINISHED and self.shell is not None:
+            self.ready = True
+            if self.pending_blocks is not None:
+                blocks, self.pending_blocks = self.pending_blocks, None
+                self._patch(blocks)
+
+    def _patch(self, blocks):
+        """Send the blocks that differ from the page as one patch"""
+        keys = [block.key for block in blocks]
+        lines = [block.line for block in blocks]
+        old_keys = self.keys
+
+        limit = min(len(old_keys), len(keys))
+        prefix = 0
+        while prefix < limit and old_keys[prefix] == keys[prefix]:
+            prefix += 1
+        suffix = 0
+        while suffix < limit - prefix and old_keys[-1 - suffix] == keys[-1 - suffix]:
+            suffix += 1
+
+        if prefix == len(old_keys) == len(keys) and lines == self.lines:
+            return  # Nothing changed
+
+        added = blocks[prefix:len(blocks) - suffix]
+        change = {
+            'start': prefix,
+            'remove': len(old_keys) - prefix - suffix,
+            'blocks': [{'key': block.key, 'line': block.line, 'html': block.html} for block in added],
+            'math': self._contains_math(added)
+        }
+        if lines[:prefix] != self.lines[:prefix] or lines[len(lines) - suffix:] != self.lines[len(self.lines) - suffix:]:
+            # Unchanged blocks moved to other source lines
+            change['lines'] = lines
+        self.keys = keys
+        self.lines = lines
+        self.web_view.run_javascript(f"reremarkable.patch({json.dumps(change)});", None, None, None)
@@ -0,0 +1,114 @@
+import logging
+import time
+
+from gi.repository import GLib
+
+logger = logging.getLogger('reremarkable')
+
+class PreviewScheduler:
+    """
+    Coalesces bursts of buffer changes into a single live preview render:
+    - Every change restarts a short quiet-interval timer (debounce)
+    - The delay grows with the cost of the previous render, so slow
+      documents render less often instead of lagging behind the keyboard
+    - A maximum wait guarantees progress while the user keeps typing
+    - The last scheduled change is always rendered
+    """
+
+    # One frame at 60Hz, the shortest delay we ever use
+    FRAME_INTERVAL = 16
+
+    def __init__(self, render_callback, quiet_interval=75, max_interval=1000, max_wait=1500):
+        """
+        Initialize the PreviewScheduler
+
+        Args:
+            render_callback: Function performing the actual render
+            quiet_interval (int): Milliseconds without changes before rendering,
+                0 renders once per frame
+            max_interval (int): Upper bound in milliseconds for the adaptive delay
+            max_wait (int): Milliseconds after which a pending render is forced
+                even if changes keep arriving
+        """
+        self.render_callback = render_callback
+        self.quiet_interval = quiet_interval
+        self.max_interval = max_interval
+        self.max_wait = max_wait
+
+        self.timeout_id = None
+        self.pending_since = None
+        self.last_render_duration = 0
+
+    def set_quiet_interval(self, quiet_interval):
+        """Set the quiet interval in milliseconds"""
+        self.quiet_interval = max(0, int(quiet_interval))
+
+    def get_delay(self):
+        """
+        Get the current render delay in milliseconds, adapted to the
+        duration of the last render
+
+        Returns:
+            int: Delay in milliseconds
+        """
+        adaptive = int(self.last_render_duration * 1.5)
+        delay = max(self.FRAME_INTERVAL, self.quiet_interval, adaptive)
+        return min(delay, max(self.max_interval, self.quiet_interval))
+
+    def schedule(self):
+        """Request a render, coalescing it with any render already pending"""
+        now = time.monotonic()
+        if self.pending_since is None:
+            self.pending_since = now
+
+        if self.timeout_id is not None:
+            waited = (now - self.pending_since) * 1000
+            if waited >= self.max_wait:
+                # Keep the current timer so continuous typing still updates
+                return
+            GLib.source_remove(self.timeout_id)
+
+        self.timeout_id = GLib.timeout_add(self.get_delay(), self._on_timeout)
+
+    def flush(self):
+        """Render immediately if a render is pending"""
+        if self.timeout_id is not None:
+            GLib.source_remove(self.timeout_id)
+            self._on_timeout()
+
+    def cancel(self):
+        """Drop any pending render"""
+        if self.timeout_id is not None:
+            GLib.source_remove(self.timeout_id)
+        self.timeout_id = None
+        self.pending_since = None
+
+    def record_render_duration(self, duration):
+        """
+        Record the duration of a render finished outside the scheduler
+
+        Args:
+            duration (float): Render duration in milliseconds
+        """
+        self.last_render_duration = duration
+
+    def is_pending(self):
+        """Check if a render is pending"""
+        return self.timeout_id is not None
+
+    def _on_timeout(self):
+        """Run the render callback and record how long it took"""
+        self.timeout_id = None
+        self.pending_since = None
+
+        started = time.perf_counter()
+        try:
+            self.render_callback()
+        except Exception as e:
+            logger.error(f"Error rendering live preview: {e}")
+        # Renders handed off to a worker report their real cost through
+        # record_render_duration(), so only let the estimate decay here
+        measured = (time.perf_counter() - started) * 1000
+        self.last_render_duration = max(measured, self.last_render_duration / 2)
+
+        return False  # Don't repeat this timeout
@@ -5,47 +5,88 @@ import gi
 gi.require_version('Gtk', '3.0')
 import logging
 import os
+import queue
+import threading
+import time
 
-from gi.repository import Gdk, Gtk
+from gi.repository import Gdk, GLib, Gtk
 
 logger = logging.getLogger('reremarkable')
 
+# Frecency weight of an entry by the age in days of its last opening, after Firefox's
+FRECENCY_WEIGHTS = [(4, 100), (14, 70), (31, 50), (90, 30), (float('inf'), 10)]
+
 class RecentFilesManager:
     """
     Manages the recent files functionality including:
-    - Loading and saving recent files from/to config file
-    - Managing the recent files list
-    - Creating and updating the recent files menu
+    - Loading and saving recent files with the settings, whose writes are
+      already debounced
+    - Keeping up to max_recent_files entries with their open count and last
+      open or save time, ranked by frecency (how often and how recently a
+      file was opened); saves do not add to the count; the menu shows the
+      best menu_size entries
+    - Checking that the files still exist on worker threads, so a stale
+      network mount does not block start-up; entries that do not answer
+      within CHECK_TIMEOUT are kept
+    - Updating only the menu items whose file changed
+    - Searching all entries by file name and path
     - Handling recent file selection and accelerator keys
     """
 
-    def __init__(self, max_recent_files=10):
+    # Milliseconds to wait for the existence checks before keeping the unchecked entries
+    CHECK_TIMEOUT = 2000
+
+    # Worker threads for the existence checks
+    CHECK_THREADS = 4
+
+    def __init__(self, settings_manager, max_recent_files=100, menu_size=10):
         """
         Initialize the RecentFilesManager
 
         Args:
+            settings_manager: SettingsManager storing the recent files
             max_recent_files (int): Maximum number of recent files to track
+            menu_size (int): Number of recent files shown in the menu
         """
-        self.recent_files = []
+        self.settings_manager = settings_manager
+        self.entries = {}  # Path -> {'path', 'count', 'last'}, as stored in the settings
+        self.index = {}  # Path -> (lower case file name, lower case path) for searching
         self.max_recent_files = max_recent_files
-        self.recent_files_file = os.path.expanduser("~/.config/reremarkable/recent_files.txt")
+        self.menu_size = menu_size
         self.recent_files_menu = None
         self.accel_group = None
+        self.parent_window = None
         self.file_open_callback = None
 
-        # Load recent files on initialization
+        # Menu widgets, the file items are reused when their file changes
+        self.file_items = []
+        self.menu_paths = []
+        self.placeholder_item = None
+        self.action_items = []
+
+        # Existence checks running on the worker threads
+        self.check_generation = 0
+        self.pending_checks = None
+        self.missing_files = []
+        self.check_timeout_id = None
+
+        # Load recent files on initialization, and drop the ones that are gone in the background
         self.load_recent_files()
+        self.check_recent_files()
 
-    def set_menu_and_accel_group(self, recent_files_menu, accel_group):
+    def set_menu_and_accel_group(self, recent_files_menu, accel_group, parent_window=None):
         """
         Set the GTK menu object and accelerator group for recent files
 
         Args:
             recent_files_menu: The GTK menu object for recent files
             accel_group: The accelerator group for keyboard shortcuts
+            parent_window: Parent window of the search dialog (optional)
         """
         self.recent_files_menu = recent_files_menu
         self.accel_group = accel_group
+        self.parent_window = parent_window
+        self._build_menu()
         self.update_recent_files_menu()
 
     def set_file_open_callback(self, callback):
@@ -58,66 +99,145 @@ class RecentFilesManager:
         self.file_open_callback = callback
 
     def load_recent_files(self):
-        """Load recent files from config file"""
-        try:
-            # Create config directory if it doesn't exist
-            config_dir = os.path.dirname(self.recent_files_file)
-            os.makedirs(config_dir, exist_ok=True)
-
-            if os.path.exists(self.recent_files_file):
-                with open(self.recent_files_file) as f:
-                    self.recent_files = [line.strip() for line in f.readlines() if line.strip()]
-                # Remove files that no longer exist
-                self.recent_files = [f for f in self.recent_files if os.path.exists(f)]
-        except Exception as e:
-            logger.warning(f"Could not load recent files: {e}")
-            self.recent_files = []
+        """Load recent files from the settings, without checking that they exist"""
+        self.entries = {entry['path']: entry for entry in self.settings_manager.get_recent_files()}
+        self.index = {path: self._index_path(path) for path in self.entries}
 
     def save_recent_files(self):
-        """Save recent files to config file"""
-        try:
-            config_dir = os.path.dirname(self.recent_files_file)
-            os.makedirs(config_dir, exist_ok=True)
+        """Save recent files with the settings"""
+        self.settings_manager.set_setting('recent-files', [dict(entry) for entry in self.entries.values()])
 
-            with open(self.recent_files_file, 'w') as f:
-                for file_path in self.recent_files:
-                    f.write(file_path + '\n')
-        except Exception as e:
-            logger.warning(f"Could not save recent files: {e}")
+    def _index_path(self, path):
+        return os.path.basename(path).lower(), path.lower()
 
-    def add_recent_file(self, file_path):
+    def get_frecency(self, entry, now=None):
         """
-        Add a file to the recent files list
+        Get the frecency score of an entry
+
+        Args:
+            entry (dict): Entry with its open count and last open time
+            now (float): Current time, defaults to time.time()
+
+        Returns:
+            float: Open count weighted by the age of the last opening
+        """
+        age_days = ((now or time.time()) - entry['last']) / 86400
+        for max_age, weight in FRECENCY_WEIGHTS:
+            if age_days < max_age:
+                return entry['count'] * weight
+        return entry['count'] * FRECENCY_WEIGHTS[-1][1]
+
+    def check_recent_files(self):
+        """Drop the entries whose files are gone, checked on worker threads"""
+        self.check_generation += 1
+        paths = list(self.entries)
+        if not paths:
+            return
+
+        pending = queue.Queue()
+        for path in paths:
+            pending.put(path)
+        self.pending_checks = set(paths)
+        self.missing_files = []
+        for _ in range(min(self.CHECK_THREADS, len(paths))):
+            # Daemon threads, a check stuck on a dead mount does not keep the process alive
+            threading.Thread(target=self._check_files, args=(pending, self.check_generation),
+                             daemon=True).start()
+        self.check_timeout_id = GLib.timeout_add(self.CHECK_TIMEOUT, self._on_check_timeout,
+                                                 self.check_generation)
+
+    def _check_files(self, pending, generation):
+        """Check files from the queue on a worker thread, reporting to the main loop"""
+        while True:
+            try:
+                path = pending.get_nowait()
+            except queue.Empty:
+                return
+            exists = os.path.exists(path)
+            GLib.idle_add(self._on_file_checked, generation, path, exists)
+
+    def _on_file_checked(self, generation, path, exists):
+        if generation != self.check_generation or self.pending_checks is None:
+            return False  # Check superseded or timed out
+        self.pending_checks.discard(path)
+        if not exists:
+            self.missing_files.append(path)
+        if not self.pending_checks:
+            self._finish_check()
+        return False
+
+    def _on_check_timeout(self, generation):
+        self.check_timeout_id = None
+        if generation == self.check_generation and self.pending_checks is not None:
+            logger.warning(f"Could not check {len(self.pending_checks)} recent files in time, keeping them")
+            self._finish_check()
+        return False
+
+    def _finish_check(self):
+        """Remove the missing files in one batch"""
+        if self.check_timeout_id is not None:
+            GLib.source_remove(self.check_timeout_id)
+            self.check_timeout_id = None
+        self.pending_checks = None
+        missing_files, self.missing_files = self.missing_files, []
+        removed = False
+        for path in missing_files:
+            if self.entries.pop(path, None) is not None:
+                self.index.pop(path, None)
+                removed = True
+        if removed:
+            self.save_recent_files()
+            self.update_recent_files_menu()
+
+    def add_recent_file(self, file_path, opened=True):
+        """
+        Add a file to the recent files list, or count another opening of it
+
+        Saving a listed file only moves its last use time, so frequent saves
+        do not rank it above files that are opened more often.
 
         Args:
             file_path (str): The path of the file to add
+            opened (bool): The file was opened, False when it was saved
         """
         # Convert to absolute path
         file_path = os.path.abspath(file_path)
 
-        # Remove if already in list
-        if file_path in self.recent_files:
-            self.recent_files.remove(file_path)
+        entry = self.entries.pop(file_path, None)
+        if entry is None:
+            entry = {'path': file_path, 'count': 1}
+        elif opened:
+            entry['count'] += 1
+        entry['last'] = time.time()
+        self.entries[file_path] = entry
+        self.index[file_path] = self._index_path(file_path)
+
+        # Limit list size, dropping the lowest ranked entries
+        if len(self.entries) > self.max_recent_files:
+            for path in self.get_recent_files()[self.max_recent_files:]:
+                del self.entries[path]
+                del self.index[path]
 
-        # Add to beginning of list
-        self.recent_files.insert(0, file_path)
-
-        # Limit list size
-        if len(self.recent_files) > self.max_recent_files:
-            self.recent_files = self.recent_files[:self.max_recent_files]
-
-        # Save to file
         self.save_recent_files()
-
-        # Update menu if available
-        if self.recent_files_menu:
-            self.update_recent_files_menu()
+        self.update_recent_files_menu()
 
     def clear_recent_files(self):
         """Clear all recent files"""
-        self.recent_files = []
+        self.entries = {}
+        self.index = {}
         self.save_recent_files()
-        if self.recent_files_menu:
+        self.update_recent_files_menu()
+
+    def remove_recent_file(self, file_path):
+        """
+        Remove a file from the recent files list
+
+        Args:
+            file_path (str): The path of the file to remove
+        """
+        if self.entries.pop(file_path, None) is not None:
+            del self.index[file_path]
+            self.save_recent_files()
             self.update_recent_files_menu()
 
     def open_recent_file(self, menuitem, file_path):
@@ -133,69 +253,85 @@ class RecentFilesManager:
                 self.file_open_callback(file_path)
         else:
             # File no longer exists, remove from recent files
-            if file_path in self.recent_files:
-                self.recent_files.remove(file_path)
-                self.save_recent_files()
-                if self.recent_files_menu:
-                    self.update_recent_files_menu()
+            self.remove_recent_file(file_path)
+
+    def _build_menu(self):
+        """Create the menu items that are always present, hidden until needed"""
+        for child in self.recent_files_menu.get_children():
+            self.recent_files_menu.remove(child)
+        self.file_items = []
+        self.menu_paths = []
+
+        # Shown when there are no recent files
+        self.placeholder_item = Gtk.MenuItem.new_with_label("No recent files")
+        self.placeholder_item.set_sensitive(False)
+        self.placeholder_item.show()
+        self.recent_files_menu.append(self.placeholder_item)
+
+        search_item = Gtk.MenuItem.new_with_label("Search Recent Files…")
+        search_item.connect("activate", lambda x: self.show_search_dialog())
+        clear_item = Gtk.MenuItem.new_with_label("Clear Recent Files")
+        clear_item.connect("activate", lambda x: self.clear_recent_files())
+        self.action_items = [Gtk.SeparatorMenuItem(), search_item, clear_item]
+        for item in self.action_items:
+            self.recent_files_menu.append(item)
 
     def update_recent_files_menu(self):
-        """Update the recent files submenu"""
+        """Update the recent files submenu, changing only the items whose file changed"""
         if not self.recent_files_menu:
             return
 
-        # Clear existing menu items
-        for child in self.recent_files_menu.get_children():
-            self.recent_files_menu.remove(child)
+        paths = self.get_recent_files()[:self.menu_size]
+        if paths == self.menu_paths:
+            return
 
-        if not self.recent_files:
-            # Add "No recent files" item
-            no_files_item = Gtk.MenuItem.new_with_label("No recent files")
-            no_files_item.set_sensitive(False)
-            no_files_item.show()
-            self.recent_files_menu.append(no_files_item)
-        else:
-            # Add recent files
-            for i, file_path in enumerate(self.recent_files):
-                # Create menu item with filename and path
-                filename = os.path.basename(file_path)
-                directory = os.path.dirname(file_path)
-
-                # Truncate long paths
-                if len(directory) > 50:
-                    directory = "..." + directory[-47:]
-
-                label = f"{i+1}. {filename}"
-                menu_item = Gtk.MenuItem.new_with_label(label)
-                menu_item.set_tooltip_text(file_path)
-                menu_item.connect("activate", self.open_recent_file, file_path)
-                menu_item.show()
-                self.recent_files_menu.append(menu_item)
-
-                # Add accelerator for first 9 files (Ctrl+Alt+1-9)
-                if i < 9 and self.accel_group:
-                    menu_item.add_accelerator("activate", self.accel_group,
-                                            ord('1') + i, Gdk.ModifierType.CONTROL_MASK | Gdk.ModifierType.MOD1_MASK,
-                                            Gtk.AccelFlags.VISIBLE)
-
-            # Add separator and clear option
-            separator = Gtk.SeparatorMenuItem()
-            separator.show()
-            self.recent_files_menu.append(separator)
-
-            clear_item = Gtk.MenuItem.new_with_label("Clear Recent Files")
-            clear_item.connect("activate", lambda x: self.clear_recent_files())
-            clear_item.show()
-            self.recent_files_menu.append(clear_item)
+        self.placeholder_item.set_visible(not paths)
+        for item in self.action_items:
+            item.set_visible(bool(paths))
+
+        for i, file_path in enumerate(paths):
+            if i == len(self.file_items):
+                self.file_items.append(self._create_file_item(i))
+            elif i < len(self.menu_paths) and self.menu_paths[i] == file_path:
+                continue
+            menu_item = self.file_items[i]
+            menu_item.set_label(f"{i+1}. {os.path.basename(file_path)}")
+            menu_item.set_tooltip_text(file_path)
+
+        for menu_item in self.file_items[len(paths):]:
+            menu_item.destroy()
+        del self.file_items[len(paths):]
+        self.menu_paths = paths
+
+    def _create_file_item(self, position):
+        """Create the menu item at a position of the file list"""
+        menu_item = Gtk.MenuItem.new_with_label("")
+        menu_item.connect("activate", self._on_file_item_activate, position)
+        menu_item.show()
+        self.recent_files_menu.insert(menu_item, position)
+
+        # Add accelerator for first 9 files (Ctrl+Alt+1-9)
+        if position < 9 and self.accel_group:
+            menu_item.add_accelerator("activate", self.accel_group,
+                                      ord('1') + position,
+                                      Gdk.ModifierType.CONTROL_MASK | Gdk.ModifierType.MOD1_MASK,
+                                      Gtk.AccelFlags.VISIBLE)
+        return menu_item
+
+    def _on_file_item_activate(self, menuitem, position):
+        self.open_recent_file(menuitem, self.menu_paths[position])
 
     def get_recent_files(self):
         """
         Get the list of recent files
 
         Returns:
-            list: List of recent file paths
+            list: List of recent file paths, ranked by frecency
         """
-        return self.recent_files.copy()
+        now = time.time()
+        # Stable sort, equal scores keep their stored order
+        ranked = sorted(self.entries.values(), key=lambda entry: (-self.get_frecency(entry, now), -entry['last']))
+        return [entry['path'] for entry in ranked]
 
     def has_recent_files(self):
         """
@@ -204,4 +340,71 @@ class RecentFilesManager:
         Returns:
             bool: True if there are recent files, False otherwise
         """
-        return len(self.recent_files) > 0
+        return len(self.entries) > 0
+
+    def search(self, query, limit=None):
+        """
+        Search the recent files by file name and path
+
+        Args:
+            query (str): Words that must all appear in the path, case insensitive
+            limit (int): Maximum number of results, None for all
+
+        Returns:
+            list: Matching paths, those matching in the file name first, then by frecency
+        """
+        terms = query.lower().split()
+        matches = []
+        for file_path in self.get_recent_files():
+            filename, lower_path = self.index[file_path]
+            if all(term in lower_path for term in terms):
+                matches.append((not all(term in filename for term in terms), file_path))
+        matches.sort(key=lambda match: match[0])
+        return [file_path for _in_directory, file_path in matches[:limit]]
+
+    def show_search_dialog(self):
+        """Show a dialog to search all recent files and open one of them"""
+        dialog = Gtk.Dialog(title="Search Recent Files", transient_for=self.parent_window, modal=True)
+        dialog.add_button(Gtk.STOCK_CLOSE, Gtk.ResponseType.CLOSE)
+        dialog.set_default_size(500, 400)
+
+        box = dialog.get_content_area()
+        box.set_spacing(6)
+        box.set_border_width(12)
+        search_entry = Gtk.SearchEntry()
+        box.pack_start(search_entry, False, False, 0)
+        list_box = Gtk.ListBox()
+        scrolled = Gtk.ScrolledWindow()
+        scrolled.add(list_box)
+        box.pack_start(scrolled, True, True, 0)
+
+        def show_results(entry=None):
+            for row in list_box.get_children():
+                list_box.remove(row)
+            for file_path in self.search(search_entry.get_text(), limit=50):
+                label = Gtk.Label(xalign=0)
+                label.set_markup(f"<b>{GLib.markup_escape_text(os.path.basename(file_path))}</b>\n"
+                                 f"<small>{GLib.markup_escape_text(os.path.dirname(file_path))}</small>")
+                row = Gtk.ListBoxRow()
+                row.add(label)
+                row.file_path = file_path
+                list_box.add(row)
+            list_box.show_all()
+            list_box.select_row(list_box.get_row_at_index(0))
+
+        def open_row(list_box, row):
+            dialog.destroy()
+            self.open_recent_file(None, row.file_path)
+
+        def open_first(entry):
+            row = list_box.get_selected_row()
+            if row is not None:
+                open_row(list_box, row)
+
+        search_entry.connect("search-changed", show_results)
+        search_entry.connect("activate", open_first)
+        list_box.connect("row-activated", open_row)
+        dialog.connect("response", lambda dialog, response: dialog.destroy())
+
+        show_results()
+        dialog.show_all()
@@ -0,0 +1,109 @@
+import logging
+import threading
+import time
+
+from gi.repository import GLib
+
+logger = logging.getLogger('reremarkable')
+
+class RenderWorker:
+    """
+    Renders text snapshots off the GTK main loop:
+    - A single daemon thread converts the most recently submitted snapshot
+    - Every submission gets a generation number; unstarted older work is dropped
+    - Results come back on the main loop through GLib.idle_add, and results
+      of stale generations are discarded
+    """
+
+    def __init__(self, render_function, result_callback):
+        """
+        Initialize the RenderWorker
+
+        Args:
+            render_function: Function converting a text snapshot, run on the worker thread
+            result_callback: Function called on the main loop with
+                (result, context, duration_ms) for the latest generation only
+        """
+        self.render_function = render_function
+        self.result_callback = result_callback
+
+        self.generation = 0
+        self._pending = None
+        self._busy = False
+        self._running = True
+        self._condition = threading.Condition()
+        self._thread = None
+
+    def submit(self, text, context=None):
+        """
+        Queue a snapshot for rendering, replacing any snapshot not yet started
+
+        Args:
+            text (str): Snapshot to render
+            context: Opaque value handed back to the result callback
+
+        Returns:
+            int: Generation number of this submission
+        """
+        with self._condition:
+            self.generation += 1
+            self._pending = (self.generation, text, context)
+            self._condition.notify()
+
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="reremarkable-render", daemon=True)
+                self._thread.start()
+
+            return self.generation
+
+    def is_busy(self):
+        """Check if a render is queued or in progress"""
+        with self._condition:
+            return self._busy or self._pending is not None
+
+    def stop(self):
+        """Stop the worker thread after the current render"""
+        with self._condition:
+            self._running = False
+            self._pending = None
+            self._condition.notify()
+
+    def _run(self):
+        """Worker thread loop"""
+        while True:
+            with self._condition:
+                while self._pending is None and self._running:
+                    self._condition.wait()
+                if not self._running:
+                    return
+                generation, text, context = self._pending
+                self._pending = None
+                self._busy = True
+
+            started = time.perf_counter()
+            try:
+                result, error = self.render_function(text), None
+            except Exception as e:
+                result, error = None, e
+            duration = (time.perf_counter() - started) * 1000
+
+            with self._condition:
+                self._busy = False
+
+            GLib.idle_add(self._deliver, generation, result, context, duration, error)
+
+    def _deliver(self, generation, result, context, duration, error):
+        """Hand a finished render to the result callback on the main loop"""
+        if generation != self.generation:
+            # A newer snapshot has been submitted, drop this result
+            return False
+
+        if error is not None:
+            logger.error(f"Error rendering live preview: {error}")
+            return False
+
+        try:
+            self.result_callback(result, context, duration)
+        except Exception as e:
+            logger.error(f"Error in render result callback: {e}")
+        return False  # Don't repeat this idle callback
@@ -0,0 +1,163 @@
+import bisect
+import json
+import logging
+
+logger = logging.getLogger('reremarkable')
+
+def interpolate(xs, ys, x):
+    """
+    Piecewise linear lookup in a sorted table
+
+    Args:
+        xs (list): Sorted keys
+        ys (list): Values for the keys, same length as xs
+        x (float): Key to look up
+
+    Returns:
+        float: Value at x, clamped to the ends of the table
+    """
+    i = bisect.bisect_right(xs, x) - 1
+    if i < 0:
+        return ys[0]
+    if i >= len(xs) - 1:
+        return ys[-1]
+    x0, x1 = xs[i], xs[i + 1]
+    if x1 == x0:
+        return ys[i]
+    return ys[i] + (ys[i + 1] - ys[i]) * (x - x0) / (x1 - x0)
+
+class ScrollSync:
+    """
+    Keeps the editor and the live preview scrolled to the same source line:
+    - Preview blocks carry a data-source-line attribute; preview.js posts
+      the page offset of every block through a script message handler
+    - Both directions are mapped through that sorted (line, offset) table
+      with a binary search, instead of proportionally to the scroll height
+    - Editor scrolling is throttled to one sync per frame with a tick
+      callback, and preview.js throttles its scroll events with
+      requestAnimationFrame
+    - A guard flag stops the two sides from echoing each other
+    """
+
+    MESSAGE_HANDLER = 'reremarkable'
+
+    def __init__(self, text_view, text_view_adjustment, web_view):
+        """
+        Initialize the ScrollSync
+
+        Args:
+            text_view: GtkSource.View of the editor
+            text_view_adjustment: Vertical adjustment of the editor scrolled window
+            web_view: WebKit2.WebView showing the live preview
+        """
+        self.text_view = text_view
+        self.adjustment = text_view_adjustment
+        self.web_view = web_view
+
+        self.lines = []  # Source lines of the preview blocks, sorted
+        self.offsets = []  # Page offsets of the blocks, in pixels
+        self.tick_id = None
+        self.syncing_editor = False
+
+        self.adjustment.connect("value-changed", self._on_editor_scrolled)
+
+        manager = self.web_view.get_user_content_manager()
+        manager.connect(f"script-message-received::{self.MESSAGE_HANDLER}", self._on_script_message)
+        manager.register_script_message_handler(self.MESSAGE_HANDLER)
+
+    def sync_preview(self):
+        """Scroll the preview to the source line at the top of the editor"""
+        if len(self.lines) < 2:
+            return
+
+        value = self.adjustment.get_value()
+        if value >= self.adjustment.get_upper() - self.adjustment.get_page_size():
+            offset = None  # Editor at the bottom, keep the preview at its bottom too
+        elif value <= self.adjustment.get_lower():
+            offset = 0
+        else:
+            offset = interpolate(self.lines, self.offsets, self._get_editor_line(value))
+
+        self.web_view.run_javascript(f"reremarkable.scrollTo({json.dumps(offset)});", None, None, None)
+
+    def _get_editor_line(self, y):
+        """
+        Get the fractional source line at a vertical editor position
+
+        Args:
+            y (float): Buffer y coordinate
+
+        Returns:
+            float: Line number plus the fraction of that line above y
+        """
+        line_iter, line_top = self.text_view.get_line_at_y(int(y))
+        _, height = self.text_view.get_line_yrange(line_iter)
+        fraction = (y - line_top) / height if height > 0 else 0
+        return line_iter.get_line() + min(max(fraction, 0), 1)
+
+    def _scroll_editor_to_line(self, line):
+        """Scroll the editor so the fractional source line is at the top"""
+        text_buffer = self.text_view.get_buffer()
+        whole_line = min(int(line), text_buffer.get_line_count() - 1)
+        line_iter = text_buffer.get_iter_at_line(whole_line)
+        line_top, height = self.text_view.get_line_yrange(line_iter)
+        value = line_top + (line - whole_line) * height
+        self._set_editor_value(value)
+
+    def _set_editor_value(self, value):
+        """Move the editor without syncing the preview back"""
+        upper = self.adjustment.get_upper() - self.adjustment.get_page_size()
+        self.syncing_editor = True
+        try:
+            self.adjustment.set_value(min(max(value, self.adjustment.get_lower()), upper))
+        finally:
+            self.syncing_editor = False
+
+    def _on_editor_scrolled(self, adjustment):
+        """Schedule a preview sync for the next frame"""
+        if self.syncing_editor or self.tick_id is not None:
+            return
+        self.tick_id = self.text_view.add_tick_callback(self._on_tick)
+
+    def _on_tick(self, widget, frame_clock):
+        self.tick_id = None
+        self.sync_preview()
+        return False
+
+    def _on_script_message(self, manager, js_result):
+        """Handle block offset tables and scroll positions posted by preview.js"""
+        try:
+            message = json.loads(js_result.get_js_value().to_json(0))
+        except Exception as e:
+            logger.warning(f"Invalid message from the live preview: {e}")
+            return
+
+        if message.get('type') == 'blocks':
+            self._set_table(message['blocks'], message['height'])
+            self.sync_preview()
+        elif message.get('type') == 'scroll' and len(self.lines) >= 2:
+            if message.get('bottom'):
+                self._set_editor_value(self.adjustment.get_upper())
+            else:
+                self._scroll_editor_to_line(interpolate(self.offsets, self.lines, message['top']))
+
+    def _set_table(self, blocks, height):
+        """
+        Rebuild the sorted line/offset table
+
+        Args:
+            blocks (list): [source_line, offset] pairs in document order
+            height (float): Scroll height of the preview page
+        """
+        lines = [0]
+        offsets = [0]
+        for line, offset in blocks:
+            # Both columns have to stay sorted for the binary searches
+            if line > lines[-1] and offset >= offsets[-1]:
+                lines.append(line)
+                offsets.append(offset)
+        # Anchor the end of the document to the end of the page
+        lines.append(max(self.text_view.get_buffer().get_line_count(), lines[-1] + 1))
+        offsets.append(max(height, offsets[-1]))
+        self.lines = lines
+        self.offsets = offsets
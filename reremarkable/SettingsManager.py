@@ -1,15 +1,49 @@
 
+import ast
+import json
 import logging
 import os
+import tempfile
+from contextlib import contextmanager
+
+from gi.repository import GLib
 
 logger = logging.getLogger('reremarkable')
 
+# Version of the settings file format, stored in the file
+SETTINGS_VERSION = 1
+
 class SettingsManager:
+    """
+    Keeps the settings in memory and persists them to the settings file:
+    - One versioned JSON file holds the settings, the window layout and the
+      recent files; stored values that do not match the type of their
+      default are replaced by the default
+    - The old files (the Python literal reremarkable.settings and
+      ~/.config/reremarkable/layout.json and recent_files.txt) are migrated
+      on first start and left in place
+    - Changes mark the settings dirty; the file is written once they have
+      been quiet for WRITE_DELAY milliseconds, so a burst of changes (e.g.
+      repeated zooming) costs one write
+    - transaction() groups changes, they are written once it ends
+    - flush() writes pending changes right away, called at shutdown
+    - The file is replaced atomically through a temporary file, so a crash
+      while writing never leaves a truncated settings file
+    """
+
+    # Milliseconds without changes before they are written
+    WRITE_DELAY = 500
+
     def __init__(self, home_dir):
         self.homeDir = home_dir
         self.path = os.path.join(self.homeDir, ".reremarkable/")
-        self.settings_path = os.path.join(self.path, "reremarkable.settings")
+        self.settings_path = os.path.join(self.path, "settings.json")
+        self.legacy_settings_path = os.path.join(self.path, "reremarkable.settings")
+        self.legacy_config_dir = os.path.join(self.homeDir, ".config", "reremarkable")
         self.settings = {}
+        self.dirty = False
+        self._write_id = None
+        self._transaction_depth = 0
         self._initialize_defaults()
 
     def _initialize_defaults(self):
@@ -25,7 +59,17 @@ class SettingsManager:
             'vertical': False,
             'word-wrap': True,
             'zoom-level': 1,
-            'rtl': False
+            'rtl': False,
+            'preview-delay': 75,
+            'incremental-preview': True,
+            'code-highlighting': "highlightjs",
+            'wkhtmltopdf-path': "",
+            'export-cache': True,
+            'export-cache-size': 256,
+            'prettify-html': True,
+            'pdf-image-dpi': 150,
+            'layout': {},
+            'recent-files': []
         }
 
     def check_settings(self):
@@ -33,43 +77,169 @@ class SettingsManager:
         if not os.path.exists(self.path):
             os.makedirs(self.path)
 
-        if not os.path.isfile(self.settings_path):
-            self.settings = self.default_settings.copy()
+        if self.load_settings_from_file():
             self.write_settings()
-        else:
-            self.load_settings_from_file()
 
     def load_settings_from_file(self):
-        """Load settings from file"""
-        try:
-            with open(self.settings_path) as settings_file:
-                self.settings = eval(settings_file.read())
+        """
+        Load settings from file, or from the old files when there is no settings file yet
 
-            # Add any missing default settings
-            for key, value in self.default_settings.items():
-                if key not in self.settings:
-                    self.settings[key] = value
+        Returns:
+            bool: True if the settings file does not exist yet and should be written
+        """
+        if not os.path.isfile(self.settings_path):
+            self.settings = self._apply_defaults(self._read_legacy_settings())
+            return True
 
-        except Exception as e:
+        settings = {}
+        try:
+            with open(self.settings_path, encoding='utf-8') as settings_file:
+                data = json.load(settings_file)
+            if data.get('version', 0) > SETTINGS_VERSION:
+                logger.warning(f"Settings file {self.settings_path} was written by a newer version")
+            settings = data['settings']
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
             logger.error(f"Error loading settings: {e}")
-            self.settings = self.default_settings.copy()
+        self.settings = self._apply_defaults(settings)
+        return False
+
+    def _apply_defaults(self, settings):
+        """
+        Fill in missing settings and replace values of the wrong type with their default
+
+        Args:
+            settings (dict): Stored settings, unknown keys are kept
+
+        Returns:
+            dict: Complete settings
+        """
+        if not isinstance(settings, dict):
+            settings = {}
+        settings = dict(settings)
+        for key, default in self.default_settings.items():
+            value = settings.get(key)
+            if isinstance(default, bool):
+                valid = isinstance(value, bool)
+            elif isinstance(default, (int, float)):
+                valid = isinstance(value, (int, float)) and not isinstance(value, bool)
+            else:
+                valid = isinstance(value, type(default))
+            if not valid:
+                if key in settings:
+                    logger.warning(f"Ignoring invalid value {value!r} for setting '{key}'")
+                settings[key] = default.copy() if isinstance(default, (dict, list)) else default
+        return settings
+
+    def _read_legacy_settings(self):
+        """
+        Read the settings, window layout and recent files from the files used before settings.json
+
+        Returns:
+            dict: Settings found in the old files, empty if there are none
+        """
+        settings = {}
+        try:
+            with open(self.legacy_settings_path, encoding='utf-8') as settings_file:
+                settings = ast.literal_eval(settings_file.read())
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, SyntaxError) as e:
+            logger.error(f"Could not migrate settings from {self.legacy_settings_path}: {e}")
+        if not isinstance(settings, dict):
+            settings = {}
+
+        layout_path = os.path.join(self.legacy_config_dir, 'layout.json')
+        try:
+            with open(layout_path, encoding='utf-8') as layout_file:
+                settings['layout'] = json.load(layout_file)
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            logger.error(f"Could not migrate window layout from {layout_path}: {e}")
+
+        recent_files_path = os.path.join(self.legacy_config_dir, 'recent_files.txt')
+        try:
+            with open(recent_files_path, encoding='utf-8') as recent_files_file:
+                settings['recent-files'] = [line.strip() for line in recent_files_file if line.strip()]
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.error(f"Could not migrate recent files from {recent_files_path}: {e}")
+
+        return settings
 
     def write_settings(self):
-        """Write settings to file"""
+        """Write settings to file now, replacing it atomically"""
+        self._cancel_write()
+        temp_path = None
         try:
-            with open(self.settings_path, 'w') as settings_file:
-                settings_file.write(str(self.settings))
+            fd, temp_path = tempfile.mkstemp(prefix=".settings.json.", dir=self.path)
+            with os.fdopen(fd, 'w', encoding='utf-8') as settings_file:
+                json.dump({'version': SETTINGS_VERSION, 'settings': self.settings}, settings_file, indent=2)
+                settings_file.flush()
+                os.fsync(settings_file.fileno())
+            os.replace(temp_path, self.settings_path)
+            self.dirty = False
         except Exception as e:
             logger.error(f"Error writing settings: {e}")
+            if temp_path is not None and os.path.exists(temp_path):
+                os.unlink(temp_path)
+
+    def flush(self):
+        """Write pending changes now, e.g. at shutdown"""
+        if self.dirty:
+            self.write_settings()
+        else:
+            self._cancel_write()
+
+    @contextmanager
+    def transaction(self):
+        """
+        Group setting changes into a single write
+
+        Changes made inside the with block are written once the outermost
+        transaction ends, after the usual write delay.
+        """
+        self._transaction_depth += 1
+        try:
+            yield self
+        finally:
+            self._transaction_depth -= 1
+            if self._transaction_depth == 0 and self.dirty:
+                self._schedule_write()
+
+    def _mark_dirty(self):
+        """Note unsaved changes and schedule their write"""
+        self.dirty = True
+        if self._transaction_depth == 0:
+            self._schedule_write()
+
+    def _schedule_write(self):
+        """Restart the write timer, so a burst of changes is written once"""
+        self._cancel_write()
+        self._write_id = GLib.timeout_add(self.WRITE_DELAY, self._on_write_due)
+
+    def _cancel_write(self):
+        if self._write_id is not None:
+            GLib.source_remove(self._write_id)
+            self._write_id = None
+
+    def _on_write_due(self):
+        self._write_id = None
+        if self.dirty:
+            self.write_settings()
+        return False
 
     def get_setting(self, key, default=None):
         """Get a setting value"""
         return self.settings.get(key, default)
 
     def set_setting(self, key, value):
-        """Set a setting value and save to file"""
+        """Set a setting value, written to file shortly after"""
+        if key in self.settings and self.settings[key] == value:
+            return
         self.settings[key] = value
-        self.write_settings()
+        self._mark_dirty()
 
     def get_all_settings(self):
         """Get all settings"""
@@ -78,12 +248,12 @@ class SettingsManager:
     def update_settings(self, new_settings):
         """Update multiple settings at once"""
         self.settings.update(new_settings)
-        self.write_settings()
+        self._mark_dirty()
 
     def reset_to_defaults(self):
-        """Reset all settings to defaults"""
-        self.settings = self.default_settings.copy()
-        self.write_settings()
+        """Reset all settings to defaults, with their own copies of the layout and recent files"""
+        self.settings = self._apply_defaults({})
+        self._mark_dirty()
 
     # Convenience methods for common settings
     def is_nightmode_enabled(self):
@@ -118,3 +288,54 @@ class SettingsManager:
 
     def get_zoom_level(self):
         return self.get_setting('zoom-level', 1)
+
+    def get_preview_delay(self):
+        return self.get_setting('preview-delay', 75)
+
+    def is_incremental_preview_enabled(self):
+        return self.get_setting('incremental-preview', True)
+
+    def get_code_highlighting(self):
+        return self.get_setting('code-highlighting', "highlightjs")
+
+    def get_wkhtmltopdf_path(self):
+        return self.get_setting('wkhtmltopdf-path', "")
+
+    def is_prettify_html_enabled(self):
+        return self.get_setting('prettify-html', True)
+
+    def is_export_cache_enabled(self):
+        return self.get_setting('export-cache', True)
+
+    def get_export_cache_size(self):
+        """Get the export cache size limit in bytes (the setting is in megabytes)"""
+        return int(self.get_setting('export-cache-size', 256)) * 1024 * 1024
+
+    def get_window_layout(self):
+        """Get the saved window layout: size, position, maximized state and panes"""
+        return dict(self.get_setting('layout', {}))
+
+    def get_recent_files(self):
+        """
+        Get the recently opened files
+
+        Paths stored by older versions are read as opened once, at an unknown time.
+
+        Returns:
+            list: Dicts with the 'path', open 'count' and 'last' open time of each file
+        """
+        entries = []
+        for entry in self.get_setting('recent-files', []):
+            if isinstance(entry, str):
+                entry = {'path': entry}
+            try:
+                entries.append({'path': str(entry['path']),
+                                'count': int(entry.get('count', 1)),
+                                'last': float(entry.get('last', 0))})
+            except (KeyError, TypeError, ValueError, AttributeError):
+                logger.warning(f"Ignoring invalid recent file entry {entry!r}")
+        return entries
+
+    def get_pdf_image_dpi(self):
+        """Get the resolution images are downscaled to for PDF export, 0 keeps them unchanged"""
+        return int(self.get_setting('pdf-image-dpi', 150))
@@ -1,6 +1,8 @@
 
 import logging
+import os
 
+import mathjax_config
 import styles
 
 logger = logging.getLogger('reremarkable')
@@ -8,31 +10,26 @@ logger = logging.getLogger('reremarkable')
 class StyleManager:
     """Handles style management for the markdown editor"""
 
-    # Available style mappings
-    STYLE_MAPPINGS = {
-        'dark': lambda: styles.dark,
-        'foghorn': lambda: styles.foghorn,
-        'github': lambda: styles.github,
-        'github_dark': lambda: styles.github_dark,
-        'github_light': lambda: styles.github_light,
-        'handwriting': lambda: styles.handwriting,
-        'markdown': lambda: styles.markdown,
-        'metro_vibes': lambda: styles.metro_vibes,
-        'metro_vibes_dark': lambda: styles.metro_vibes_dark,
-        'modern': lambda: styles.modern,
-        'screen': lambda: styles.screen,
-        'solarized_dark': lambda: styles.solarized_dark,
-        'solarized_light': lambda: styles.solarized_light
-    }
-
-    def __init__(self, settings_manager, media_path):
+    # Head of the live preview page, its stylesheets are installed as WebKit user style sheets
+    PREVIEW_HTML_HEAD = (
+        '<!doctype HTML><html><head><meta charset="utf-8">'
+        '<title>Made with reRemarkable!</title>'
+        '</head><body>'
+    )
+
+    def __init__(self, settings_manager, media_path, code_highlighter=None):
         self.settings_manager = settings_manager
         self.media_path = media_path
+        self.code_highlighter = code_highlighter  # Replaces highlight.js when set
         self.current_style = "github"  # Default style
         self.style_change_callbacks = []
         self.menu_items = {}  # Dictionary to store menu item references
         self.menu_labels = {}  # Dictionary to store original menu item labels
 
+        # HTML head per (style, RTL, media path), with the CSS file mtime it was built from
+        self._head_cache = {}
+        self._highlightjs_css = None
+
         # Load current style from settings
         self.load_current_style()
 
@@ -55,12 +52,12 @@ class StyleManager:
 
     def apply_current_style(self):
         """Apply the currently selected style"""
-        if self.current_style in self.STYLE_MAPPINGS:
-            styles.set(self.STYLE_MAPPINGS[self.current_style]())
+        if self.current_style in styles.AVAILABLE_STYLES:
+            styles.set_style(self.current_style)
         else:
             logger.warning(f"Unknown style: {self.current_style}")
             # Fallback to github style
-            styles.set(styles.github)
+            styles.set_style("github")
             self.current_style = "github"
 
     def set_style(self, style_name):
@@ -70,12 +67,12 @@ class StyleManager:
         Args:
             style_name: Name of the style to apply
         """
-        if style_name not in self.STYLE_MAPPINGS:
+        if style_name not in styles.AVAILABLE_STYLES:
             logger.error(f"Unknown style: {style_name}")
             return False
 
         self.current_style = style_name
-        styles.set(self.STYLE_MAPPINGS[style_name]())
+        styles.set_style(style_name)
         self.settings_manager.set_setting('style', style_name)
         self.update_visual_markers()  # Update visual markers when style changes
         self._notify_style_change()
@@ -85,20 +82,94 @@ class StyleManager:
         """Get the current style name"""
         return self.current_style
 
+    def uses_highlightjs(self):
+        """Check if code blocks are highlighted by highlight.js in the page"""
+        return self.code_highlighter is None
+
     def get_html_head_style(self):
-        """Get the HTML head style section for preview"""
+        """
+        Get the HTML head style section for preview and exports
+
+        The head is built once per style, RTL direction and media path and
+        reused until the style's CSS file changes on disk.
+
+        Returns:
+            str: HTML up to and including the opening body tag
+        """
+        key = (styles.get_current_style_name(), styles.rtl(), self.media_path)
+        mtime = styles.get_style_mtime(key[0])
+        cached = self._head_cache.get(key)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        html_start = self._build_html_head_style()
+        self._head_cache[key] = (mtime, html_start)
+        return html_start
+
+    def _build_html_head_style(self):
+        if self.uses_highlightjs():
+            code_style = f'<link rel="stylesheet" href="{self.media_path}highlightjs.default.min.css">'
+        else:
+            code_style = f"<style type='text/css'>{self.code_highlighter.get_css()}</style>"
         html_start = (
             '<!doctype HTML><html><head><meta charset="utf-8">'
             '<title>Made with reRemarkable!</title>'
-            f'<link rel="stylesheet" href="{self.media_path}highlightjs.default.min.css">'
+            f'{code_style}'
             f"<style type='text/css'>{styles.get()}</style>"
             '</head><body>'
         )
         return html_start
 
+    def get_preview_html_head(self):
+        """Get the HTML head of the live preview page, without stylesheets"""
+        return self.PREVIEW_HTML_HEAD
+
+    def get_preview_style_sheets(self):
+        """
+        Get the stylesheets of the live preview, installed as WebKit user style sheets
+
+        Returns:
+            list: CSS sources, the code highlighting rules followed by the current style
+        """
+        return [self._get_code_css(), styles.get()]
+
+    def _get_code_css(self):
+        """Get the code highlighting rules, read from the highlight.js stylesheet once"""
+        if not self.uses_highlightjs():
+            return self.code_highlighter.get_css()
+        if self._highlightjs_css is None:
+            css_file = os.path.join(self.media_path, 'highlightjs.default.min.css')
+            try:
+                with open(css_file, encoding='utf-8') as f:
+                    self._highlightjs_css = f.read()
+            except OSError as e:
+                logger.warning(f"Could not load {css_file}: {e}")
+                self._highlightjs_css = ''
+        return self._highlightjs_css
+
+    def get_html_end(self, include_math=False):
+        """
+        Get the HTML footer with scripts for syntax highlighting and MathJax
+
+        Args:
+            include_math (bool): Load MathJax, only needed when the body contains math
+
+        Returns:
+            str: HTML footer closing the document
+        """
+        html_end = ''
+        if self.uses_highlightjs():
+            html_end += (
+                f'<script src="{self.media_path}highlight.min.js"></script>'
+                '<script>hljs.initHighlightingOnLoad();</script>'
+            )
+        if include_math:
+            html_end += mathjax_config.get_script_tags(self.media_path)
+        return html_end + '</body></html>'
+
     def get_available_styles(self):
         """Get list of available predefined styles"""
-        return list(self.STYLE_MAPPINGS.keys())
+        return styles.get_available_styles()
 
     def set_menu_items(self, builder):
         """
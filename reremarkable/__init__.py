@@ -1,15 +1,19 @@
 
 import optparse
+import os
 import sys
 from locale import gettext as _
 
+# Imported before gi, so the start-up profile covers the gi import
+import startup_profile
+
+# isort: split
 import gi
 
 gi.require_version('Gtk', '3.0')
-from gi.repository import Gtk  # pylint: disable=E0611
+from reremarkable_lib import get_version, reremarkableconfig, set_up_logging
 
-from reremarkable import reRemarkableWindow
-from reremarkable_lib import get_version, set_up_logging
+startup_profile.mark("import gi and reremarkable_lib")
 
 
 def parse_options():
@@ -18,16 +22,111 @@ def parse_options():
     parser.add_option(
         "-v", "--verbose", action="count", dest="verbose",
         help=_("Show debug messages (-vv debugs reremarkable_lib also)"))
+    parser.add_option(
+        "--new-instance", action="store_true", dest="new_instance", default=False,
+        help=_("Start a separate instance instead of opening the files in the running one"))
+    parser.add_option(
+        "--profile-startup", action="store_true", dest="profile_startup", default=False,
+        help=_("Print how long each start-up phase takes, up to the first drawn window"))
+
+    export_group = optparse.OptionGroup(parser, _("Headless export"),
+                                        _("Export markdown files without opening a window"))
+    export_group.add_option(
+        "--export", action="append", dest="export", metavar="GLOB",
+        help=_("Export the files matching GLOB, ** matches subdirectories (repeatable)"))
+    export_group.add_option(
+        "--format", dest="format", default="html", metavar="FORMATS",
+        help=_("Comma separated export formats: html, html_plain, pdf, pdf_plain [default: %default]"))
+    export_group.add_option(
+        "--style", dest="style", metavar="STYLE",
+        help=_("Style for styled exports [default: the configured style]"))
+    export_group.add_option(
+        "--output-dir", dest="output_dir", metavar="DIR",
+        help=_("Directory for exported files [default: next to each source file]"))
+    export_group.add_option(
+        "--jobs", dest="jobs", type="int", metavar="N",
+        help=_("Number of files exported in parallel [default: one per CPU]"))
+    export_group.add_option(
+        "--pdf-jobs", dest="pdf_jobs", type="int", default=2, metavar="N",
+        help=_("Maximum number of wkhtmltopdf processes at once [default: %default]"))
+    export_group.add_option(
+        "--no-cache", action="store_true", dest="no_cache", default=False,
+        help=_("Export every file again instead of copying unchanged exports from the cache"))
+    parser.add_option_group(export_group)
+
     (options, args) = parser.parse_args()
 
     set_up_logging(options)
 
+    if options.export:
+        import export_pipeline
+        import styles
+
+        options.formats = [name.strip() for name in options.format.split(',') if name.strip()]
+        unknown = [name for name in options.formats if name not in export_pipeline.EXPORT_FORMATS]
+        if unknown or not options.formats:
+            parser.error(_("unknown export format: %s") % ', '.join(unknown or [options.format]))
+        if options.style and options.style not in styles.AVAILABLE_STYLES:
+            parser.error(_("unknown style: %s (available: %s)")
+                         % (options.style, ', '.join(styles.get_available_styles())))
+        if options.jobs is not None and options.jobs < 1:
+            parser.error(_("--jobs must be at least 1"))
+
+    return options, args
+
+def run_export(options):
+    """Run a headless batch export and return the exit status"""
+    import export_pipeline
+
+    media_path = reremarkableconfig.get_data_path() + os.path.sep + "media" + os.path.sep
+    return export_pipeline.run_batch_export(
+        options.export, options.formats, style=options.style, output_dir=options.output_dir,
+        jobs=options.jobs, pdf_jobs=options.pdf_jobs, media_path=media_path, use_cache=not options.no_cache)
+
 def main():
     'constructor for your class instances'
-    parse_options()
+    options, args = parse_options()
+    startup_profile.mark("parse options")
+
+    if options.export:
+        # No window is created, so no display is needed
+        sys.exit(run_export(options))
+
+    from InstanceServer import InstanceServer, forward_to_running_instance
+
+    # Hand the files to a running instance, which opens them in new tabs
+    if not options.new_instance and forward_to_running_instance(args):
+        sys.exit(0)
+    startup_profile.mark("check for a running instance")
+
+    from gi.repository import GLib, Gtk  # pylint: disable=E0611
+
+    from reremarkable import reRemarkableWindow
+    startup_profile.mark("import window modules")
 
     # Run the application.
     window = reRemarkableWindow.RemarkableWindow()
 
     window.show_all()
+    startup_profile.mark("show window")
+    window.open_files(args)
+    startup_profile.mark("open files")
+
+    instance_server = None
+    if not options.new_instance:
+        instance_server = InstanceServer(window.open_files)
+        instance_server.start()
+
+    if options.profile_startup:
+        def on_first_draw(widget, cairo_context):
+            widget.disconnect(draw_handler_id)
+            startup_profile.mark("first frame")
+            # Report once the frame is on screen
+            GLib.idle_add(startup_profile.report)
+            return False
+        draw_handler_id = window.connect_after("draw", on_first_draw)
+
     Gtk.main()
+
+    if instance_server is not None:
+        instance_server.stop()
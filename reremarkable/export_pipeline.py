@@ -0,0 +1,536 @@
+"""GTK-free export pipeline shared by the export dialogs and the --export command line mode."""
+
+import glob
+import hashlib
+import logging
+import multiprocessing
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import HtmlPrettyPrinter
+import mathjax_config
+import styles
+from ExportCache import ExportCache
+from ImageDownscaler import get_local_images
+
+logger = logging.getLogger('reremarkable')
+
+# wkhtmltopdf options used for every PDF export
+PDF_OPTIONS = {
+    'page-size': 'Letter',
+    'margin-top': '0.75in',
+    'margin-right': '0.75in',
+    'margin-bottom': '0.75in',
+    'margin-left': '0.75in',
+    'encoding': "UTF-8",
+    'no-outline': None
+}
+
+# Widths in inches of the page sizes used for PDF export
+PAGE_WIDTHS = {
+    'A4': 8.27,
+    'A5': 5.83,
+    'Legal': 8.5,
+    'Letter': 8.5,
+}
+
+# Lengths of wkhtmltopdf units in inches
+UNIT_INCHES = {'in': 1.0, 'cm': 1 / 2.54, 'mm': 1 / 25.4}
+LENGTH_RE = re.compile(r'^\s*([\d.]+)\s*(in|cm|mm)\s*$')
+
+# Export formats: name -> (file extension, styled)
+EXPORT_FORMATS = {
+    'html': ('html', True),
+    'html_plain': ('html', False),
+    'pdf': ('pdf', True),
+    'pdf_plain': ('pdf', False),
+}
+
+# Characters of HTML encoded at a time for hashing
+HASH_CHUNK_SIZE = 64 * 1024
+
+# Relative image references in markdown
+RELATIVE_IMAGE_RE = re.compile(r'(\!\[.*?\]\()([^/][^:]*?\))')
+
+
+def process_image_paths(text, source_path):
+    """
+    Make relative image paths absolute so they resolve outside the source directory
+
+    Args:
+        text (str): Markdown text containing image references
+        source_path (str): Path of the markdown file, or "Untitled"
+
+    Returns:
+        str: Text with absolute image paths
+    """
+    if source_path == "Untitled":
+        return text
+
+    dirname = os.path.dirname(source_path)
+    return RELATIVE_IMAGE_RE.sub(lambda m: m.group(1) + os.path.join(dirname, m.group(2)), text)
+
+
+def build_styled_html_chunks(style_manager, html_middle):
+    """
+    Get the styled document as pieces, loading MathJax only when needed
+
+    The pieces can be streamed to wkhtmltopdf without joining them first.
+
+    Args:
+        style_manager: StyleManager providing the head and footer
+        html_middle (str): Converted HTML body
+
+    Returns:
+        list: Head, body and end of the HTML document
+    """
+    html_end = style_manager.get_html_end(mathjax_config.contains_math(html_middle))
+    return [style_manager.get_html_head_style(), html_middle, html_end]
+
+
+def build_styled_html(style_manager, html_middle):
+    """
+    Wrap converted HTML in the styled document, loading MathJax only when needed
+
+    Args:
+        style_manager: StyleManager providing the head and footer
+        html_middle (str): Converted HTML body
+
+    Returns:
+        str: Complete HTML document
+    """
+    return ''.join(build_styled_html_chunks(style_manager, html_middle))
+
+
+def get_html_digest(html_chunks):
+    """
+    Hash an HTML document from its pieces, without joining them
+
+    Args:
+        html_chunks (list): Pieces of the HTML document
+
+    Returns:
+        str: Hex SHA-256 digest
+    """
+    digest = hashlib.sha256()
+    for chunk in html_chunks:
+        for start in range(0, len(chunk), HASH_CHUNK_SIZE):
+            digest.update(chunk[start:start + HASH_CHUNK_SIZE].encode('utf-8'))
+    return digest.hexdigest()
+
+
+def get_pdf_options(style_manager, html_content, configuration):
+    """
+    Get the wkhtmltopdf options for a document, limited to what the binary supports
+
+    Args:
+        style_manager: StyleManager, to know if highlight.js runs in the page
+        html_content (str): HTML to convert
+        configuration: pdfkit Configuration of the binary
+
+    Returns:
+        dict: wkhtmltopdf options
+    """
+    options = dict(PDF_OPTIONS)
+    # Only wait for scripts when highlight.js or MathJax have work to do
+    if style_manager.uses_highlightjs() or mathjax_config.contains_math(html_content):
+        options['javascript-delay'] = '550'
+
+    # Leave out what the installed build does not support instead of failing on it
+    unsupported = [key for key in options if not configuration.supports(key)]
+    if unsupported:
+        logger.info(f"wkhtmltopdf does not support {', '.join(unsupported)}, skipping")
+    return {key: value for key, value in options.items() if key not in unsupported}
+
+
+def get_printable_width(options):
+    """
+    Get the width between the page margins of a PDF export
+
+    Args:
+        options (dict): wkhtmltopdf options with page-size, margin-left and margin-right
+
+    Returns:
+        float: Width in inches
+    """
+    width = PAGE_WIDTHS.get(options.get('page-size'), PAGE_WIDTHS['Letter'])
+    for margin in ('margin-left', 'margin-right'):
+        match = LENGTH_RE.match(str(options.get(margin, '')))
+        if match:
+            width -= float(match.group(1)) * UNIT_INCHES[match.group(2)]
+    return max(width, 1.0)
+
+
+def get_image_stats(html_content):
+    """
+    Get the files of the local images of a document, for its export cache key
+
+    Args:
+        html_content (str): HTML with absolute image paths, before inlining
+
+    Returns:
+        list: [path, mtime in ns, size] per image, None for missing files
+    """
+    stats = []
+    for path in sorted(set(get_local_images(html_content).values())):
+        try:
+            stat = os.stat(path)
+            stats.append([path, stat.st_mtime_ns, stat.st_size])
+        except OSError:
+            stats.append([path, None, None])
+    return stats
+
+
+def inline_images(html_content, downscaler):
+    """
+    Inline the images of a PDF export, resized to the page
+
+    Args:
+        html_content (str): HTML with absolute image paths
+        downscaler: ImageDownscaler, or None to leave the images unchanged
+
+    Returns:
+        str: HTML for wkhtmltopdf
+    """
+    if downscaler is None:
+        return html_content
+    return downscaler.inline_images(html_content)
+
+
+def write_html(html_content, file_path, prettify=True):
+    """
+    Write an HTML document, pretty-printed while it is written
+
+    Args:
+        html_content (str): HTML to write
+        file_path (str): Output file path
+        prettify (bool): Indent block-level tags, or write the HTML unchanged
+    """
+    with open(file_path, 'w', encoding='utf-8') as f:
+        HtmlPrettyPrinter.write_html(html_content, f, prettify)
+
+
+def find_sources(patterns):
+    """
+    Expand glob patterns into markdown files
+
+    Args:
+        patterns (list): Glob patterns or file names, ** matches directories recursively
+
+    Returns:
+        list: Sorted unique absolute file paths
+    """
+    sources = set()
+    for pattern in patterns:
+        matches = glob.glob(os.path.expanduser(pattern), recursive=True)
+        sources.update(os.path.abspath(path) for path in matches if os.path.isfile(path))
+    return sorted(sources)
+
+
+def get_source_root(sources):
+    """
+    Get the deepest directory containing all sources
+
+    Args:
+        sources (list): Absolute paths of the markdown files
+
+    Returns:
+        str: Common directory, the output directory mirrors the tree below it
+    """
+    return os.path.commonpath([os.path.dirname(source) for source in sources])
+
+
+def get_output_path(source_path, output_dir, export_format, formats, source_root=None):
+    """
+    Get the output file of one export format
+
+    Plain variants get a .plain suffix when the styled variant of the same
+    file type is exported as well. In the output directory, files keep their
+    path relative to source_root, so equally named files in different
+    directories do not overwrite each other.
+
+    Args:
+        source_path (str): Path of the markdown file
+        output_dir (str): Directory for the exported files, or None to write next to the source
+        export_format (str): Export format name from EXPORT_FORMATS
+        formats (list): All export formats of the run
+        source_root (str): Directory the output directory mirrors (optional)
+
+    Returns:
+        str: Output file path
+    """
+    extension, styled = EXPORT_FORMATS[export_format]
+    base = os.path.splitext(os.path.basename(source_path))[0]
+    if not styled and extension in formats:
+        base += '.plain'
+    directory = os.path.dirname(source_path)
+    if output_dir:
+        directory = os.path.join(output_dir, os.path.relpath(directory, source_root or directory))
+    return os.path.normpath(os.path.join(directory, f"{base}.{extension}"))
+
+
+def find_duplicate_outputs(sources, formats, output_dir=None, source_root=None):
+    """
+    Find sources whose exports would write to the same file
+
+    Args:
+        sources (list): Absolute paths of the markdown files
+        formats (list): Export format names from EXPORT_FORMATS
+        output_dir (str): Directory for the exported files (optional)
+        source_root (str): Directory the output directory mirrors (optional)
+
+    Returns:
+        dict: Source path -> error message, for every source involved in a clash
+    """
+    writers = {}
+    for source in sources:
+        for export_format in formats:
+            output_path = get_output_path(source, output_dir, export_format, formats, source_root)
+            writers.setdefault(output_path, []).append(source)
+
+    errors = {}
+    for output_path, clashing in writers.items():
+        clashing = sorted(set(clashing))
+        if len(clashing) > 1:
+            for source in clashing:
+                others = ', '.join(other for other in clashing if other != source)
+                errors[source] = f"{output_path} would also be written by {others}"
+    return errors
+
+
+# Per-process state of the batch export workers
+_worker = {}
+
+
+def _load_settings():
+    """
+    Load the user's settings without creating a settings file
+
+    Returns:
+        SettingsManager: Settings of the user, or the defaults
+    """
+    from SettingsManager import SettingsManager
+
+    settings_manager = SettingsManager(os.path.expanduser('~'))
+    settings_manager.load_settings_from_file()
+    return settings_manager
+
+
+def _init_worker(style, media_path, pdf_semaphore, use_cache):
+    """
+    Set up the renderer, styles and export cache once per worker process
+
+    Args:
+        style (str): Style name, or None for the configured style
+        media_path (str): Path to media files, with trailing separator
+        pdf_semaphore: Semaphore limiting the wkhtmltopdf processes of all workers
+        use_cache (bool): Copy unchanged exports from the export cache
+    """
+    from CodeHighlighter import CodeHighlighter
+    from ImageDownscaler import ImageDownscaler
+    from MarkdownRenderer import MarkdownRenderer
+    from StyleManager import StyleManager
+
+    # Use the configured code highlighting, style and wkhtmltopdf path
+    settings_manager = _load_settings()
+    code_highlighter = CodeHighlighter.from_setting(settings_manager.get_code_highlighting())
+
+    style_manager = StyleManager(settings_manager, media_path, code_highlighter)
+    styles.set_style(style or settings_manager.get_style())
+    styles.rtl(settings_manager.is_rtl_enabled())
+
+    _worker['settings_manager'] = settings_manager
+    _worker['style_manager'] = style_manager
+    _worker['renderer'] = MarkdownRenderer(code_highlighter=code_highlighter)
+    _worker['pdf_semaphore'] = pdf_semaphore
+    _worker['media_path'] = media_path
+    _worker['cache'] = ExportCache(max_size=settings_manager.get_export_cache_size()) if use_cache else None
+    _worker['downscaler'] = ImageDownscaler.from_settings(settings_manager, get_printable_width(PDF_OPTIONS))
+
+
+def get_cache_key(text, source_path, export_format, renderer, style_manager, media_path, configuration=None,
+                  image_stats=None):
+    """
+    Get the export cache key of one document and format
+
+    The key covers the Markdown source, the CSS, the extensions, the code
+    highlighting and, for PDF, the wkhtmltopdf options and binary and the
+    files of the referenced images.
+
+    Args:
+        text (str): Markdown source
+        source_path (str): Path of the markdown file
+        export_format (str): Export format name from EXPORT_FORMATS
+        renderer: MarkdownRenderer converting the source
+        style_manager: StyleManager providing the head and footer
+        media_path (str): Path to media files, with trailing separator
+        configuration: pdfkit Configuration of the binary, for PDF formats
+        image_stats (list): Image files from get_image_stats, for PDF formats
+
+    Returns:
+        str: Cache key
+    """
+    extension, styled = EXPORT_FORMATS[export_format]
+    parts = {
+        'source': hashlib.sha256(text.encode('utf-8')).hexdigest(),
+        'format': export_format,
+        'extensions': renderer.extensions,
+        'highlighting': 'highlightjs' if style_manager.uses_highlightjs() else 'pygments',
+    }
+    if extension == 'html':
+        parts['prettify'] = _worker['settings_manager'].is_prettify_html_enabled()
+    if styled:
+        parts['css'] = styles.get()
+        parts['media_path'] = media_path
+    if extension == 'pdf':
+        # Relative image paths are resolved against the source directory
+        parts['directory'] = os.path.dirname(source_path)
+        parts['options'] = PDF_OPTIONS
+        parts['image_dpi'] = _worker['settings_manager'].get_pdf_image_dpi()
+        parts['wkhtmltopdf'] = [configuration.wkhtmltopdf, configuration.get_capabilities().version]
+        parts['images'] = image_stats or []
+    return ExportCache.make_key(**parts)
+
+
+def export_file(source_path, formats, output_dir=None, source_root=None):
+    """
+    Export one markdown file to the requested formats, runs in a worker process
+
+    Args:
+        source_path (str): Path of the markdown file
+        formats (list): Export format names from EXPORT_FORMATS
+        output_dir (str): Directory for the exported files, or None to write next to the source
+        source_root (str): Directory the output directory mirrors (optional)
+
+    Returns:
+        list: (format, output path, error message or None, served from cache) per format
+    """
+    style_manager = _worker['style_manager']
+    renderer = _worker['renderer']
+    cache = _worker['cache']
+    results = []
+
+    try:
+        with open(source_path, encoding='utf-8') as f:
+            text = f.read()
+    except OSError as e:
+        return [(export_format, None, str(e), False) for export_format in formats]
+
+    converted = {}
+
+    def convert(for_pdf):
+        # wkhtmltopdf reads the HTML from stdin, so image paths have to be absolute
+        if for_pdf not in converted:
+            converted[for_pdf] = renderer.convert(process_image_paths(text, source_path) if for_pdf else text)
+        return converted[for_pdf]
+
+    for export_format in formats:
+        extension, styled = EXPORT_FORMATS[export_format]
+        output_path = get_output_path(source_path, output_dir, export_format, formats, source_root)
+        try:
+            os.makedirs(os.path.dirname(output_path), exist_ok=True)
+            configuration = None
+            if extension == 'pdf':
+                import pdfkit_local as pdfkit
+                configuration = pdfkit.get_configuration(_worker['settings_manager'].get_wkhtmltopdf_path())
+
+            key = None
+            if cache is not None:
+                # PDF keys cover the image files, which are only known once the document is converted
+                image_stats = get_image_stats(convert(True)) if extension == 'pdf' else None
+                key = get_cache_key(text, source_path, export_format, renderer, style_manager,
+                                    _worker['media_path'], configuration, image_stats)
+                if cache.get(key, output_path):
+                    results.append((export_format, output_path, None, True))
+                    continue
+
+            html_middle = convert(extension == 'pdf')
+            if extension == 'pdf':
+                if 'inlined' not in converted:
+                    converted['inlined'] = inline_images(html_middle, _worker['downscaler'])
+                html_middle = converted['inlined']
+            if extension == 'html':
+                html = build_styled_html(style_manager, html_middle) if styled else html_middle
+                write_html(html, output_path, _worker['settings_manager'].is_prettify_html_enabled())
+            else:
+                # Streamed to wkhtmltopdf piece by piece, the document is never joined
+                chunks = build_styled_html_chunks(style_manager, html_middle) if styled else [html_middle]
+                options = get_pdf_options(style_manager, html_middle, configuration)
+                options['quiet'] = ''
+                with _worker['pdf_semaphore']:
+                    pdfkit.from_string(chunks, output_path, options=options, configuration=configuration)
+
+            if key is not None:
+                cache.put(key, output_path)
+            results.append((export_format, output_path, None, False))
+        except Exception as e:
+            results.append((export_format, output_path, str(e), False))
+    return results
+
+
+def run_batch_export(patterns, formats, style=None, output_dir=None, jobs=None, pdf_jobs=2, media_path=None,
+                     use_cache=True):
+    """
+    Export many markdown files in parallel without a display
+
+    Args:
+        patterns (list): Glob patterns of the markdown files
+        formats (list): Export format names from EXPORT_FORMATS
+        style (str): Style name from styles.AVAILABLE_STYLES, or None for the configured style
+        output_dir (str): Directory for the exported files, mirroring the directories of the
+            sources below their common directory, or None to write next to each source
+        jobs (int): Number of worker processes, or None for one per CPU
+        pdf_jobs (int): Maximum number of wkhtmltopdf processes running at once
+        media_path (str): Path to media files, with trailing separator
+        use_cache (bool): Copy unchanged exports from the export cache
+
+    Returns:
+        int: Process exit status, 0 if every export succeeded
+    """
+    sources = find_sources(patterns)
+    if not sources:
+        print("No files match the export patterns", file=sys.stderr)
+        return 1
+
+    source_root = get_source_root(sources)
+    failures = 0
+
+    # Never let two sources silently overwrite each other's exports
+    duplicates = find_duplicate_outputs(sources, formats, output_dir, source_root)
+    for source, error in sorted(duplicates.items()):
+        failures += 1
+        print(f"{source}: {error}", file=sys.stderr)
+    sources = [source for source in sources if source not in duplicates]
+
+    use_cache = use_cache and _load_settings().is_export_cache_enabled()
+
+    # Fork keeps the worker imports working without a PYTHONPATH for this tree
+    context = multiprocessing.get_context('fork')
+    pdf_semaphore = context.BoundedSemaphore(max(1, pdf_jobs))
+    hits = misses = 0
+
+    with ProcessPoolExecutor(max_workers=jobs, mp_context=context, initializer=_init_worker,
+                             initargs=(style, media_path, pdf_semaphore, use_cache)) as executor:
+        futures = {executor.submit(export_file, source, formats, output_dir, source_root): source for source in sources}
+        for future in as_completed(futures):
+            source = futures[future]
+            try:
+                results = future.result()
+            except Exception as e:
+                results = [(export_format, None, str(e), False) for export_format in formats]
+            for export_format, output_path, error, cached in results:
+                if error:
+                    failures += 1
+                    print(f"{source} [{export_format}]: {error}", file=sys.stderr)
+                else:
+                    print(f"{source} -> {output_path}{' (cached)' if cached else ''}")
+                    hits += cached
+                    misses += not cached
+
+    if use_cache:
+        evicted = ExportCache(max_size=_load_settings().get_export_cache_size()).evict()
+        print(f"Export cache: {hits} hits, {misses} misses, {evicted} entries evicted")
+
+    return 1 if failures else 0
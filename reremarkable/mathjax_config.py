@@ -0,0 +1,103 @@
+"""MathJax script configuration for the live preview and exports."""
+
+import json
+import os
+import re
+
+# Bundled copy under data/media, see data/media/mathjax/README.md
+LOCAL_SCRIPT = os.path.join('mathjax', 'MathJax.js')
+LOCAL_CONFIG = 'TeX-AMS-MML_HTMLorMML-full'
+
+# Used only when the bundled copy is missing, same version as the bundled copy
+CDN_SCRIPT = 'https://cdnjs.cloudflare.com/ajax/libs/mathjax/2.7.9/MathJax.js'
+CDN_CONFIG = 'TeX-AMS-MML_HTMLorMML'
+
+# Nodes produced by the mathjax markdown extension, or TeX delimiters
+# that the tex2jax preprocessor picks up in the rendered HTML. Inline math
+# has to look like TeX: it does not start with whitespace or a digit and
+# does not end with whitespace, so prices such as "$5 and $10" do not
+# load MathJax
+MATH_RE = re.compile(r'<mathjax>|\$(?=[^\s\d$])[^$<>]*(?<!\s)\$|\\\[')
+
+
+def contains_math(html):
+    """
+    Check if rendered HTML contains anything for MathJax to typeset
+
+    Args:
+        html (str): Rendered HTML
+
+    Returns:
+        bool: True if MathJax has to be loaded for this HTML
+    """
+    return MATH_RE.search(html) is not None
+
+
+def has_local_copy(media_path):
+    """
+    Check if the bundled MathJax copy is installed
+
+    Args:
+        media_path (str): Path to media files, with trailing separator
+
+    Returns:
+        bool: True if data/media/mathjax contains the loader
+    """
+    return os.path.isfile(media_path + LOCAL_SCRIPT)
+
+
+def get_source(media_path):
+    """
+    Get the URL of the MathJax loader
+
+    Args:
+        media_path (str): Path to media files, with trailing separator
+
+    Returns:
+        str: URL of MathJax.js including the configuration to load
+    """
+    if has_local_copy(media_path):
+        return f"{media_path}{LOCAL_SCRIPT}?config={LOCAL_CONFIG}"
+    return f"{CDN_SCRIPT}?config={CDN_CONFIG}"
+
+
+def get_config(media_path):
+    """
+    Get the MathJax configuration
+
+    Args:
+        media_path (str): Path to media files, with trailing separator
+
+    Returns:
+        dict: Configuration, set as window.MathJax before loading
+    """
+    config = {
+        'showProcessingMessages': False,
+        'messageStyle': 'none',
+        'tex2jax': {'inlineMath': [['$', '$']]},
+    }
+    if has_local_copy(media_path):
+        # The bundled copy only ships the STIX-Web fonts
+        config['HTML-CSS'] = {
+            'availableFonts': [],
+            'preferredFont': None,
+            'webFont': 'STIX-Web',
+            'imageFont': None,
+        }
+    return config
+
+
+def get_script_tags(media_path):
+    """
+    Get the HTML script tags that configure and load MathJax
+
+    Args:
+        media_path (str): Path to media files, with trailing separator
+
+    Returns:
+        str: HTML script tags
+    """
+    return (
+        f'<script type="text/javascript">window.MathJax = {json.dumps(get_config(media_path))};</script>'
+        f'<script type="text/javascript" src="{get_source(media_path)}"></script>'
+    )
@@ -13,18 +13,21 @@ import re
 import sys
 import tempfile
 import warnings
-import webbrowser
-from urllib.request import urlopen
 
-import markdown
+import mathjax_config
+import startup_profile
 import styles
+from CodeHighlighter import CodeHighlighter
+from DocumentTab import DocumentTab
 from ExportManager import ExportManager
-from FileManager import FileManager
 from findBar import FindBar
-from gi.repository import Gdk, Gtk, GtkSource, Pango, WebKit2
+from gi.repository import Gdk, GLib, Gtk, GtkSource, Pango, WebKit2
+from IncrementalRenderer import IncrementalRenderer
 from LayoutManager import LayoutManager
-from MarkdownFormatter import MarkdownFormatter
+from MarkdownRenderer import MarkdownRenderer
+from PreviewScheduler import PreviewScheduler
 from RecentFilesManager import RecentFilesManager
+from RenderWorker import RenderWorker
 from SettingsManager import SettingsManager
 from StyleManager import StyleManager
 
@@ -34,7 +37,6 @@ logger = logging.getLogger('reremarkable')
 warnings.filterwarnings("ignore", ".*has no handler with id.*")
 
 from AboutReRemarkableDialog import AboutReRemarkableDialog
-from EmojiPickerDialog import EmojiPickerDialog
 
 from reremarkable_lib import Window, reremarkableconfig
 
@@ -47,6 +49,7 @@ class RemarkableWindow(Window):
     def finish_initializing(self, builder): # pylint: disable=E1002
         """Set up the main window"""
         super().finish_initializing(builder)
+        startup_profile.mark("build window from UI file")
 
         self.AboutDialog = AboutReRemarkableDialog
         self.emoji_picker = None
@@ -60,76 +63,35 @@ class RemarkableWindow(Window):
         self.settings_manager = SettingsManager(self.homeDir)
         self.settings_manager.check_settings()
 
-        # Initialize markdown formatter (will be set after text_buffer is created)
-        self.markdown_formatter = None
-        # Initialize file manager (will be set after text_buffer is created)
-        self.file_manager = None
         # Initialize style manager
         self.style_manager = None
         # Initialize layout manager
         self.layout_manager = None
 
-        # HTML footer with scripts for live preview
-        self.default_html_end = '<script src="' + self.media_path + 'highlight.min.js"></script><script>hljs.initHighlightingOnLoad();</script><script type="text/javascript" src="https://cdnjs.cloudflare.com/ajax/libs/mathjax/2.7.2/MathJax.js?config=TeX-AMS-MML_HTMLorMML"></script><script type="text/javascript">MathJax.Hub.Config({"showProcessingMessages" : false,"messageStyle" : "none","tex2jax": { inlineMath: [ [ "$", "$" ] ] }});</script></body></html>'
+        # Optional Python-side code highlighting instead of highlight.js
+        self.code_highlighter = CodeHighlighter.from_setting(self.settings_manager.get_code_highlighting())
 
-        # Markdown extensions (used by live preview and other features)
-        self.default_extensions = ['markdown.extensions.extra','markdown.extensions.toc', 'markdown.extensions.smarty', 'markdown_extensions.extensions.urlize', 'markdown_extensions.extensions.Highlighting', 'markdown_extensions.extensions.Strikethrough', 'markdown_extensions.extensions.markdown_checklist', 'markdown_extensions.extensions.superscript', 'markdown_extensions.extensions.subscript', 'markdown_extensions.extensions.mathjax']
-        self.safe_extensions = ['markdown.extensions.extra']
+        # Markdown rendering engine (shared by all tabs, live preview, clipboard and exports)
+        self.markdown_renderer = MarkdownRenderer(code_highlighter=self.code_highlighter)
         self.pdf_error_warning = False
 
-        # Initialize recent files manager
-        self.recent_files_manager = RecentFilesManager(max_recent_files=10)
+        # Initialize recent files manager, shared by all tabs
+        self.recent_files_manager = RecentFilesManager(self.settings_manager)
 
         self.window = self.builder.get_object("reremarkable_window")
         self.window.connect("delete-event", self.window_delete_event)
         self.window.connect("destroy", self.quit_requested)
 
-        self.text_buffer = GtkSource.Buffer()
-        self.text_view = GtkSource.View.new_with_buffer(self.text_buffer)
-        self.text_view.set_show_line_numbers(True)
-        self.text_view.set_auto_indent(True)
+        # Open documents, one DocumentTab per notebook page
+        self.notebook = self.builder.get_object("notebook")
+        self.tabs = []
+        self.current_tab = None
+        self.font = None
 
-        # Force the SourceView to use a SourceBuffer and not a TextBuffer
-        self.lang_manager = GtkSource.LanguageManager()
-        self.text_buffer.set_language(self.lang_manager.get_language('markdown'))
-        self.text_buffer.set_highlight_matching_brackets(True)
+        # Live previews of all tabs share one WebKit context
+        self.web_context = WebKit2.WebContext.get_default()
 
-        self.undo_manager = self.text_buffer.get_undo_manager()
-        self.undo_manager.connect("can-undo-changed", self.can_undo_changed)
-        self.undo_manager.connect("can-redo-changed", self.can_redo_changed)
-
-        self.text_buffer.connect("changed", self.on_text_view_changed)
-        self.text_view.set_buffer(self.text_buffer)
-        self.text_view.set_wrap_mode(Gtk.WrapMode.WORD)
-        self.text_view.connect('key-press-event', self.cursor_ctrl_arrow_rtl_fix)
-
-        # Initialize markdown formatter with the text buffer
-        self.markdown_formatter = MarkdownFormatter(self.text_buffer)
-
-        # Initialize file manager with window and text buffer
-        self.file_manager = FileManager(self.window, self.text_buffer)
-        self.file_manager.set_recent_files_callback(self.recent_files_manager.add_recent_file)
-
-        # Initialize export manager (placeholder, will be set up after style_manager)
-        self.export_manager = None
-
-        # Initialize style manager (placeholder, will be set up after live_preview)
-        self.style_manager = None
-
-        # Initialize layout manager (will be set up after UI components are created)
-        self.layout_manager = None
-
-        self.live_preview = WebKit2.WebView()
-
-        self.scrolledwindow_text_view = Gtk.ScrolledWindow()
-        self.scrolledwindow_text_view.add(self.text_view)
-        self.scrolledwindow_live_preview = Gtk.ScrolledWindow()
-        self.scrolledwindow_live_preview.add(self.live_preview)
-
-        self.paned = self.builder.get_object("paned")
-        self.paned.set_position(self.window.get_size()[0]/2)
-        self.paned.pack1(self.scrolledwindow_text_view)
-        self.paned.pack2(self.scrolledwindow_live_preview)
+        self.status_bar_update_id = None
 
         self.toolbar = self.builder.get_object("toolbar")
         self.toolbutton_undo = self.builder.get_object("toolbutton_undo")
@@ -140,28 +102,31 @@ class RemarkableWindow(Window):
         self.statusbar = self.builder.get_object("statusbar")
         self.context_id = self.statusbar.get_context_id("main status bar")
 
-        # Initialize layout manager now that UI components are available
+        # Layout manager, pointed at the panes of the current tab
         self.layout_manager = LayoutManager(self.window, self.settings_manager)
-        self.layout_manager.set_ui_components(
-            self.paned, self.live_preview, self.scrolledwindow_text_view,
-            self.scrolledwindow_live_preview, self.text_view, self.toolbar,
-            self.statusbar, self.builder
-        )
 
-        # Initialize style manager now that live_preview exists
-        self.style_manager = StyleManager(self.settings_manager, self.media_path)
+        # Initialize style manager
+        self.style_manager = StyleManager(self.settings_manager, self.media_path, self.code_highlighter)
         self.style_manager.add_style_change_callback(self.on_style_changed)
         # Set up style menu items for checkmark management
         self.style_manager.set_menu_items(self.builder)
 
-        # Initialize export manager now that style_manager exists
-        self.export_manager = ExportManager(self.style_manager, self.file_manager, self.media_path)
+        # Initialize export manager, it exports the document of the current tab
+        self.export_manager = ExportManager(self.style_manager, None, self.media_path,
+                                            self.markdown_renderer, self.settings_manager)
         self.export_manager.set_window_sensitivity_callback(self.window.set_sensitive)
 
-        self.clipboard = Gtk.Clipboard.get(Gdk.SELECTION_CLIPBOARD)
-        self.update_status_bar(self)
-        self.update_live_preview(self)
+        # Render the live preview of the current tab off the main loop, block by block when enabled.
+        # Block renders are cached by content, so the cache is shared by all tabs
+        self.incremental_renderer = IncrementalRenderer(self.markdown_renderer,
+                                                        self.settings_manager.is_incremental_preview_enabled())
+        self.render_worker = RenderWorker(self.incremental_renderer.render, self.on_live_preview_rendered)
 
+        # Coalesce live preview renders while typing
+        self.preview_scheduler = PreviewScheduler(self.on_preview_render_due,
+                                                  self.settings_manager.get_preview_delay())
+
+        self.clipboard = Gtk.Clipboard.get(Gdk.SELECTION_CLIPBOARD)
 
         self.wrap_box = self.builder.get_object("wrap_box")
         self.find_entry = self.builder.get_object("find_entry")
@@ -172,17 +137,11 @@ class RemarkableWindow(Window):
         findbar = self.builder.get_object('findbar')
         self.findbar = FindBar(findbar, self.wrap_box, self.find_entry, self.replace_entry,
                                match_case, whole_word, regex)
-        self.findbar.set_text_view(self.text_view)
 
-        # Check if filename has been specified in terminal command
-        if len(sys.argv) > 1:
-            file_path = sys.argv[1]
-            if not self.file_manager.load_file(file_path, self.window.set_title):
-                print(f"{file_path} does not exist, creating it")
-                self.file_manager.set_current_file_path(file_path)
+        startup_profile.mark("set up shared managers")
 
-        self.update_status_bar(self)
-        self.update_live_preview(self)
+        self.open_tab()
+        startup_profile.mark("create first tab")
 
         # Check if an updated version of application exists [removed this functionality]
         # _thread.start_new_thread(self.check_for_updates, ())
@@ -201,18 +160,211 @@ class RemarkableWindow(Window):
             self.window.add_accel_group(self.accel_group)
 
         # Set up recent files manager with menu and callback
-        self.recent_files_manager.set_menu_and_accel_group(recent_files_menu, self.accel_group)
-        self.recent_files_manager.set_file_open_callback(lambda file_path: self.file_manager.load_file(file_path, self.window.set_title))
+        self.recent_files_manager.set_menu_and_accel_group(recent_files_menu, self.accel_group, self.window)
+        self.recent_files_manager.set_file_open_callback(self.open_file)
 
         # Load window layout
         self.layout_manager.load_window_layout()
-
-        self.tv_scrolled = self.scrolledwindow_text_view.get_vadjustment().connect("value-changed", self.scrollPreviewTo)
-        self.lp_scrolled_fix = self.scrolledwindow_live_preview.get_vadjustment().connect("value-changed", self.scrollPreviewToFix)
-        self.scrolledwindow_live_preview.get_vadjustment().set_lower(1)
+        startup_profile.mark("apply settings and layout")
 
         self.temp_file_list = []
 
+    # The document of the current tab, used by the menu and toolbar handlers
+
+    @property
+    def text_buffer(self):
+        return self.current_tab.text_buffer
+
+    @property
+    def text_view(self):
+        return self.current_tab.text_view
+
+    @property
+    def live_preview(self):
+        return self.current_tab.live_preview
+
+    @property
+    def buffer_snapshot(self):
+        return self.current_tab.buffer_snapshot
+
+    @property
+    def document_statistics(self):
+        return self.current_tab.document_statistics
+
+    @property
+    def markdown_formatter(self):
+        return self.current_tab.markdown_formatter
+
+    @property
+    def file_manager(self):
+        return self.current_tab.file_manager
+
+    @property
+    def scroll_sync(self):
+        return self.current_tab.scroll_sync
+
+    def open_tab(self):
+        """
+        Add an empty document in a new tab and switch to it
+
+        Returns:
+            DocumentTab: The new tab
+        """
+        tab = DocumentTab(self.window, self.web_context, self.media_path, self.font)
+        tab.file_manager.set_recent_files_callback(self.recent_files_manager.add_recent_file)
+        tab.file_manager.set_new_tab_callback(self.on_new_tab_requested)
+        tab.set_title_changed_callback(self.on_tab_title_changed)
+
+        undo_manager = tab.text_buffer.get_undo_manager()
+        undo_manager.connect("can-undo-changed", self.can_undo_changed)
+        undo_manager.connect("can-redo-changed", self.can_redo_changed)
+        tab.text_buffer.connect("changed", self.on_text_view_changed)
+        tab.text_buffer.connect("mark-set", self.on_text_buffer_mark_set)
+        tab.text_view.connect('key-press-event', self.cursor_ctrl_arrow_rtl_fix)
+        tab.close_button.connect("clicked", lambda button: self.close_tab(tab))
+        tab.preview_page.set_style_sheets(self.style_manager.get_preview_style_sheets())
+
+        if self.current_tab is not None:
+            tab.paned.set_position(self.current_tab.paned.get_position())
+        else:
+            tab.paned.set_position(self.window.get_size()[0]/2)
+        tab.paned.show_all()
+
+        self.tabs.append(tab)
+        page = self.notebook.append_page(tab.paned, tab.tab_label)
+        self.notebook.set_tab_reorderable(tab.paned, True)
+        self.notebook.set_show_tabs(len(self.tabs) > 1)
+        self.notebook.set_current_page(page)
+        if self.current_tab is not tab:
+            self.activate_tab(tab)
+        return tab
+
+    def open_file(self, file_path):
+        """
+        Show a file, switching to its tab if it is already open
+
+        The current tab is reused when it holds an empty, unsaved document.
+
+        Args:
+            file_path (str): File to open
+
+        Returns:
+            bool: True if the file is shown
+        """
+        for tab in self.tabs:
+            if tab.shows_file(file_path):
+                self.notebook.set_current_page(self.notebook.page_num(tab.paned))
+                return True
+
+        reused = self.current_tab is not None and self.current_tab.is_pristine()
+        tab = self.current_tab if reused else self.open_tab()
+        if tab.file_manager.load_file(file_path):
+            return True
+        if not reused:
+            self.close_tab(tab)
+        return False
+
+    def open_files(self, file_paths):
+        """
+        Open files given on the command line or forwarded by another launch
+
+        Files that do not exist yet are created when saved. Without files a
+        new, empty document is shown, unless the current one is still empty.
+
+        Args:
+            file_paths (list): Files to open
+        """
+        if not file_paths and not self.current_tab.is_pristine():
+            self.open_tab()
+        for file_path in file_paths:
+            if os.path.exists(file_path):
+                self.open_file(file_path)
+                continue
+            print(f"{file_path} does not exist, creating it")
+            tab = self.current_tab if self.current_tab.is_pristine() else self.open_tab()
+            tab.file_manager.set_current_file_path(file_path)
+            tab.set_title(f"reRemarkable: {os.path.basename(file_path)}")
+        self.window.present()
+
+    def on_new_tab_requested(self, file_path):
+        """FileManager callback for new files and files opened next to a non-empty document"""
+        if file_path is None:
+            self.open_tab()
+            return True
+        return self.open_file(file_path)
+
+    def close_tab(self, tab):
+        """
+        Close a tab, asking to save its changes first
+
+        Closing the last tab leaves an empty document.
+
+        Args:
+            tab (DocumentTab): Tab to close
+
+        Returns:
+            bool: True if the tab was closed, False if the user cancelled
+        """
+        self.notebook.set_current_page(self.notebook.page_num(tab.paned))
+        if not tab.file_manager.can_close_safely():
+            return False
+
+        if len(self.tabs) == 1:
+            self.open_tab()
+        self.tabs.remove(tab)
+        self.notebook.remove_page(self.notebook.page_num(tab.paned))
+        self.notebook.set_show_tabs(len(self.tabs) > 1)
+        tab.destroy()
+        return True
+
+    def get_tab(self, page):
+        """Get the tab shown in a notebook page"""
+        for tab in self.tabs:
+            if tab.paned is page:
+                return tab
+        return None
+
+    def on_notebook_switch_page(self, notebook, page, page_num):
+        tab = self.get_tab(page)
+        if tab is not None and tab is not self.current_tab:
+            self.activate_tab(tab)
+
+    def activate_tab(self, tab):
+        """Make a tab the one the menus, toolbar, status bar and find bar act on"""
+        first_tab = self.current_tab is None
+        self.current_tab = tab
+
+        self.layout_manager.set_ui_components(
+            tab.paned, tab.live_preview, tab.scrolledwindow_text_view,
+            tab.scrolledwindow_live_preview, tab.text_view, self.toolbar,
+            self.statusbar, self.builder
+        )
+        if not first_tab:
+            # The first tab is set up by load_settings and the saved layout
+            self.layout_manager.apply_document_layout(self.settings_manager.is_live_preview_enabled())
+
+        self.export_manager.set_file_manager(tab.file_manager)
+        self.findbar.set_text_view(tab.text_view)
+        if self.emoji_picker:
+            self.emoji_picker.text_buffer = tab.text_buffer
+
+        self.window.set_title(tab.get_title())
+        self.can_undo_changed(None)
+        self.can_redo_changed(None)
+
+        self.preview_scheduler.cancel()
+        self.update_status_bar(self)
+        if tab.live_preview.get_visible():
+            self.update_live_preview(self)
+        tab.text_view.grab_focus()
+
+    def on_tab_title_changed(self, tab):
+        if tab is self.current_tab:
+            self.window.set_title(tab.get_title())
+
+    def on_menuitem_close_tab_activate(self, widget):
+        self.close_tab(self.current_tab)
+
     def on_find_next_button_clicked(self, widget):
         self.findbar.on_find_next_button_clicked(widget)
 
@@ -250,6 +402,11 @@ class RemarkableWindow(Window):
 
 
     def load_settings(self):
+        # Handlers triggered while applying the settings write them back once
+        with self.settings_manager.transaction():
+            self._apply_settings()
+
+    def _apply_settings(self):
         if self.settings_manager.is_nightmode_enabled():
             # Enable night/dark mode on startup
             self.builder.get_object("menuitem_night_mode").set_active(True)
@@ -297,27 +454,14 @@ class RemarkableWindow(Window):
         self.wrap_box.set_visible(False)
 
     def on_style_changed(self):
-        """Callback when style changes - update live preview"""
-        self.update_live_preview(self)
-
-    def scrollPreviewToFix(self, widget):
-        self.scrolledwindow_live_preview.get_vadjustment().disconnect(self.lp_scrolled_fix)
-        value = self.scrolledwindow_live_preview.get_vadjustment().get_value()
-        if value == 0: # Fix
-            self.scrollPreviewTo(self)
-        else:
-            pass # Something better?
-
-    def scrollPreviewTo(self, widget):
-        self.scrolledwindow_live_preview.get_vadjustment().disconnect(self.lp_scrolled_fix)
-        value = self.scrolledwindow_text_view.get_vadjustment().get_value()
-        upper_edit = self.scrolledwindow_text_view.get_vadjustment().get_upper()
-        preview_upper = self.scrolledwindow_live_preview.get_vadjustment().get_upper()
-        if value >= upper_edit - self.scrolledwindow_text_view.get_vadjustment().get_page_size():
-            self.scrolledwindow_live_preview.get_vadjustment().set_value(preview_upper - self.scrolledwindow_live_preview.get_vadjustment().get_page_size())
-        else:
-            self.scrolledwindow_live_preview.get_vadjustment().set_value(value / upper_edit * preview_upper)
-        self.lp_scrolled_fix = self.scrolledwindow_live_preview.get_vadjustment().connect("value-changed", self.scrollPreviewToFix)
+        """Callback when style changes - swap the stylesheets of the live previews"""
+        self.update_preview_style_sheets()
+
+    def update_preview_style_sheets(self):
+        """Install the current stylesheets in the live previews of all tabs, without re-rendering"""
+        css_sources = self.style_manager.get_preview_style_sheets()
+        for tab in self.tabs:
+            tab.preview_page.set_style_sheets(css_sources)
 
     def on_menuitem_numbered_list_activate(self, widget):
         self.markdown_formatter.apply_numbered_list()
@@ -329,21 +473,21 @@ class RemarkableWindow(Window):
         self.file_manager.new_file()
 
     def on_menuitem_open_activate(self, widget):
-        self.file_manager.open_file_dialog(self.window.set_title)
+        self.file_manager.open_file_dialog()
 
     def on_toolbutton_open_clicked(self, widget):
-        self.file_manager.open_file_dialog(self.window.set_title)
+        self.file_manager.open_file_dialog()
 
 
 
     def on_menuitem_save_activate(self, widget):
-        self.file_manager.save_file(self.window.set_title)
+        self.file_manager.save_file()
 
     def on_toolbutton_save_clicked(self, widget):
-        self.file_manager.save_file(self.window.set_title)
+        self.file_manager.save_file()
 
     def on_menuitem_save_as_activate(self, widget, crap=""):
-        self.file_manager.save_file_as(self.window.set_title)
+        self.file_manager.save_file_as()
 
     def on_menuitem_rtl_toggled(self, widget):
         self.rtl(widget.get_active())
@@ -354,7 +498,7 @@ class RemarkableWindow(Window):
         self.on_menuitem_swap_activate(None)
 
         styles.rtl(enabled)
-        self.update_live_preview(self)
+        self.update_preview_style_sheets()
 
     def on_menuitem_export_html_activate(self, widget):
         self.export_manager.export_html_styled(self.text_buffer, self.window)
@@ -445,16 +589,21 @@ class RemarkableWindow(Window):
         self.window_delete_event(self)
 
     def window_delete_event(self, widget, callback=None):
-        safe_to_quit = self.file_manager.can_close_safely(self.window.set_title)
+        for tab in list(self.tabs):
+            # Show each document while asking about its changes
+            self.notebook.set_current_page(self.notebook.page_num(tab.paned))
+            if not tab.file_manager.can_close_safely():
+                return True # Cancel the quit operation as user didn't want to save the changes
 
-        if safe_to_quit:
-            # Save window layout before quitting
-            self.layout_manager.save_window_layout()
-            self.quit_requested(None)
-        else:
-            return True # Cancel the quit operation as user didn't want to save the changes
+        # Save window layout before quitting
+        self.layout_manager.save_window_layout()
+        self.quit_requested(None)
 
     def quit_requested(self, widget, callback_data=None):
+        self.preview_scheduler.cancel()
+        self.render_worker.stop()
+        self.export_manager.cancel_pdf_exports()
+        self.settings_manager.flush()
         self.clean_up() # Second time, just to be safe
         Gtk.main_quit()
 
@@ -475,10 +624,10 @@ class RemarkableWindow(Window):
         self.redo(self)
 
     def zoom_in(self):
-        self.layout_manager.zoom_in(lambda: self.scrollPreviewToFix(self))
+        self.layout_manager.zoom_in(self.scroll_sync.sync_preview)
 
     def zoom_out(self):
-        self.layout_manager.zoom_out(lambda: self.scrollPreviewToFix(self))
+        self.layout_manager.zoom_out(self.scroll_sync.sync_preview)
 
     def on_toolbutton_zoom_in_clicked(self, widget):
         self.zoom_in()
@@ -524,7 +673,7 @@ class RemarkableWindow(Window):
             image_rel_path = 'imgs'
             if self.file_manager.get_current_file_path() == 'Untitled':
                 # File not yet saved (i.e. we do not have path for the file)
-                self.file_manager.save_file(self.window.set_title)
+                self.file_manager.save_file()
                 assert self.file_manager.get_current_file_path() != 'Untitled'
 
             image_dir = os.path.join(os.path.dirname(self.file_manager.get_current_file_path()), image_rel_path)
@@ -593,14 +742,7 @@ class RemarkableWindow(Window):
 
     # Copy all text from the editor pane and format it as HTML in the clipboard
     def on_menuitem_copy_all_activate(self, widget):
-        text = self.text_buffer.get_text(self.text_buffer.get_start_iter(), self.text_buffer.get_end_iter(), False)
-        try:
-            text = markdown.markdown(text, self.default_extensions)
-        except:
-            try:
-                markdown.markdown(text, extensions = self.safe_extensions)
-            except:
-                markdown.markdown(text)
+        text = self.markdown_renderer.convert(self.buffer_snapshot.get_text())
         self.clipboard.set_text(text, -1)
 
     # Copy selected text from the editor pane and format as HTML in the clipboard
@@ -608,13 +750,7 @@ class RemarkableWindow(Window):
         if self.text_buffer.get_has_selection():
             start, end = self.text_buffer.get_selection_bounds()
             text = self.text_buffer.get_text(start, end, True)
-            try:
-                text = markdown.markdown(text, self.default_extensions)
-            except:
-                try:
-                    markdown.markdown(text, extensions =self.safe_extensions)
-                except:
-                    markdown.markdown(text)
+            text = self.markdown_renderer.convert(text)
             self.clipboard.set_text(text, -1)
 
     def on_menuitem_vertical_layout_activate(self, widget):
@@ -669,7 +805,8 @@ class RemarkableWindow(Window):
     def font_dialog_ok(self, widget):
         self.font = self.font_chooser.get_font_name()
         self.settings_manager.set_setting('font', self.font)
-        self.text_view.override_font(Pango.FontDescription(self.font))
+        for tab in self.tabs:
+            tab.text_view.override_font(Pango.FontDescription(self.font))
 
         # Now adjust the size using TextTag
         self.font_dialog_destroyed(self)
@@ -686,22 +823,17 @@ class RemarkableWindow(Window):
         self.temp_file_list.append(tf)
         tf_name = tf.name
 
-        text = self.text_buffer.get_text(self.text_buffer.get_start_iter(), self.text_buffer.get_end_iter(), False)
+        text = self.buffer_snapshot.get_text()
         dirname = os.path.dirname(self.file_manager.get_current_file_path())
         text = re.sub(r'(\!\[.*?\]\()([^/][^:]*?\))', lambda m, dirname=dirname: m.group(1) + os.path.join(dirname, m.group(2)), text)
-        try:
-            html_middle = markdown.markdown(text, self.default_extensions)
-        except:
-            try:
-                html_middle = markdown.markdown(text, extensions =self.safe_extensions)
-            except:
-                html_middle = markdown.markdown(text)
-        html = self.style_manager.get_html_head_style() + html_middle + self.default_html_end
+        html_middle = self.markdown_renderer.convert(text)
+        html_end = self.style_manager.get_html_end(mathjax_config.contains_math(html_middle))
+        html = self.style_manager.get_html_head_style() + html_middle + html_end
         tf.write(html.encode())
         tf.flush()
 
         # Load the temporary HTML file in the user's default browser
-        webbrowser.open_new_tab(tf_name)
+        self.open_in_browser(tf_name)
 
     def on_menuitem_night_mode_activate(self, widget):
         if self.builder.get_object("menuitem_night_mode").get_active():
@@ -930,6 +1062,8 @@ class RemarkableWindow(Window):
     def show_emoji_picker(self, widget):
         """Show the emoji picker dialog"""
         if not self.emoji_picker:
+            # Imported on first use, loading the emoji data is slow
+            from EmojiPickerDialog import EmojiPickerDialog
             self.emoji_picker = EmojiPickerDialog(self.window, self.text_buffer)
         self.emoji_picker.show()
 
@@ -975,17 +1109,22 @@ class RemarkableWindow(Window):
     def on_menuitem_solarized_light_activate(self, widget):
         self.style_manager.apply_solarized_light_style()
 
+    def open_in_browser(self, url):
+        """Open a URL or file in the user's default browser"""
+        import webbrowser
+        webbrowser.open_new_tab(url)
+
     def on_menuitem_github_page_activate(self, widget):
-        webbrowser.open_new_tab("https://github.com/pjobson/reRemarkable")
+        self.open_in_browser("https://github.com/pjobson/reRemarkable")
 
     def on_menuitem_reportbug_activate(self, widget):
-        webbrowser.open_new_tab("https://github.com/pjobson/reRemarkable/issues")
+        self.open_in_browser("https://github.com/pjobson/reRemarkable/issues")
 
     def on_menuitem_about_activate(self, widget):
         self.AboutDialog.show(self)
 
     def on_menuitem_markdown_tutorial_activate(self, widget):
-        webbrowser.open_new_tab("https://daringfireball.net/projects/markdown/syntax")
+        self.open_in_browser("https://daringfireball.net/projects/markdown/syntax")
 
     def on_menuitem_license_activate(self, widget):
         # Get the script's base directory
@@ -996,6 +1135,7 @@ class RemarkableWindow(Window):
         if not os.path.exists(license_path):
             try:
                 license_url = 'https://raw.githubusercontent.com/pjobson/reRemarkable/master/LICENSE.md'
+                from urllib.request import urlopen
                 response = urlopen(license_url)
                 license_content = response.read().decode('utf-8')
                 with open(license_path, 'w') as f:
@@ -1005,29 +1145,21 @@ class RemarkableWindow(Window):
                 return
 
         # Open the LICENSE.md file using the existing file opening mechanism
-        self.file_manager.load_file(license_path, self.window.set_title)
+        self.open_file(license_path)
 
     def on_text_view_changed(self, widget):
-        start, end = self.text_buffer.get_bounds()
-
+        if widget is not self.text_buffer:
+            return  # Other tabs are refreshed when they are switched to
         if self.statusbar.get_visible():
-            self.update_status_bar(self)
+            # "changed" is emitted before the statistics see the edit
+            self.schedule_status_bar_update()
         else:  # statusbar not present, don't need to update/count words, etc.
             pass
         if self.live_preview.get_visible():
-            self.update_live_preview(self)
-            self.scrollPreviewTo(self)
-
+            self.preview_scheduler.schedule()
         else:  # Live preview not enabled, don't need to update the view
             pass
 
-        # Update title to reflect changes
-        if self.text_buffer.get_modified():
-            title = self.window.get_title()
-            if title[0] != "*":
-                title = "*" + title
-                self.window.set_title(title)
-
     """
         GtkTextView simply does not seem to handle visual word
         movements correctly in bi-directional move.
@@ -1068,60 +1200,65 @@ class RemarkableWindow(Window):
 
         return False
 
+    def on_text_buffer_mark_set(self, text_buffer, location, mark):
+        """Refresh the selection statistics when the selection changes"""
+        if text_buffer is not self.text_buffer:
+            return
+        if mark in (text_buffer.get_insert(), text_buffer.get_selection_bound()) and self.statusbar.get_visible():
+            self.schedule_status_bar_update()
+
+    def schedule_status_bar_update(self):
+        """Update the status bar once the main loop is idle, coalescing bursts of changes"""
+        if self.status_bar_update_id is None:
+            self.status_bar_update_id = GLib.idle_add(self.on_status_bar_update_due)
+
+    def on_status_bar_update_due(self):
+        """Debounced status bar refresh, an idle callback that returns False to run once"""
+        self.status_bar_update_id = None
+        self.update_status_bar(self)
+        return False
+
     """
         Update the text in the status bar. Displays the number of lines,
-        words and characters. This approach is possible inefficient.
+        words and characters, the reading time and the selection counts.
+        Word counts come from the incremental DocumentStatistics, so this
+        does not copy the buffer.
     """
     def update_status_bar(self, widget):
         self.statusbar.pop(self.context_id)
         lines = self.text_buffer.get_line_count()
         chars = self.text_buffer.get_char_count()
-        words = self.text_buffer.get_text(self.text_buffer.get_start_iter(), self.text_buffer.get_end_iter(), False).split()
-        word_count = 0
-        word_exceptions = ["#", "##", "###", "####", "#####", "######", "*", "**", "-", "+", "_", "/", "\\", "/", ":",
-                           ";", "@", "'", "~", "(", ")", "[", "]", "{", "}", "((", "))", "+-", "-+", "/=", ".", "|",
-                           "!", "!!", "!!!", "$", "", "%", "^", "&"]  # Exclude these from word count
-        for w in words:
-            if w not in word_exceptions:
-                if not re.match('^[0-9]{1,3}$', w):
-                    word_count += 1
+        word_count = self.document_statistics.get_word_count()
         self.status_message = "Lines: " + str(lines) + ", " + "Words: " + str(word_count) + ", Characters: " + str(chars)
+        self.status_message += ", Reading time: " + str(self.document_statistics.get_reading_time()) + " min"
+
+        selection = self.document_statistics.get_selection_statistics()
+        if selection is not None:
+            selected_words, selected_chars = selection
+            self.status_message += " (Selected: " + str(selected_words) + " words, " + str(selected_chars) + " characters)"
         self.statusbar.push(self.context_id, self.status_message)
 
+    def on_preview_render_due(self):
+        """Called by the preview scheduler once a burst of changes has settled"""
+        if self.live_preview.get_visible():
+            self.update_live_preview(self)
+
     def update_live_preview(self, widet):
-        text = self.text_buffer.get_text(
-            self.text_buffer.get_start_iter(),
-            self.text_buffer.get_end_iter(),
-            False
-        )
-        try:
-            html_middle = markdown.markdown(text, self.default_extensions)
-            html_middle = markdown.markdown(
-                text,
-                extensions=self.default_extensions,
-                disable_raw_html=False
-            )
-        except:
-            try:
-                html_middle = markdown.markdown(
-                    text,
-                    extensions=self.safe_extensions,
-                    disable_raw_html=False
-                )
-            except:
-                html_middle = markdown.markdown(
-                    text,
-                    disable_raw_html=False
-                )
-        html = self.style_manager.get_html_head_style() + html_middle + self.default_html_end
+        """Queue a snapshot of the buffer for rendering on the render worker"""
+        tab = self.current_tab
+        text = tab.buffer_snapshot.get_text()
 
         # Update the display, supporting relative paths to local images
-        current_path = self.file_manager.get_current_file_path()
-        if current_path != "Untitled":
-            base_uri = f"file://{os.path.abspath(current_path)}"
-        else:
-            base_uri = None
-        self.live_preview.load_html(html, base_uri)
+        self.render_worker.submit(text, (tab, tab.get_base_uri()))
+
+    def on_live_preview_rendered(self, blocks, context, duration):
+        """Called on the main loop with the rendered blocks of the latest buffer snapshot"""
+        tab, base_uri = context
+        self.preview_scheduler.record_render_duration(duration)
+        if tab not in self.tabs:
+            return  # Closed while rendering
+        tab.preview_page.update(blocks, self.style_manager.get_preview_html_head(),
+                                self.style_manager.get_html_end(), base_uri)
 
     """
         This function suppresses the messages from the WebKit (live preview) console
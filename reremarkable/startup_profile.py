@@ -0,0 +1,49 @@
+"""Phase timings of the application start-up, printed with --profile-startup."""
+
+import sys
+import time
+
+_start = time.perf_counter()
+_last = _start
+_phases = []
+
+
+def mark(phase):
+    """
+    Record the time spent since the previous mark under a phase name
+
+    Marks are cheap and always recorded, so phases before option parsing
+    are measured as well; they are only printed on request.
+
+    Args:
+        phase (str): Name of the phase that just finished
+    """
+    global _last
+    now = time.perf_counter()
+    _phases.append((phase, now - _last))
+    _last = now
+
+
+def get_phases():
+    """
+    Get the recorded phases
+
+    Returns:
+        list: (phase name, duration in seconds) tuples in the order they were marked
+    """
+    return list(_phases)
+
+
+def report(file=None):
+    """
+    Print the phase timings and their total
+
+    Args:
+        file: Text stream to print to, defaults to stderr
+    """
+    file = file or sys.stderr
+    width = max([len(phase) for phase, _duration in _phases] + [len('total')])
+    print("Start-up profile:", file=file)
+    for phase, duration in _phases:
+        print(f"  {phase:<{width}}  {duration * 1000:8.1f} ms", file=file)
+    print(f"  {'total':<{width}}  {(_last - _start) * 1000:8.1f} ms", file=file)
@@ -24,7 +24,7 @@ AVAILABLE_STYLES = {
 # Github is the default style applied to the markdown
 __current_style = 'github'
 __rtl = False
-__css_cache = {}
+__css_cache = {}  # Style name -> (file mtime in ns, CSS content)
 
 
 def _get_css_directory():
@@ -37,8 +37,31 @@ def _get_css_directory():
         return os.path.join(os.path.dirname(__file__), '..', 'data', 'media', 'css')
 
 
+def _get_css_file(style_name):
+    """Get the path of a style's CSS file."""
+    return os.path.join(_get_css_directory(), AVAILABLE_STYLES[style_name])
+
+
+def get_style_mtime(style_name=None):
+    """Get the modification time of a style's CSS file.
+
+    Args:
+        style_name: Name of the style, defaults to the current style
+
+    Returns:
+        Modification time in nanoseconds, or None if the file is missing
+    """
+    style_name = style_name or __current_style
+    if style_name not in AVAILABLE_STYLES:
+        return None
+    try:
+        return os.stat(_get_css_file(style_name)).st_mtime_ns
+    except OSError:
+        return None
+
+
 def _load_css_file(style_name):
-    """Load CSS content from file.
+    """Load CSS content from file, read again when the file has changed.
 
     Args:
         style_name: Name of the style to load
@@ -49,17 +72,17 @@ def _load_css_file(style_name):
     if style_name not in AVAILABLE_STYLES:
         return ''
 
-    # Check cache first
-    if style_name in __css_cache:
-        return __css_cache[style_name]
-
-    css_dir = _get_css_directory()
-    css_file = os.path.join(css_dir, AVAILABLE_STYLES[style_name])
+    # Check cache first, valid while the file is unchanged
+    mtime = get_style_mtime(style_name)
+    cached = __css_cache.get(style_name)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
 
+    css_file = _get_css_file(style_name)
     try:
         with open(css_file, encoding='utf-8') as f:
             css_content = f.read().strip()
-            __css_cache[style_name] = css_content
+            __css_cache[style_name] = (mtime, css_content)
             return css_content
     except OSError as e:
         print(f"Warning: Could not load CSS file {css_file}: {e}")
@@ -79,6 +102,11 @@ def set_style(style_name):
         print(f"Warning: Unknown style '{style_name}', keeping current style '{__current_style}'")
 
 
+def get_current_style_name():
+    """Get the name of the current CSS style."""
+    return __current_style
+
+
 def get_current_style():
     """Get the current CSS style.
 
@@ -172,23 +200,3 @@ def __getattr__(name):
         return _load_css_file(name)
     raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
 
-
-# Initialize module-level variables for all available styles
-# This provides direct attribute access for backward compatibility
-def _initialize_style_attributes():
-    """Initialize module-level variables for CSS styles."""
-    import sys
-    current_module = sys.modules[__name__]
-
-    for style_name in AVAILABLE_STYLES:
-        # Create a property-like object that loads CSS when accessed
-        def _make_css_getter(style):
-            def _get_css():
-                return _load_css_file(style)
-            return _get_css
-
-        # Set the CSS content as a module attribute
-        setattr(current_module, style_name, _load_css_file(style_name))
-
-# Initialize style attributes on module import
-_initialize_style_attributes()